@@ -2,11 +2,15 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import threading
 import subprocess
+import queue
 import sys
 import os
-from datetime import datetime, timedelta
-from openpyxl import load_workbook
-import glob
+import time
+from datetime import datetime
+from stage_worker import StageWorker, WorkerUnavailable
+from row_pipeline import PIPELINE_STAGES, STAGE_LABELS
+from job_store import JobStore, DEFAULT_JOB_DB_PATH, find_latest_excel
+from schedule_planner import plan_schedule, blackout_hours
 
 try:
     from tkcalendar import DateEntry
@@ -14,6 +18,15 @@ try:
 except ImportError:
     HAS_CALENDAR = False
 
+# 로그 표시 설정
+LOG_DRAIN_INTERVAL_MS = 100   # 큐에 쌓인 로그를 화면/파일로 옮기는 주기
+LOG_DRAIN_BATCH = 2000        # 한 번에 처리할 최대 줄 수 (나머지는 다음 주기)
+LOG_MAX_LINES = 3000          # 로그 창에 유지할 최대 줄 수
+LOG_FILE_FLUSH_SECONDS = 2    # 로그 파일 flush 주기
+
+# 행별 진행 표에 표시할 상태
+ROW_STATE_LABELS = {"waiting": "대기", "running": "진행 중", "done": "완료", "skipped": "건너뜀", "failed": "실패"}
+
 def get_base_path():
     if getattr(sys, 'frozen', False):
         if sys.platform == 'darwin':
@@ -37,13 +50,25 @@ class BlogAutomationGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("네이버 블로그 자동화 도구")
-        self.root.geometry("900x850")
+        self.root.geometry("900x1000")
         self.root.resizable(True, True)
         self.root.configure(bg='#f5f7fa')
         
         self.log_file_path = os.path.join(get_base_path(), "app_log.txt")
+        self.log_queue = queue.Queue()
+        self.row_events = queue.Queue()
+        self.log_file = None
+        self.log_file_flushed_at = 0
+        try:
+            self.log_file = open(self.log_file_path, "a", encoding="utf-8", buffering=64 * 1024)
+        except OSError:
+            pass
         self.buttons = []
         
+        # 단계 실행 워커 (모듈/모델/로그인된 브라우저를 세션 동안 유지)
+        self.worker = StageWorker(get_python_executable(), get_base_path())
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         header_frame = tk.Frame(root, bg='#667eea', height=100)
         header_frame.pack(fill=tk.X)
         header_frame.pack_propagate(False)
@@ -155,6 +180,29 @@ class BlogAutomationGUI:
         self.interval_minutes.pack(side=tk.LEFT, padx=2)
         tk.Label(row3, text="분 간격", font=("Helvetica", 11), bg='white').pack(side=tk.LEFT)
         
+        row4 = tk.Frame(self.schedule_options, bg='white')
+        row4.pack(fill=tk.X, pady=4)
+        tk.Label(row4, text="발행 제외:", font=("Helvetica", 11), bg='white', width=10, anchor='w').pack(side=tk.LEFT)
+        self.blackout_start = ttk.Combobox(row4, values=[f"{i:02d}" for i in range(24)], width=5, font=("Helvetica", 11), state="readonly")
+        self.blackout_start.set("00")
+        self.blackout_start.pack(side=tk.LEFT, padx=2)
+        tk.Label(row4, text="시 ~", font=("Helvetica", 11), bg='white').pack(side=tk.LEFT, padx=(0, 8))
+        self.blackout_end = ttk.Combobox(row4, values=[f"{i:02d}" for i in range(24)], width=5, font=("Helvetica", 11), state="readonly")
+        self.blackout_end.set("00")
+        self.blackout_end.pack(side=tk.LEFT, padx=2)
+        tk.Label(row4, text="시 (같으면 없음)", font=("Helvetica", 11), bg='white').pack(side=tk.LEFT)
+        
+        row5 = tk.Frame(self.schedule_options, bg='white')
+        row5.pack(fill=tk.X, pady=4)
+        tk.Label(row5, text="하루 최대:", font=("Helvetica", 11), bg='white', width=10, anchor='w').pack(side=tk.LEFT)
+        self.daily_cap = tk.Spinbox(row5, from_=0, to=100, width=6, font=("Helvetica", 11))
+        self.daily_cap.pack(side=tk.LEFT, padx=2)
+        tk.Label(row5, text="개 (0: 제한 없음)", font=("Helvetica", 11), bg='white').pack(side=tk.LEFT, padx=(0, 12))
+        tk.Label(row5, text="같은 카테고리 간격:", font=("Helvetica", 11), bg='white').pack(side=tk.LEFT)
+        self.category_spacing = tk.Spinbox(row5, from_=0, to=1440, increment=10, width=6, font=("Helvetica", 11))
+        self.category_spacing.pack(side=tk.LEFT, padx=2)
+        tk.Label(row5, text="분", font=("Helvetica", 11), bg='white').pack(side=tk.LEFT)
+        
         progress_card = tk.Frame(container, bg='white', relief=tk.FLAT, bd=0)
         progress_card.pack(fill=tk.X, pady=(0, 12))
         
@@ -172,6 +220,24 @@ class BlogAutomationGUI:
         self.progress_bar = ttk.Progressbar(progress_inner, mode='indeterminate', length=400, style='Modern.Horizontal.TProgressbar')
         self.progress_bar.pack(fill=tk.X)
         
+        rows_card = tk.Frame(container, bg='white', relief=tk.FLAT, bd=0)
+        rows_card.pack(fill=tk.X, pady=(0, 12))
+        
+        rows_inner = tk.Frame(rows_card, bg='white')
+        rows_inner.pack(fill=tk.X, padx=15, pady=15)
+        
+        tk.Label(rows_inner, text="행별 진행 상황 (전체 실행)", font=("Helvetica", 13, "bold"), bg='white', fg='#2d3748', anchor=tk.W).pack(fill=tk.X, pady=(0, 6))
+        
+        self.row_table = ttk.Treeview(rows_inner, columns=["row", "title"] + PIPELINE_STAGES, show="headings", height=5)
+        self.row_table.heading("row", text="행")
+        self.row_table.column("row", width=40, anchor=tk.CENTER, stretch=False)
+        self.row_table.heading("title", text="제목")
+        self.row_table.column("title", width=320)
+        for stage in PIPELINE_STAGES:
+            self.row_table.heading(stage, text=STAGE_LABELS[stage])
+            self.row_table.column(stage, width=90, anchor=tk.CENTER, stretch=False)
+        self.row_table.pack(fill=tk.X)
+        
         log_card = tk.Frame(container, bg='white', relief=tk.FLAT, bd=0)
         log_card.pack(fill=tk.BOTH, expand=True)
         
@@ -197,6 +263,22 @@ class BlogAutomationGUI:
         
         self.log("애플리케이션이 시작되었습니다.")
         self.log("버튼을 클릭하여 작업을 시작하세요.")
+        self.drain_log()
+        threading.Thread(target=self.start_worker, daemon=True).start()
+    
+    def start_worker(self):
+        try:
+            self.worker.start()
+        except WorkerUnavailable as e:
+            self.log(f"워커 실행 실패, 단계마다 새 프로세스로 실행합니다: {e}")
+    
+    def on_close(self):
+        self.worker.close()
+        self.drain_log(reschedule=False)
+        if self.log_file:
+            self.log_file.close()
+            self.log_file = None
+        self.root.destroy()
     
     def toggle_schedule_options(self):
         if self.schedule_enabled.get():
@@ -205,14 +287,66 @@ class BlogAutomationGUI:
             self.schedule_options.pack_forget()
     
     def log(self, message):
+        """로그 추가 (어느 스레드에서든 호출 가능, 화면/파일 반영은 drain_log에서)"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        self.log_queue.put(f"[{timestamp}] {message}\n")
+    
+    def drain_log(self, reschedule=True):
+        """메인 루프 타이머: 큐에 쌓인 로그를 한 번에 로그 창과 파일에 반영"""
+        lines = []
         try:
-            with open(self.log_file_path, "a", encoding="utf-8") as f:
-                f.write(f"[{timestamp}] {message}\n")
-        except:
+            while len(lines) < LOG_DRAIN_BATCH or not reschedule:
+                lines.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        if lines:
+            text = "".join(lines)
+            self.log_text.insert(tk.END, text)
+            # 최근 LOG_MAX_LINES줄만 유지 (마지막 빈 줄 포함)
+            line_count = int(self.log_text.index("end-1c").split(".")[0])
+            if line_count > LOG_MAX_LINES + 1:
+                self.log_text.delete("1.0", f"{line_count - LOG_MAX_LINES}.0")
+            self.log_text.see(tk.END)
+            
+            if self.log_file:
+                try:
+                    self.log_file.write(text)
+                except OSError:
+                    pass
+        
+        now = time.time()
+        if self.log_file and (not reschedule or now - self.log_file_flushed_at >= LOG_FILE_FLUSH_SECONDS):
+            try:
+                self.log_file.flush()
+            except OSError:
+                pass
+            self.log_file_flushed_at = now
+        
+        self.apply_row_events()
+        
+        if reschedule:
+            self.root.after(LOG_DRAIN_INTERVAL_MS, self.drain_log)
+    
+    def on_row_event(self, event):
+        """워커의 행 상태 이벤트 수신 (작업 스레드에서 호출, 표 반영은 메인 루프에서)"""
+        if event.get("kind") == "row":
+            self.row_events.put(event)
+    
+    def apply_row_events(self):
+        try:
+            while True:
+                event = self.row_events.get_nowait()
+                if event.get("kind") == "reset":
+                    self.row_table.delete(*self.row_table.get_children())
+                    continue
+                iid = str(event["row"])
+                if not self.row_table.exists(iid):
+                    self.row_table.insert("", tk.END, iid=iid, values=[event["row"], event.get("title", "")] + [""] * len(PIPELINE_STAGES))
+                self.row_table.set(iid, event["stage"], ROW_STATE_LABELS.get(event["state"], event["state"]))
+                if event["state"] == "running":
+                    self.row_table.see(iid)
+        except queue.Empty:
             pass
     
     def copy_log(self):
@@ -226,12 +360,33 @@ class BlogAutomationGUI:
     def update_status(self, message):
         self.status_var.set(message)
         self.progress_var.set(message)
-        self.root.update_idletasks()
     
     def set_buttons_state(self, state):
         for btn in self.buttons:
             btn.config(state=state)
     
+    def log_output(self, line):
+        if line.strip():
+            self.log(line.strip())
+    
+    def run_stage(self, script_name, on_event=None):
+        """단계 스크립트를 워커에서 실행 (워커를 쓸 수 없으면 새 프로세스로 실행), 성공 여부 반환"""
+        try:
+            return self.worker.run(script_name, self.log_output, on_event)
+        except WorkerUnavailable as e:
+            self.log(f"워커 사용 불가, 새 프로세스로 실행: {e}")
+        
+        base_path = get_base_path()
+        script_path = os.path.join(base_path, script_name)
+        if not os.path.exists(script_path):
+            script_path = script_name
+        
+        process = subprocess.Popen([get_python_executable(), script_path], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, universal_newlines=True, cwd=base_path)
+        for line in process.stdout:
+            self.log_output(line)
+        process.wait()
+        return process.returncode == 0
+    
     def run_script(self, script_name, description):
         def run():
             try:
@@ -239,20 +394,7 @@ class BlogAutomationGUI:
                 self.progress_bar.start(10)
                 self.log(f"{description} 시작")
                 
-                base_path = get_base_path()
-                script_path = os.path.join(base_path, script_name)
-                if not os.path.exists(script_path):
-                    script_path = script_name
-                
-                process = subprocess.Popen([get_python_executable(), script_path], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, universal_newlines=True, cwd=base_path)
-                
-                for line in process.stdout:
-                    if line.strip():
-                        self.log(line.strip())
-                
-                process.wait()
-                
-                if process.returncode == 0:
+                if self.run_stage(script_name):
                     self.update_status(f"{description} 완료")
                     self.log(f"{description} 완료!")
                     messagebox.showinfo("완료", f"{description}가 완료되었습니다.")
@@ -283,21 +425,22 @@ class BlogAutomationGUI:
     def create_word_doc(self):
         self.run_script("create_word.py", "워드+이미지 생성")
     
-    def update_excel_schedule(self):
+    def update_excel_schedule(self, require_content=True):
+        """예약 시간 기록 (require_content=False면 본문 생성 전이라도 제목이 있는 행에 배정)"""
         if not self.schedule_enabled.get():
             return True
+        store = None
         try:
             base_path = get_base_path()
-            files = glob.glob(os.path.join(base_path, "blog*.xlsx"))
-            if not files:
+            try:
+                excel_file = find_latest_excel(base_path)
+            except FileNotFoundError:
                 self.log("엑셀 파일 없음")
                 return False
             
-            excel_file = max(files, key=os.path.getmtime)
             self.log(f"예약 설정: {os.path.basename(excel_file)}")
-            
-            wb = load_workbook(excel_file)
-            ws = wb.active
+            store = JobStore(os.path.join(base_path, DEFAULT_JOB_DB_PATH))
+            batch = store.sync_excel(excel_file)
             
             if HAS_CALENDAR:
                 start_date_obj = self.start_date.get_date()
@@ -305,23 +448,36 @@ class BlogAutomationGUI:
                 start_date_obj = datetime.strptime(self.start_date.get(), "%Y-%m-%d").date()
             
             start_datetime = datetime.combine(start_date_obj, datetime.strptime(f"{self.start_hour.get()}:{self.start_minute.get()}", "%H:%M").time())
-            interval = int(self.interval_minutes.get())
             
-            count = 0
-            for row in range(2, ws.max_row + 1):
-                if ws[f'A{row}'].value and ws[f'B{row}'].value:
-                    t = start_datetime + timedelta(minutes=interval * count)
-                    ws[f'D{row}'] = t.strftime("%Y-%m-%d %H:%M")
-                    self.log(f"  {row}행: {t.strftime('%H:%M')}")
-                    count += 1
+            # 이미 업로드한 글과 다른 배치의 예약 글은 장부로 두고, 나머지 글의 시간표를 한 번에 계산
+            account = os.getenv("NAVER_ID") or "default"
+            pending = [dict(post, account=account) for post in store.get_posts(batch, require_content=require_content)
+                       if post['status'].get('upload') != 'done']
+            pending_ids = {post['id'] for post in pending}
+            ledger = [(account, post['schedule_time'], post['category']) for post in store.get_scheduled()
+                      if post['id'] not in pending_ids and (post['uploaded'] or post['batch'] != batch)]
+            
+            timetable = plan_schedule(
+                pending, ledger, start_datetime,
+                interval_minutes=int(self.interval_minutes.get()),
+                category_spacing_minutes=int(self.category_spacing.get()),
+                blocked_hours=blackout_hours(int(self.blackout_start.get()), int(self.blackout_end.get())),
+                daily_cap=int(self.daily_cap.get())
+            )
+            store.set_schedules(timetable)
+            count = len(timetable)
+            if timetable:
+                self.log(f"  예약 장부 {len(ledger)}개 반영, {min(timetable.values()):%m-%d %H:%M} ~ {max(timetable.values()):%m-%d %H:%M}")
             
-            wb.save(excel_file)
-            wb.close()
+            store.export_excel(batch)
             self.log(f"{count}개 글 예약 완료")
             return True
         except Exception as e:
             self.log(f"예약 오류: {e}")
             return False
+        finally:
+            if store:
+                store.close()
     
     def upload_blog(self):
         if self.schedule_enabled.get() and not self.update_excel_schedule():
@@ -333,37 +489,23 @@ class BlogAutomationGUI:
         def run_all_scripts():
             try:
                 self.progress_bar.start(10)
-                base_path = get_base_path()
                 
-                for script, desc in [("excel_create.py", "엑셀 생성"), ("create.py", "본문 생성")]:
-                    self.update_status(f"{desc} 중...")
-                    self.log(f"=== {desc} ===")
-                    script_path = os.path.join(base_path, script)
-                    if not os.path.exists(script_path):
-                        script_path = script
-                    process = subprocess.Popen([get_python_executable(), script_path], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, universal_newlines=True, cwd=base_path)
-                    for line in process.stdout:
-                        if line.strip():
-                            self.log(line.strip())
-                    process.wait()
-                    if process.returncode != 0:
-                        raise Exception(f"{desc} 실패")
+                self.update_status("엑셀 생성 중...")
+                self.log("=== 엑셀 생성 ===")
+                if not self.run_stage("excel_create.py"):
+                    raise Exception("엑셀 생성 실패")
                 
+                # 행마다 바로 업로드까지 진행하므로 예약 시간은 본문 생성 전에 배정
                 if self.schedule_enabled.get():
                     self.log("=== 예약 설정 ===")
-                    if not self.update_excel_schedule():
+                    if not self.update_excel_schedule(require_content=False):
                         raise Exception("예약 실패")
                 
-                self.update_status("업로드 중...")
-                self.log("=== 업로드 ===")
-                script_path = os.path.join(base_path, "upload_bot.py")
-                process = subprocess.Popen([get_python_executable(), script_path], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, universal_newlines=True, cwd=base_path)
-                for line in process.stdout:
-                    if line.strip():
-                        self.log(line.strip())
-                process.wait()
-                if process.returncode != 0:
-                    raise Exception("업로드 실패")
+                self.update_status("본문 생성 → 워드+이미지 → 업로드 진행 중...")
+                self.log("=== 행별 파이프라인 ===")
+                self.row_events.put({"kind": "reset"})
+                if not self.run_stage("row_pipeline.py", self.on_row_event):
+                    raise Exception("파이프라인 실패")
                 
                 self.update_status("완료!")
                 self.log("모든 작업 완료!")
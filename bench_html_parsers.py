@@ -0,0 +1,149 @@
+"""
+트렌드 수집 HTML 파서 벤치마크
+
+저장해 둔 페이지(fixtures/trend_pages/*.html)를 백엔드별로 파싱하고
+trend_analyzer가 쓰는 셀렉터로 텍스트를 추출하는 시간을 비교합니다.
+벤치마크 전에 모든 백엔드의 추출 결과가 같은지 먼저 확인합니다
+(결과가 같아야 백엔드를 바꿔도 수집 결과가 달라지지 않음).
+
+저장소의 fixture는 각 페이지에서 셀렉터가 읽는 부분만 남긴 작은 페이지입니다.
+
+사용법:
+    python bench_html_parsers.py               # 저장된 fixture로 결과 비교 + 벤치마크
+    python bench_html_parsers.py --check       # 결과 비교만 (다르면 종료 코드 1)
+    python bench_html_parsers.py --save --dir 다른/폴더   # 현재 트렌드/뉴스 페이지를 fixture로 저장
+    python bench_html_parsers.py --repeat 50 --dir 다른/폴더
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+from html_select import available_backends, select_texts, select_child_texts
+
+DEFAULT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "trend_pages")
+
+# fixture 파일명 → (URL, 추출 함수)
+PAGES = {
+    "naver_main.html": ("https://www.naver.com/",
+                        lambda html, b: select_child_texts(html, '.ah_roll_area .ah_item, .ah_list .ah_item', '.ah_k', backend=b)),
+    "signal.html": ("https://www.signal.bz/news",
+                    lambda html, b: select_texts(html, '.rank-text, .news-title, h3 a', backend=b)),
+    "zum.html": ("https://zum.com/",
+                 lambda html, b: select_texts(html, '.issue_keyword a, .keyword_item', backend=b)),
+    "news_economy.html": ("https://news.naver.com/section/economy",
+                          lambda html, b: select_texts(html, '.sa_text_title, .cluster_text_headline', limit=5, min_length=11, backend=b)),
+}
+
+
+def save_fixtures(directory: str):
+    """PAGES의 URL을 내려받아 fixture로 저장"""
+    import requests
+
+    os.makedirs(directory, exist_ok=True)
+    headers = {"User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"}
+    for filename, (url, _) in PAGES.items():
+        try:
+            response = requests.get(url, headers=headers, timeout=10)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"  ✗ {url}: {e}")
+            continue
+        with open(os.path.join(directory, filename), 'w', encoding='utf-8') as f:
+            f.write(response.text)
+        print(f"  ✓ {filename} ({len(response.text) / 1024:.0f}KB)")
+
+
+def load_fixtures(directory: str):
+    fixtures = []
+    for filename in sorted(os.listdir(directory)) if os.path.isdir(directory) else []:
+        if filename.endswith('.html'):
+            with open(os.path.join(directory, filename), 'r', encoding='utf-8') as f:
+                fixtures.append((filename, f.read()))
+    return fixtures
+
+
+def check_parity(fixtures, backends) -> bool:
+    """fixture마다 모든 백엔드의 추출 결과가 같은지 확인 (다르면 차이를 출력)"""
+    same = True
+    for filename, html in fixtures:
+        extract = PAGES.get(filename, (None, lambda h, b: select_texts(h, 'a', backend=b)))[1]
+        outputs = {backend: extract(html, backend) for backend in backends}
+        reference = backends[0]
+        for backend in backends[1:]:
+            if outputs[backend] != outputs[reference]:
+                same = False
+                print(f"  ✗ {filename}: {reference}와 {backend} 결과가 다릅니다")
+                print(f"      {reference}: {outputs[reference]}")
+                print(f"      {backend}: {outputs[backend]}")
+        if all(outputs[backend] == outputs[reference] for backend in backends):
+            print(f"  ✓ {filename}: {len(outputs[reference])}개 일치")
+    return same
+
+
+def run_benchmark(fixtures, backends, repeat: int):
+    """백엔드별 fixture 1회 파싱+추출 시간 (중앙값, ms)"""
+    results = {}
+    for filename, html in fixtures:
+        extract = PAGES.get(filename, (None, lambda h, b: select_texts(h, 'a', backend=b)))[1]
+        for backend in backends:
+            extract(html, backend)  # 워밍업
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                extract(html, backend)
+                timings.append((time.perf_counter() - start) * 1000)
+            results[(filename, backend)] = statistics.median(timings)
+    return results
+
+
+def print_results(fixtures, backends, results):
+    name_width = max(len(name) for name, _ in fixtures)
+    print(f"\n{'fixture'.ljust(name_width)}  " + "  ".join(f"{b:>11}" for b in backends))
+    for filename, html in fixtures:
+        row = "  ".join(f"{results[(filename, b)]:>9.2f}ms" for b in backends)
+        print(f"{filename.ljust(name_width)}  {row}   ({len(html) / 1024:.0f}KB)")
+
+    totals = {b: sum(results[(f, b)] for f, _ in fixtures) for b in backends}
+    print(f"{'합계'.ljust(name_width)}  " + "  ".join(f"{totals[b]:>9.2f}ms" for b in backends))
+    fastest = min(totals, key=totals.get)
+    print(f"\n가장 빠른 백엔드: {fastest}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="트렌드 수집 HTML 파서 벤치마크")
+    parser.add_argument("--dir", default=DEFAULT_DIR, help="fixture 폴더")
+    parser.add_argument("--repeat", type=int, default=20, help="fixture별 반복 횟수")
+    parser.add_argument("--save", action="store_true", help="트렌드 페이지를 fixture로 저장")
+    parser.add_argument("--check", action="store_true", help="백엔드별 추출 결과 비교만 실행")
+    args = parser.parse_args()
+
+    if args.save:
+        print(f"fixture 저장: {args.dir}")
+        save_fixtures(args.dir)
+        return
+
+    backends = available_backends()
+    if not backends:
+        print("설치된 파서가 없습니다 (selectolax, lxml+cssselect, beautifulsoup4)")
+        sys.exit(1)
+
+    fixtures = load_fixtures(args.dir)
+    if not fixtures:
+        print(f"fixture가 없습니다: {args.dir}\n먼저 python bench_html_parsers.py --save 를 실행하세요")
+        sys.exit(1)
+
+    print(f"추출 결과 비교: {', '.join(backends)}")
+    if not check_parity(fixtures, backends):
+        print("\n백엔드마다 추출 결과가 다릅니다")
+        sys.exit(1)
+    if args.check:
+        return
+
+    print(f"\n백엔드: {', '.join(backends)} / fixture {len(fixtures)}개 / 반복 {args.repeat}회")
+    print_results(fixtures, backends, run_benchmark(fixtures, backends, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,451 @@
+"""
+네이버 블로그 공통 크롤링 엔진
+
+포스트를 한 번만 불러오고(HTTP 우선, 실패 시 Chrome), 불러온 페이지에
+등록된 추출기(content, structure, style_features, html_components, styles)를 모두 실행합니다.
+결과 레코드는 크롤링 캐시에 'page' 종류로 저장되므로, NaverBlogCrawler /
+BlogPostAnalyzer / BlogStyleExtractor가 같은 포스트를 다시 불러오지 않습니다.
+"""
+
+import json
+import time
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from crawl_cache import CrawlCache, parse_post_url
+from naver_blog_http import (
+    NaverBlogHttpFetcher, CONTENT_SELECTORS, TITLE_SELECTORS,
+    element_styles, image_src, select_first
+)
+from dom_probe import (
+    COUNT_SELECTORS, probe_dom, structure_from_counts, count_components,
+    aggregate_style_features, aggregate_styles
+)
+from driver_pool import DriverPool, PooledDriverMixin, create_chrome_driver
+
+CACHE_KIND = 'page'
+
+# 포스트 링크 셀렉터 (블로그 메인 mainFrame 기준, 스킨별로 다름)
+POST_LINK_SELECTORS = [
+    "a.link_title",
+    "a.pcol1",
+    "div.post_title a",
+    "div.post-item a",
+    "div.blog_list a.tit"
+]
+
+# 카테고리 셀렉터
+CATEGORY_SELECTORS = [
+    "div.category_title",
+    "a.category_item",
+    "div.cate_item",
+    "ul.cate_list a",
+    "div.category_box a"
+]
+
+# 정적 HTML에서는 볼드/이탤릭 등이 태그로만 드러나므로 스타일 수집 시 인라인 태그도 포함
+STATIC_INLINE_TAGS = "b, strong, i, em, u, s"
+
+# 제목/본문/이미지를 한 번에 읽는 스크립트 (본문 요소도 함께 반환)
+PAGE_SCRIPT = """
+const titleSelectors = arguments[0];
+const contentSelectors = arguments[1];
+
+function first(selectors) {
+    for (const s of selectors) {
+        const el = document.querySelector(s);
+        if (el) return el;
+    }
+    return null;
+}
+
+const titleEl = first(titleSelectors);
+const container = first(contentSelectors);
+const images = container
+    ? Array.from(container.querySelectorAll('img.se-image-resource'))
+        .map(img => img.getAttribute('data-lazy-src') || img.getAttribute('src'))
+        .filter(src => src)
+    : [];
+
+return [container, JSON.stringify({
+    title: titleEl ? titleEl.innerText.trim() : '',
+    text: container ? container.innerText : (document.body ? document.body.innerText : ''),
+    html: container ? container.innerHTML : document.documentElement.outerHTML,
+    images: images
+})];
+"""
+
+
+class HttpPost:
+    """정적 HTML로 불러온 포스트"""
+
+    fetch_mode = 'http'
+
+    def __init__(self, url: str, soup, container):
+        self.url = url
+        self.soup = soup
+        self.container = container
+        title_elem = select_first(soup, TITLE_SELECTORS)
+        self.title = title_elem.get_text(strip=True) if title_elem else ''
+        self.text = container.get_text('\n', strip=True)
+        self.html = container.decode_contents()
+        self.images = [src for src in (image_src(img) for img in container.select("img.se-image-resource")) if src]
+
+    def styles(self, selector: str, limit: int) -> List[Dict]:
+        """selector 요소들의 스타일 (인라인 스타일 + 스마트에디터 클래스 추정)"""
+        elements = self.container.select(f"{selector}, {STATIC_INLINE_TAGS}")
+        return [element_styles(elem) for elem in elements[:limit]]
+
+    def counts(self) -> Dict[str, int]:
+        return {key: len(self.container.select(sel)) for key, sel in COUNT_SELECTORS.items()}
+
+    def component_classes(self) -> List[str]:
+        return [' '.join(comp.get('class', [])) for comp in self.container.select("[class*='se-component']")]
+
+    def first_paragraph_align(self) -> Optional[str]:
+        paragraph = self.container.select_one(".se-text-paragraph")
+        return element_styles(paragraph).get('text-align') if paragraph else None
+
+
+class BrowserPost:
+    """Chrome으로 불러온 포스트 (mainFrame 내부에서 생성)"""
+
+    fetch_mode = 'browser'
+
+    def __init__(self, url: str, driver):
+        self.url = url
+        self.driver = driver
+        self.container, payload = driver.execute_script(PAGE_SCRIPT, TITLE_SELECTORS, CONTENT_SELECTORS)
+        data = json.loads(payload)
+        self.title = data['title']
+        self.text = data['text']
+        self.html = data['html']
+        self.images = data['images']
+        self._probes = {}
+
+    def _probe(self, selector: str = "p", limit: int = 0) -> Dict:
+        """probe_dom 결과 (같은 셀렉터/개수는 한 번만 실행)"""
+        key = (selector, limit)
+        if key not in self._probes:
+            self._probes[key] = probe_dom(self.driver, root=self.container,
+                                          style_selector=selector, limit=limit)
+        return self._probes[key]
+
+    def _any_probe(self) -> Dict:
+        # 개수/컴포넌트는 셀렉터와 무관하므로 이미 실행한 결과 재사용
+        return next(iter(self._probes.values())) if self._probes else self._probe()
+
+    def styles(self, selector: str, limit: int) -> List[Dict]:
+        """selector 요소들의 computed style"""
+        return self._probe(selector, limit)['styles']
+
+    def counts(self) -> Dict[str, int]:
+        return self._any_probe()['counts']
+
+    def component_classes(self) -> List[str]:
+        return self._any_probe()['components']
+
+    def first_paragraph_align(self) -> Optional[str]:
+        return self._any_probe()['first_paragraph_align']
+
+
+# ==================== 추출기 ====================
+
+def extract_content(post) -> Dict:
+    """본문 텍스트/HTML/이미지"""
+    return {'text': post.text, 'html': post.html, 'images': post.images}
+
+
+def extract_structure(post) -> Dict:
+    """제목/강조/목록 등 구조 (NaverBlogCrawler structure 형식)"""
+    return structure_from_counts(post.counts(), post.first_paragraph_align())
+
+
+def extract_html_components(post) -> Dict:
+    """스마트에디터 컴포넌트 통계 (BlogPostAnalyzer html_structure 형식)"""
+    return count_components(post.component_classes())
+
+
+def extract_style_features(post) -> Dict:
+    """처음 50개 텍스트 요소의 스타일 특징 (BlogPostAnalyzer style_features 형식)"""
+    return aggregate_style_features(post.styles("[class*='se-text'], p, span, div", 50))
+
+
+def extract_styles(post) -> Dict:
+    """처음 100개 요소의 스타일 분석 (BlogStyleExtractor style_analysis 형식)"""
+    return aggregate_styles(
+        post.styles("p, span, div, h1, h2, h3, h4, h5, h6", 100),
+        image_count=post.counts().get('image', 0),
+        component_classes=post.component_classes()
+    )
+
+
+EXTRACTORS: Dict[str, Callable] = {
+    'content': extract_content,
+    'structure': extract_structure,
+    'html_components': extract_html_components,
+    'style_features': extract_style_features,
+    'styles': extract_styles
+}
+
+
+def register_extractor(name: str, func: Callable):
+    """
+    추출기 등록
+
+    Args:
+        name: 레코드에 저장될 키
+        func: HttpPost/BrowserPost를 받아 JSON 직렬화 가능한 값을 반환하는 함수
+    """
+    EXTRACTORS[name] = func
+
+
+class BlogCrawlEngine(PooledDriverMixin):
+    """포스트를 한 번 불러와 여러 추출기를 실행하는 크롤링 엔진"""
+
+    def __init__(self, headless: bool = False, use_cache: bool = True, use_http: bool = True,
+                 driver_pool: Optional[DriverPool] = None, extractors: Optional[Iterable[str]] = None,
+                 request_interval: float = 2):
+        """
+        Args:
+            headless: 헤드리스 모드 실행 여부
+            use_cache: 이미 불러온 포스트는 크롤링 캐시에서 읽기
+            use_http: 공개 포스트는 브라우저 없이 HTTP로 수집 (실패 시 Chrome 사용)
+            driver_pool: 공유 WebDriver 풀 (병렬 크롤링 시 필요)
+            extractors: 실행할 추출기 이름 목록 (None이면 등록된 전체)
+            request_interval: 브라우저로 불러온 뒤 대기 시간 (초)
+        """
+        self.headless = headless
+        self.driver_pool = driver_pool
+        self.driver = None
+        self.cache = CrawlCache() if use_cache else None
+        self.http = NaverBlogHttpFetcher() if use_http else None
+        self.extractors = list(extractors) if extractors else list(EXTRACTORS)
+        self.request_interval = request_interval
+        self._memo: Dict[str, Dict] = {}
+        self._memo_lock = threading.Lock()
+
+    def init_driver(self):
+        """WebDriver 초기화"""
+        if self.acquire_pooled_driver():
+            return
+
+        self.driver = create_chrome_driver(self.headless)
+        print("✅ WebDriver 초기화 완료")
+
+    def close_driver(self):
+        """WebDriver 종료 (풀 사용 시 반납)"""
+        if self.driver_pool:
+            if self.driver:
+                self.driver_pool.release(self.driver)
+                self.driver = None
+        elif self.driver:
+            self.driver.quit()
+            self.driver = None
+            print("✅ WebDriver 종료")
+
+    def _open_main_frame(self, url: str, wait_selector: str = None, timeout: int = 10) -> bool:
+        """페이지를 열고 mainFrame으로 전환 (iframe이 없으면 문서 그대로 사용)"""
+        if not self.driver:
+            self.init_driver()
+
+        self.driver.get(url)
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.frame_to_be_available_and_switch_to_it("mainFrame")
+            )
+            in_frame = True
+        except Exception:
+            in_frame = False
+
+        if wait_selector:
+            try:
+                WebDriverWait(self.driver, timeout).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, wait_selector))
+                )
+            except Exception:
+                pass
+        return in_frame
+
+    # ==================== 블로그 메인 ====================
+
+    def discover_blog(self, blog_id: str, max_posts: int = 10) -> Dict:
+        """
+        블로그 메인을 Chrome으로 한 번 열어 포스트 URL과 카테고리 수집
+
+        Returns:
+            {'post_urls': [...], 'categories': [{'name', 'url'}, ...]}
+        """
+        result = {'post_urls': [], 'categories': []}
+
+        try:
+            self._open_main_frame(f"https://blog.naver.com/{blog_id}",
+                                  wait_selector=", ".join(POST_LINK_SELECTORS))
+            result['post_urls'] = self._find_post_urls(max_posts)
+            result['categories'] = self._find_categories()
+        except Exception as e:
+            print(f"⚠️ 블로그 메인 수집 실패: {e}")
+        finally:
+            if self.driver:
+                self.driver.switch_to.default_content()
+
+        return result
+
+    def _find_post_urls(self, max_posts: int) -> List[str]:
+        if max_posts <= 0:
+            return []
+        for selector in POST_LINK_SELECTORS:
+            post_urls = []
+            for link in self.driver.find_elements(By.CSS_SELECTOR, selector):
+                url = link.get_attribute('href')
+                if url and parse_post_url(url)['log_no'] and url not in post_urls:
+                    post_urls.append(url)
+                if len(post_urls) >= max_posts:
+                    break
+            if post_urls:
+                return post_urls
+        return []
+
+    def _find_categories(self) -> List[Dict]:
+        for selector in CATEGORY_SELECTORS:
+            categories = []
+            for elem in self.driver.find_elements(By.CSS_SELECTOR, selector)[:20]:  # 최대 20개
+                try:
+                    name = elem.text.strip()
+                    if name:
+                        categories.append({'name': name, 'url': elem.get_attribute('href')})
+                except Exception:
+                    continue
+            if categories:
+                return categories
+        return []
+
+    def discover_posts(self, blog_id: str, max_posts: int = 10, since_log_no: int = None) -> List[Dict]:
+        """
+        블로그의 최근 포스트 목록 (RSS/글 목록 API 우선, 실패 시 Chrome으로 블로그 메인 확인)
+
+        Args:
+            blog_id: 블로그 ID
+            max_posts: 최대 포스트 개수
+            since_log_no: 이 logNo 이하(이미 수집한 포스트)는 제외
+
+        Returns:
+            [{'url', 'log_no', 'title', 'published_at', 'category'}, ...] (최신순)
+            Chrome으로 찾은 경우 url/log_no 외 값은 비어 있음
+        """
+        entries = self.http.discover_posts(blog_id, max_posts, since_log_no) if self.http else []
+
+        if not entries:
+            for url in self.discover_blog(blog_id, max_posts)['post_urls']:
+                log_no = parse_post_url(url)['log_no']
+                if since_log_no is not None and int(log_no) <= since_log_no:
+                    continue
+                entries.append({'url': url, 'log_no': log_no, 'title': '', 'published_at': None, 'category': ''})
+
+        print(f"📝 {len(entries)}개의 포스트 URL 수집됨")
+        return entries
+
+    def get_post_urls(self, blog_id: str, max_posts: int = 10) -> List[str]:
+        """블로그의 최근 포스트 URL 목록"""
+        return [entry['url'] for entry in self.discover_posts(blog_id, max_posts)]
+
+    def latest_log_no(self, blog_id: str) -> Optional[int]:
+        """캐시에 있는 블로그의 마지막 포스트 logNo (증분 크롤링 기준)"""
+        return self.cache.latest_log_no(blog_id, CACHE_KIND) if self.cache else None
+
+    def get_categories(self, blog_id: str) -> List[Dict]:
+        """블로그 카테고리 목록 (캐시 24시간)"""
+        categories = self.cache.get_blog_meta(blog_id, 'categories') if self.cache else None
+        if categories is None:
+            categories = self.discover_blog(blog_id, max_posts=0)['categories']
+            if self.cache and categories:
+                self.cache.put_blog_meta(blog_id, 'categories', categories)
+        print(f"📂 {len(categories)}개의 카테고리 발견")
+        return categories
+
+    # ==================== 포스트 ====================
+
+    def fetch_post(self, post_url: str, blog_id: str = None) -> Dict:
+        """
+        포스트를 불러와 추출기 실행 (캐시/메모리에 있으면 재사용)
+
+        Args:
+            post_url: 포스트 URL
+            blog_id: 캐시에 기록할 블로그 ID (없으면 URL에서 추출)
+
+        Returns:
+            {'url', 'title', 'fetch_mode', 'fetched_at', <추출기 이름>: 결과, ...}
+            title이 비어 있으면 추출 실패
+
+        캐시된 기록에 없는 추출기만 실행해 기존 기록에 합쳐 저장하므로,
+        다른 도구(크롤러/분석기)가 등록한 추출기 결과는 그대로 남습니다.
+        """
+        key = parse_post_url(post_url)['log_no'] or post_url
+
+        with self._memo_lock:
+            record = self._memo.get(key)
+        if record is None and self.cache:
+            record = self.cache.get(post_url, CACHE_KIND)
+        missing = [name for name in self.extractors if not record or name not in record]
+        if not missing:
+            return record
+
+        fresh = self._load_post(post_url, missing)
+        if not fresh['title']:
+            return fresh
+        if record:
+            # 저장 직전 기록을 다시 읽어 그 사이 다른 도구가 저장한 결과도 유지
+            latest = self.cache.get(post_url, CACHE_KIND) if self.cache else None
+            record = dict(latest or record)
+            record.update((name, fresh[name]) for name in missing)
+        else:
+            record = fresh
+        with self._memo_lock:
+            self._memo[key] = record
+        if self.cache:
+            self.cache.put(post_url, CACHE_KIND, record, blog_id=blog_id)
+        return record
+
+    def _load_post(self, post_url: str, extractors: List[str] = None) -> Dict:
+        # 공개 포스트는 정적 HTML로 먼저 시도
+        if self.http:
+            fetched = self.http.fetch_post(post_url)
+            if fetched:
+                return self._run_extractors(HttpPost(post_url, *fetched), extractors)
+
+        try:
+            self._open_main_frame(post_url, wait_selector=", ".join(CONTENT_SELECTORS))
+            record = self._run_extractors(BrowserPost(post_url, self.driver), extractors)
+        except Exception as e:
+            print(f"⚠️ 포스트 불러오기 실패: {e}")
+            record = self._empty_record(post_url, 'browser')
+        finally:
+            if self.driver:
+                self.driver.switch_to.default_content()
+
+        time.sleep(self.request_interval)  # 요청 간격 (브라우저 수집 시)
+        return record
+
+    def _empty_record(self, post_url: str, fetch_mode: str) -> Dict:
+        return {
+            'url': post_url,
+            'title': '',
+            'fetch_mode': fetch_mode,
+            'fetched_at': datetime.now().isoformat()
+        }
+
+    def _run_extractors(self, post, extractors: List[str] = None) -> Dict:
+        """extractors(없으면 등록된 추출기 전체) 실행"""
+        record = self._empty_record(post.url, post.fetch_mode)
+        record['title'] = post.title
+
+        for name in extractors or self.extractors:
+            try:
+                record[name] = EXTRACTORS[name](post)
+            except Exception as e:
+                print(f"⚠️ {name} 추출 중 오류: {e}")
+                record[name] = None
+        return record
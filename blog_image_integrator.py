@@ -22,9 +22,10 @@ class BlogImageIntegrator:
         """
         Args:
             gemini_api_key: Gemini API 키
-            index_file: 이미지 인덱스 파일 경로
+            index_file: 이미지 인덱스 파일 경로 (.json 또는 .db)
         """
         self.indexer = GDriveImageIndexer(gemini_api_key)
+        self.indexer.index_file = index_file
         self.index_file = index_file
         self.index_data = None
 
@@ -123,6 +124,76 @@ class BlogImageIntegrator:
 
         return suggestions
 
+    def plan_image_placements(self, blog_text: str, images_per_section: int = 1,
+                              min_section_length: int = 20) -> Dict:
+        """
+        글 전체의 섹션-이미지 배치 계획을 한 번에 생성
+
+        인덱스를 한 번만 순회해 (이미지 x 키워드) 점수를 계산하고 섹션별로 합산한 뒤,
+        점수가 높은 쌍부터 배정해 같은 이미지가 여러 섹션에 쓰이지 않도록 합니다.
+
+        Args:
+            blog_text: 블로그 전체 텍스트
+            images_per_section: 섹션당 배치할 최대 이미지 수
+            min_section_length: 이보다 짧은 섹션은 건너뛰기
+
+        Returns:
+            섹션별 이미지 배치 계획
+        """
+        if not self.index_data:
+            self.load_index()
+
+        sections = blog_text.split('\n\n')
+        targets = [
+            (i, section, self._extract_keywords(section))
+            for i, section in enumerate(sections)
+            if len(section.strip()) >= min_section_length
+        ]
+        keywords = list(dict.fromkeys(kw for _, _, kws in targets for kw in kws))
+
+        # 점수 행렬: candidates[c]의 섹션별 점수 = scores[c][s]
+        candidates = []
+        scores = []
+        for img in self.index_data.get('images', []):
+            if img.get('duplicate_of'):
+                continue
+            keyword_scores = {kw: self.indexer.score_image(img, kw) for kw in keywords}
+            if not any(keyword_scores.values()):
+                continue
+            candidates.append(img)
+            scores.append([sum(keyword_scores[kw] for kw in kws) for _, _, kws in targets])
+
+        # 점수 내림차순 그리디 배정 (이미지는 한 번만 사용)
+        pairs = sorted(
+            ((row[s], s, c) for c, row in enumerate(scores) for s in range(len(targets)) if row[s] > 0),
+            key=lambda x: x[0],
+            reverse=True
+        )
+        assigned = [[] for _ in targets]
+        used = set()
+        for score, s, c in pairs:
+            if c in used or len(assigned[s]) >= images_per_section:
+                continue
+            assigned[s].append({**candidates[c], 'relevance_score': score})
+            used.add(c)
+
+        plan = {
+            'total_sections': len(sections),
+            'placements': [],
+            'unassigned_sections': []
+        }
+        for (i, section, _), images in zip(targets, assigned):
+            if images:
+                plan['placements'].append({
+                    'section_index': i,
+                    'section_text': section[:100] + '...',
+                    'images': images
+                })
+            else:
+                plan['unassigned_sections'].append(i)
+
+        return plan
+
     def insert_image_to_naver_blog(self, driver: webdriver, image_url: str, position: str = "end"):
         """
         네이버 블로그 에디터에 이미지 삽입
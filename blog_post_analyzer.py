@@ -7,30 +7,31 @@
 
 import os
 import json
-import time
 from datetime import datetime
-from typing import Dict, List, Optional
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from typing import Dict, Iterable, List, Optional
 import google.generativeai as genai
+from blog_crawl_engine import BlogCrawlEngine
+from dom_probe import count_components, aggregate_style_features
+from driver_pool import DriverPool, run_parallel
+from style_profile import StyleProfileAggregator
 
 
 class BlogPostAnalyzer:
     """네이버 블로그 포스트 분석기"""
 
-    def __init__(self, gemini_api_key: str, headless: bool = False):
+    def __init__(self, gemini_api_key: str, headless: bool = False, use_cache: bool = True, use_http: bool = True,
+                 driver_pool: Optional[DriverPool] = None, engine: Optional[BlogCrawlEngine] = None):
         """
         Args:
             gemini_api_key: Gemini API 키
             headless: 헤드리스 모드 실행 여부
+            use_cache: 이미 분석한 포스트/카테고리는 크롤링 캐시에서 읽기
+            use_http: 공개 포스트는 브라우저 없이 HTTP로 분석 (실패 시 Chrome 사용)
+            driver_pool: 공유 WebDriver 풀 (병렬 분석 시 필요)
+            engine: 다른 도구와 공유할 크롤링 엔진 (None이면 새로 생성)
         """
         self.gemini_api_key = gemini_api_key
-        self.headless = headless
-        self.driver = None
+        self.engine = engine or BlogCrawlEngine(headless, use_cache, use_http, driver_pool)
 
         # Gemini 설정
         genai.configure(api_key=self.gemini_api_key)
@@ -38,304 +39,46 @@ class BlogPostAnalyzer:
 
     def init_driver(self):
         """WebDriver 초기화"""
-        options = Options()
-        if self.headless:
-            options.add_argument('--headless')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-
-        self.driver = webdriver.Chrome(options=options)
-        print("✅ WebDriver 초기화 완료")
+        self.engine.init_driver()
 
     def close_driver(self):
-        """WebDriver 종료"""
-        if self.driver:
-            self.driver.quit()
-            print("✅ WebDriver 종료")
+        """WebDriver 종료 (풀 사용 시 반납)"""
+        self.engine.close_driver()
 
     def get_blog_categories(self, blog_id: str) -> List[Dict]:
         """블로그 카테고리 목록 가져오기"""
-        if not self.driver:
-            self.init_driver()
-
-        blog_url = f"https://blog.naver.com/{blog_id}"
-        self.driver.get(blog_url)
-        time.sleep(3)
-
-        categories = []
-
-        try:
-            # iframe으로 전환
-            self.driver.switch_to.frame("mainFrame")
-            time.sleep(2)
-
-            # 카테고리 찾기 (여러 선택자 시도)
-            selectors = [
-                "div.category_title",
-                "a.category_item",
-                "div.cate_item",
-                "ul.cate_list a",
-                "div.category_box a"
-            ]
-
-            for selector in selectors:
-                try:
-                    category_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if category_elements:
-                        for elem in category_elements[:20]:  # 최대 20개
-                            try:
-                                name = elem.text.strip()
-                                url = elem.get_attribute('href')
-                                if name and len(name) > 0:
-                                    categories.append({
-                                        'name': name,
-                                        'url': url
-                                    })
-                            except:
-                                continue
-                        if categories:
-                            break
-                except:
-                    continue
-
-            self.driver.switch_to.default_content()
-
-        except Exception as e:
-            print(f"⚠️ 카테고리 수집 중 오류: {e}")
-            self.driver.switch_to.default_content()
-
-        print(f"📂 {len(categories)}개의 카테고리 발견")
-        return categories
+        return self.engine.get_categories(blog_id)
 
     def get_recent_post_urls(self, blog_id: str, max_posts: int = 3) -> List[str]:
         """최근 포스트 URL 가져오기"""
-        if not self.driver:
-            self.init_driver()
-
-        # 블로그 메인 페이지
-        blog_url = f"https://blog.naver.com/PostList.naver?blogId={blog_id}"
-        self.driver.get(blog_url)
-        time.sleep(3)
-
-        post_urls = []
-
-        try:
-            # iframe으로 전환
-            self.driver.switch_to.frame("mainFrame")
-            time.sleep(2)
-
-            # 여러 선택자 시도
-            selectors = [
-                "a.link_title",
-                "a.pcol1",
-                "div.post_title a",
-                "div.post-item a",
-                "div.blog_list a.tit"
-            ]
-
-            for selector in selectors:
-                try:
-                    links = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if links:
-                        for link in links[:max_posts]:
-                            url = link.get_attribute('href')
-                            if url and 'PostView' in url:
-                                post_urls.append(url)
-                        if post_urls:
-                            break
-                except:
-                    continue
-
-            self.driver.switch_to.default_content()
-
-        except Exception as e:
-            print(f"⚠️ 포스트 URL 수집 중 오류: {e}")
-            self.driver.switch_to.default_content()
-
-        # URL 중복 제거
-        post_urls = list(set(post_urls))[:max_posts]
-
-        print(f"📝 {len(post_urls)}개의 포스트 URL 수집됨")
-        return post_urls
-
-    def analyze_post_style(self, post_url: str) -> Dict:
-        """포스트의 편집 스타일 상세 분석"""
-        if not self.driver:
-            self.init_driver()
-
-        self.driver.get(post_url)
-        time.sleep(3)
+        return self.engine.get_post_urls(blog_id, max_posts)
 
-        style_data = {
+    def analyze_post_style(self, post_url: str, blog_id: str = None) -> Dict:
+        """포스트의 편집 스타일 상세 분석"""
+        record = self.engine.fetch_post(post_url, blog_id)
+        content = record.get('content') or {}
+        return {
             'url': post_url,
-            'title': '',
-            'content_preview': '',
-            'html_structure': {},
-            'style_features': {},
-            'analyzed_at': datetime.now().isoformat()
-        }
-
-        try:
-            # iframe으로 전환
-            self.driver.switch_to.frame("mainFrame")
-            time.sleep(2)
-
-            # 제목
-            try:
-                title_elem = self.driver.find_element(By.CSS_SELECTOR, "div.se-title-text, h3.se_textarea")
-                style_data['title'] = title_elem.text
-            except:
-                pass
-
-            # 본문 컨테이너
-            try:
-                content_container = self.driver.find_element(By.CSS_SELECTOR, "div.se-main-container, div.se_component_wrap")
-
-                # 전체 HTML
-                style_data['raw_html'] = content_container.get_attribute('innerHTML')[:5000]  # 처음 5000자
-
-                # 본문 텍스트
-                style_data['content_preview'] = content_container.text[:500]
-
-                # HTML 구조 분석
-                style_data['html_structure'] = self._analyze_html_structure(content_container)
-
-                # 스타일 특징 분석
-                style_data['style_features'] = self._analyze_style_features(content_container)
-
-            except Exception as e:
-                print(f"⚠️ 본문 분석 중 오류: {e}")
-
-            self.driver.switch_to.default_content()
-
-        except Exception as e:
-            print(f"⚠️ 포스트 분석 중 오류: {e}")
-            self.driver.switch_to.default_content()
-
-        return style_data
-
-    def _analyze_html_structure(self, container) -> Dict:
-        """HTML 구조 분석"""
-        structure = {
-            'total_components': 0,
-            'text_components': 0,
-            'image_components': 0,
-            'video_components': 0,
-            'link_components': 0,
-            'table_components': 0,
-            'divider_components': 0,
-            'quote_components': 0
+            'title': record['title'],
+            'content_preview': content.get('text', '')[:500],
+            'raw_html': content.get('html', '')[:5000],  # 처음 5000자
+            'html_structure': record.get('html_components') or count_components([]),
+            'style_features': record.get('style_features') or aggregate_style_features([]),
+            'analyzed_at': record['fetched_at'],
+            'fetch_mode': record['fetch_mode']
         }
 
-        try:
-            # 스마트에디터 컴포넌트 분석
-            components = container.find_elements(By.CSS_SELECTOR, "[class*='se-component']")
-            structure['total_components'] = len(components)
-
-            for comp in components:
-                class_name = comp.get_attribute('class')
-
-                if 'se-text' in class_name:
-                    structure['text_components'] += 1
-                elif 'se-image' in class_name:
-                    structure['image_components'] += 1
-                elif 'se-video' in class_name:
-                    structure['video_components'] += 1
-                elif 'se-link' in class_name:
-                    structure['link_components'] += 1
-                elif 'se-table' in class_name:
-                    structure['table_components'] += 1
-                elif 'se-divider' in class_name:
-                    structure['divider_components'] += 1
-                elif 'se-quote' in class_name:
-                    structure['quote_components'] += 1
-
-        except Exception as e:
-            print(f"⚠️ HTML 구조 분석 중 오류: {e}")
-
-        return structure
-
-    def _analyze_style_features(self, container) -> Dict:
-        """스타일 특징 분석"""
-        features = {
-            'font_sizes': [],
-            'font_colors': [],
-            'bg_colors': [],
-            'text_aligns': [],
-            'has_bold': False,
-            'has_italic': False,
-            'has_underline': False,
-            'has_strikethrough': False,
-            'line_heights': [],
-            'letter_spacings': []
-        }
+    def analyze_blog_comprehensive(self, blog_id: str, max_posts: int = 3, max_workers: int = 1,
+                                   profile_path: str = None) -> Dict:
+        """
+        블로그 종합 분석
 
-        try:
-            # 텍스트 요소들 분석
-            text_elements = container.find_elements(By.CSS_SELECTOR, "[class*='se-text'], p, span, div")
-
-            for elem in text_elements[:50]:  # 처음 50개만
-                try:
-                    # 폰트 크기
-                    font_size = elem.value_of_css_property('font-size')
-                    if font_size and font_size not in features['font_sizes']:
-                        features['font_sizes'].append(font_size)
-
-                    # 폰트 색상
-                    color = elem.value_of_css_property('color')
-                    if color and color not in features['font_colors']:
-                        features['font_colors'].append(color)
-
-                    # 배경색
-                    bg_color = elem.value_of_css_property('background-color')
-                    if bg_color and bg_color not in features['bg_colors']:
-                        features['bg_colors'].append(bg_color)
-
-                    # 정렬
-                    text_align = elem.value_of_css_property('text-align')
-                    if text_align and text_align not in features['text_aligns']:
-                        features['text_aligns'].append(text_align)
-
-                    # 볼드
-                    font_weight = elem.value_of_css_property('font-weight')
-                    if font_weight and int(font_weight) >= 700:
-                        features['has_bold'] = True
-
-                    # 이탤릭
-                    font_style = elem.value_of_css_property('font-style')
-                    if font_style == 'italic':
-                        features['has_italic'] = True
-
-                    # 밑줄
-                    text_decoration = elem.value_of_css_property('text-decoration')
-                    if 'underline' in text_decoration:
-                        features['has_underline'] = True
-                    if 'line-through' in text_decoration:
-                        features['has_strikethrough'] = True
-
-                    # 줄간격
-                    line_height = elem.value_of_css_property('line-height')
-                    if line_height and line_height not in features['line_heights']:
-                        features['line_heights'].append(line_height)
-
-                    # 자간
-                    letter_spacing = elem.value_of_css_property('letter-spacing')
-                    if letter_spacing and letter_spacing not in features['letter_spacings']:
-                        features['letter_spacings'].append(letter_spacing)
-
-                except:
-                    continue
-
-        except Exception as e:
-            print(f"⚠️ 스타일 특징 분석 중 오류: {e}")
-
-        return features
-
-    def analyze_blog_comprehensive(self, blog_id: str, max_posts: int = 3) -> Dict:
-        """블로그 종합 분석"""
+        Args:
+            blog_id: 블로그 ID
+            max_posts: 분석할 최대 포스트 개수
+            max_workers: 포스트 동시 분석 수 (driver_pool이 있을 때만 적용)
+            profile_path: 누적 스타일 프로필 파일 (지정 시 새 포스트만 이어서 반영 후 저장)
+        """
         print(f"\n{'='*60}")
         print(f"🔍 블로그 종합 분석: {blog_id}")
         print(f"{'='*60}\n")
@@ -349,81 +92,84 @@ class BlogPostAnalyzer:
             'analyzed_at': datetime.now().isoformat()
         }
 
-        # 1. 카테고리 분석
+        # 1. 카테고리 분석 (캐시에 없을 때만 블로그 메인 렌더링)
         print("📂 카테고리 수집 중...")
         analysis['categories'] = self.get_blog_categories(blog_id)
 
         for cat in analysis['categories'][:10]:
             print(f"   - {cat['name']}")
 
-        # 2. 최근 포스트 URL 수집
+        # 2. 최근 포스트 URL 수집 (RSS)
         print(f"\n📝 최근 {max_posts}개 포스트 수집 중...")
         post_urls = self.get_recent_post_urls(blog_id, max_posts)
 
         # 3. 각 포스트 상세 분석
-        for i, url in enumerate(post_urls, 1):
-            print(f"\n[{i}/{len(post_urls)}] 포스트 분석 중...")
-            print(f"   URL: {url}")
+        def analyze_post(item):
+            i, url = item
+            with self.engine.pooled_session():
+                return self._analyze_post(blog_id, url, f"{i}/{len(post_urls)}")
 
-            post_style = self.analyze_post_style(url)
-
-            if post_style['title']:
-                print(f"   제목: {post_style['title'][:50]}...")
-                print(f"   컴포넌트: {post_style['html_structure'].get('total_components', 0)}개")
-                print(f"   텍스트: {post_style['html_structure'].get('text_components', 0)}개")
-                print(f"   이미지: {post_style['html_structure'].get('image_components', 0)}개")
-
-                analysis['posts'].append(post_style)
-
-            time.sleep(2)
+        workers = max_workers if self.engine.driver_pool else 1
+        results = run_parallel(enumerate(post_urls, 1), analyze_post, workers)
+        analysis['posts'] = [post for post in results if post]
 
         # 4. 스타일 요약 생성
-        if analysis['posts']:
+        if profile_path:
+            profile = StyleProfileAggregator.load(profile_path, blog_id)
+            analysis['style_summary'] = self._generate_style_summary(analysis['posts'], profile)
+            profile.save(profile_path)
+        elif analysis['posts']:
             analysis['style_summary'] = self._generate_style_summary(analysis['posts'])
 
         return analysis
 
-    def _generate_style_summary(self, posts: List[Dict]) -> Dict:
-        """포스트들의 스타일 요약"""
-        summary = {
-            'avg_components': 0,
-            'common_font_sizes': [],
-            'common_colors': [],
-            'common_alignment': '',
-            'uses_bold': False,
-            'uses_images': False,
-            'uses_dividers': False
-        }
-
-        if not posts:
-            return summary
-
-        # 평균 컴포넌트 수
-        total_comps = sum(p['html_structure'].get('total_components', 0) for p in posts)
-        summary['avg_components'] = total_comps / len(posts)
+    def _analyze_post(self, blog_id: str, url: str, label: str) -> Optional[Dict]:
+        """포스트 하나 분석 (엔진 캐시 우선)"""
+        print(f"\n[{label}] 포스트 분석 중...")
+        print(f"   URL: {url}")
 
-        # 이미지 사용 여부
-        summary['uses_images'] = any(p['html_structure'].get('image_components', 0) > 0 for p in posts)
+        post_style = self.analyze_post_style(url, blog_id)
 
-        # 볼드 사용 여부
-        summary['uses_bold'] = any(p['style_features'].get('has_bold', False) for p in posts)
+        if not post_style['title']:
+            return None
 
-        # 구분선 사용 여부
-        summary['uses_dividers'] = any(p['html_structure'].get('divider_components', 0) > 0 for p in posts)
+        print(f"   제목: {post_style['title'][:50]}...")
+        print(f"   컴포넌트: {post_style['html_structure'].get('total_components', 0)}개")
+        print(f"   텍스트: {post_style['html_structure'].get('text_components', 0)}개")
+        print(f"   이미지: {post_style['html_structure'].get('image_components', 0)}개")
+        return post_style
 
-        # 공통 폰트 크기
-        all_font_sizes = []
-        for post in posts:
-            all_font_sizes.extend(post['style_features'].get('font_sizes', []))
-        summary['common_font_sizes'] = list(set(all_font_sizes))[:5]
-
-        # 공통 색상
-        all_colors = []
-        for post in posts:
-            all_colors.extend(post['style_features'].get('font_colors', []))
-        summary['common_colors'] = list(set(all_colors))[:5]
+    def analyze_blogs(self, blog_ids: List[str], max_posts: int = 3,
+                      max_workers: int = 4, post_workers: int = 1,
+                      profile_dir: str = None) -> Dict[str, Dict]:
+        """
+        여러 블로그 동시 종합 분석 (driver_pool 필요)
 
-        return summary
+        Args:
+            blog_ids: 블로그 ID 목록
+            max_posts: 블로그당 분석할 최대 포스트 개수
+            max_workers: 블로그 동시 처리 수
+            post_workers: 블로그별 포스트 동시 분석 수
+            profile_dir: 누적 스타일 프로필(blog_post_profile_{blog_id}.json) 저장 폴더
+
+        Returns:
+            {blog_id: 분석 결과} (실패한 블로그는 제외)
+        """
+        def analyze(blog_id):
+            with self.engine.pooled_session():
+                profile_path = os.path.join(profile_dir, f"blog_post_profile_{blog_id}.json") if profile_dir else None
+                return self.analyze_blog_comprehensive(blog_id, max_posts, post_workers, profile_path)
+
+        workers = max_workers if self.engine.driver_pool else 1
+        results = run_parallel(blog_ids, analyze, workers)
+        return {blog_id: analysis for blog_id, analysis in zip(blog_ids, results) if analysis}
+
+    def _generate_style_summary(self, posts: Iterable[Dict],
+                                profile: Optional[StyleProfileAggregator] = None) -> Dict:
+        """포스트들의 스타일 요약 (profile이 있으면 이어서 누적)"""
+        profile = profile or StyleProfileAggregator()
+        profile.add_posts(posts)
+        return profile.style_summary()
 
     def save_analysis(self, analysis: Dict, filename: str = None):
         """분석 결과 저장"""
@@ -451,12 +197,14 @@ def main():
         '1234ssem'
     ]
 
-    analyzer = BlogPostAnalyzer(gemini_api_key, headless=False)
+    pool = DriverPool(size=4, headless=True)
+    analyzer = BlogPostAnalyzer(gemini_api_key, headless=True, driver_pool=pool)
 
     try:
-        for blog_id in blog_ids:
-            # 종합 분석
-            analysis = analyzer.analyze_blog_comprehensive(blog_id, max_posts=3)
+        # 블로그 동시 종합 분석
+        analyses = analyzer.analyze_blogs(blog_ids, max_posts=3, max_workers=4, profile_dir='.')
+
+        for blog_id, analysis in analyses.items():
 
             # 저장
             analyzer.save_analysis(analysis)
@@ -472,10 +220,8 @@ def main():
             print(f"볼드 사용: {'예' if analysis['style_summary'].get('uses_bold') else '아니오'}")
             print(f"\n")
 
-            time.sleep(5)
-
     finally:
-        analyzer.close_driver()
+        pool.close()
 
 
 if __name__ == "__main__":
@@ -7,24 +7,22 @@
 
 import os
 import json
-import time
 from datetime import datetime
-from typing import Dict, List
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
+from typing import Dict, List, Optional
 import google.generativeai as genai
+from blog_crawl_engine import BlogCrawlEngine
+from dom_probe import aggregate_styles
+from driver_pool import DriverPool, run_parallel
 
 
 class BlogStyleExtractor:
     """블로그 스타일 추출기"""
 
-    def __init__(self, gemini_api_key: str, headless: bool = False):
+    def __init__(self, gemini_api_key: str, headless: bool = False, use_cache: bool = True, use_http: bool = True,
+                 driver_pool: Optional[DriverPool] = None, engine: Optional[BlogCrawlEngine] = None):
         self.gemini_api_key = gemini_api_key
-        self.headless = headless
-        self.driver = None
+        # 포스트 수집은 공통 크롤링 엔진이 담당 (다른 도구와 공유 가능)
+        self.engine = engine or BlogCrawlEngine(headless, use_cache, use_http, driver_pool)
 
         # Gemini 설정
         genai.configure(api_key=self.gemini_api_key)
@@ -32,197 +30,40 @@ class BlogStyleExtractor:
 
     def init_driver(self):
         """WebDriver 초기화"""
-        options = Options()
-        if self.headless:
-            options.add_argument('--headless')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-
-        self.driver = webdriver.Chrome(options=options)
-        print("✅ WebDriver 초기화 완료")
+        self.engine.init_driver()
 
     def close_driver(self):
-        if self.driver:
-            self.driver.quit()
+        self.engine.close_driver()
 
-    def extract_post_html(self, post_url: str) -> Dict:
+    def extract_post_html(self, post_url: str, blog_id: str = None) -> Dict:
         """포스트 HTML 직접 추출"""
-        if not self.driver:
-            self.init_driver()
-
         print(f"\n🔍 포스트 분석: {post_url}")
-        self.driver.get(post_url)
-        time.sleep(5)
-
-        post_data = {
-            'url': post_url,
-            'title': '',
-            'html_content': '',
-            'text_content': '',
-            'style_analysis': {},
-            'timestamp': datetime.now().isoformat()
-        }
-
-        try:
-            # iframe 전환 시도 (여러 방법)
-            try:
-                WebDriverWait(self.driver, 5).until(
-                    EC.frame_to_be_available_and_switch_to_it("mainFrame")
-                )
-                print("  ✅ mainFrame iframe으로 전환")
-            except:
-                # iframe 없이 직접 접근
-                print("  ℹ️ iframe 없이 직접 접근")
-
-            # 제목 추출
-            title_selectors = [
-                "div.se-title-text",
-                "h3.se_textarea",
-                "div.pcol1",
-                ".post_title",
-                ".se-title"
-            ]
-
-            for selector in title_selectors:
-                try:
-                    title_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    post_data['title'] = title_elem.text.strip()
-                    if post_data['title']:
-                        print(f"  📝 제목: {post_data['title'][:50]}...")
-                        break
-                except:
-                    continue
-
-            # 본문 HTML 추출
-            content_selectors = [
-                "div.se-main-container",
-                "div.se_component_wrap",
-                "div#postViewArea",
-                "div.post-view",
-                ".post_ct"
-            ]
-
-            for selector in content_selectors:
-                try:
-                    content_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    post_data['html_content'] = content_elem.get_attribute('innerHTML')
-                    post_data['text_content'] = content_elem.text
-
-                    if post_data['html_content']:
-                        print(f"  ✅ 본문 추출 성공: {len(post_data['html_content'])}자")
-                        break
-                except:
-                    continue
-
-            # 페이지 전체 HTML (fallback)
-            if not post_data['html_content']:
-                post_data['html_content'] = self.driver.page_source
-                print("  ⚠️ 전체 페이지 소스 사용")
-
-            # 스타일 분석
-            post_data['style_analysis'] = self._analyze_styles()
 
-        except Exception as e:
-            print(f"  ❌ 오류: {e}")
-
-        finally:
-            try:
-                self.driver.switch_to.default_content()
-            except:
-                pass
-
-        return post_data
-
-    def _analyze_styles(self) -> Dict:
-        """현재 페이지의 스타일 분석"""
-        analysis = {
-            'font_sizes': set(),
-            'font_families': set(),
-            'colors': set(),
-            'bg_colors': set(),
-            'text_aligns': set(),
-            'line_heights': set(),
-            'has_bold': False,
-            'has_italic': False,
-            'has_underline': False,
-            'has_highlight': False,
-            'image_count': 0,
-            'component_types': []
-        }
-
-        try:
-            # 모든 텍스트 요소
-            all_elements = self.driver.find_elements(By.CSS_SELECTOR, "p, span, div, h1, h2, h3, h4, h5, h6")
-
-            for elem in all_elements[:100]:  # 처음 100개만
-                try:
-                    # 스타일 수집
-                    font_size = elem.value_of_css_property('font-size')
-                    font_family = elem.value_of_css_property('font-family')
-                    color = elem.value_of_css_property('color')
-                    bg_color = elem.value_of_css_property('background-color')
-                    text_align = elem.value_of_css_property('text-align')
-                    line_height = elem.value_of_css_property('line-height')
-                    font_weight = elem.value_of_css_property('font-weight')
-                    font_style = elem.value_of_css_property('font-style')
-                    text_decoration = elem.value_of_css_property('text-decoration')
-
-                    if font_size and font_size != 'auto':
-                        analysis['font_sizes'].add(font_size)
-                    if font_family:
-                        analysis['font_families'].add(font_family.split(',')[0].strip())
-                    if color and color != 'rgba(0, 0, 0, 0)':
-                        analysis['colors'].add(color)
-                    if bg_color and bg_color not in ['rgba(0, 0, 0, 0)', 'transparent']:
-                        analysis['bg_colors'].add(bg_color)
-                    if text_align:
-                        analysis['text_aligns'].add(text_align)
-                    if line_height and line_height != 'normal':
-                        analysis['line_heights'].add(line_height)
-
-                    # 텍스트 스타일
-                    if font_weight and int(float(font_weight)) >= 700:
-                        analysis['has_bold'] = True
-                    if font_style == 'italic':
-                        analysis['has_italic'] = True
-                    if 'underline' in text_decoration:
-                        analysis['has_underline'] = True
-
-                except:
-                    continue
-
-            # 이미지 개수
-            images = self.driver.find_elements(By.TAG_NAME, "img")
-            analysis['image_count'] = len(images)
-
-            # 스마트에디터 컴포넌트
-            components = self.driver.find_elements(By.CSS_SELECTOR, "[class*='se-component']")
-            for comp in components[:50]:
-                class_name = comp.get_attribute('class')
-                if 'se-text' in class_name:
-                    analysis['component_types'].append('text')
-                elif 'se-image' in class_name:
-                    analysis['component_types'].append('image')
-                elif 'se-video' in class_name:
-                    analysis['component_types'].append('video')
-                elif 'se-divider' in class_name:
-                    analysis['component_types'].append('divider')
+        # 블로그 메인 주소면 최신 포스트로 대체
+        if blog_id and post_url.rstrip('/') == f"https://blog.naver.com/{blog_id}":
+            post_urls = self.engine.get_post_urls(blog_id, max_posts=1)
+            if post_urls:
+                post_url = post_urls[0]
+                print(f"  ℹ️ 최신 포스트 사용: {post_url}")
 
-        except Exception as e:
-            print(f"  ⚠️ 스타일 분석 중 오류: {e}")
+        record = self.engine.fetch_post(post_url, blog_id)
+        content = record.get('content') or {}
 
-        # set을 list로 변환
-        analysis['font_sizes'] = list(analysis['font_sizes'])
-        analysis['font_families'] = list(analysis['font_families'])
-        analysis['colors'] = list(analysis['colors'])
-        analysis['bg_colors'] = list(analysis['bg_colors'])
-        analysis['text_aligns'] = list(analysis['text_aligns'])
-        analysis['line_heights'] = list(analysis['line_heights'])
+        if record['title']:
+            print(f"  📝 제목: {record['title'][:50]}...")
+            print(f"  ✅ 본문 추출 성공: {len(content.get('html', ''))}자")
+        else:
+            print("  ⚠️ 본문 추출 실패")
 
-        return analysis
+        return {
+            'url': post_url,
+            'title': record['title'],
+            'html_content': content.get('html', ''),
+            'text_content': content.get('text', ''),
+            'style_analysis': record.get('styles') or aggregate_styles([], 0, []),
+            'timestamp': record['fetched_at'],
+            'fetch_mode': record['fetch_mode']
+        }
 
     def generate_style_skills(self, blog_id: str, post_data: Dict) -> Dict:
         """Gemini를 사용해 스타일 Skills 생성"""
@@ -338,8 +179,8 @@ class BlogStyleExtractor:
         print(f"📊 블로그 분석: {blog_id}")
         print(f"{'='*60}")
 
-        # 1. HTML 추출
-        post_data = self.extract_post_html(post_url)
+        # 1. HTML 추출 (엔진 캐시 우선)
+        post_data = self.extract_post_html(post_url, blog_id)
 
         # 2. Skills 생성
         skills = self.generate_style_skills(blog_id, post_data)
@@ -347,7 +188,7 @@ class BlogStyleExtractor:
         # 3. 결과 통합
         result = {
             'blog_id': blog_id,
-            'analyzed_post_url': post_url,
+            'analyzed_post_url': post_data['url'],
             'post_title': post_data['title'],
             'raw_analysis': post_data['style_analysis'],
             'style_skills': skills,
@@ -356,6 +197,24 @@ class BlogStyleExtractor:
 
         return result
 
+    def process_blogs(self, blogs: List[Dict], max_workers: int = 4) -> List[Dict]:
+        """
+        여러 블로그 동시 분석 (driver_pool 필요)
+
+        Args:
+            blogs: [{'blog_id': ..., 'post_url': ...}, ...]
+            max_workers: 블로그 동시 처리 수
+
+        Returns:
+            process_blog 결과 리스트 (입력 순서, 실패한 블로그는 None)
+        """
+        def process(blog):
+            with self.engine.pooled_session():
+                return self.process_blog(blog['blog_id'], blog['post_url'])
+
+        workers = max_workers if self.engine.driver_pool else 1
+        return run_parallel(blogs, process, workers)
+
     def save_skills(self, skills: Dict, filename: str = None):
         """Skills JSON 저장"""
         if not filename:
@@ -395,12 +254,16 @@ def main():
         }
     ]
 
-    extractor = BlogStyleExtractor(gemini_api_key, headless=False)
+    pool = DriverPool(size=4, headless=True)
+    extractor = BlogStyleExtractor(gemini_api_key, headless=True, driver_pool=pool)
 
     try:
-        for blog in blogs:
-            # 분석 및 Skills 생성
-            result = extractor.process_blog(blog['blog_id'], blog['post_url'])
+        # 블로그 동시 분석 및 Skills 생성
+        results = extractor.process_blogs(blogs, max_workers=4)
+
+        for blog, result in zip(blogs, results):
+            if not result:
+                continue
 
             # 저장
             extractor.save_skills(result)
@@ -413,10 +276,8 @@ def main():
             print(f"   폰트: {result['style_skills'].get('formatting_rules', {}).get('default_font_size', 'N/A')}")
             print(f"{'='*60}\n")
 
-            time.sleep(3)
-
     finally:
-        extractor.close_driver()
+        pool.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,219 @@
+"""
+이미지 클립보드 / 브라우저 붙여넣기
+
+업로드할 이미지를 에디터에 넣는 방법을 순서대로 제공합니다.
+1. 브라우저 붙여넣기 (dispatch_image_event): 이미지 바이트로 File/DataTransfer를 만들어
+   에디터에 paste(안 되면 drop) 이벤트를 직접 보냄. OS 클립보드, 하위 프로세스, 키보드 포커스가
+   필요 없어 헤드리스/여러 브라우저 동시 실행에서도 동작
+2. OS 클립보드 (get_clipboard_backend): macOS(osascript), Windows(PowerShell),
+   Wayland(wl-copy), X11(xclip) 중 현재 환경에 맞는 백엔드로 복사한 뒤 붙여넣기 키 입력
+"""
+
+import os
+import base64
+import shutil
+import platform
+import mimetypes
+import subprocess
+from typing import Optional
+
+# 하위 프로세스 대기 시간 (초)
+CLIPBOARD_TIMEOUT = 10
+
+
+def image_mime(name: str) -> str:
+    """파일 이름으로 이미지 MIME 타입 추정 (모르면 image/png)"""
+    mime, _ = mimetypes.guess_type(name)
+    return mime if mime and mime.startswith('image/') else 'image/png'
+
+
+class ClipboardBackend:
+    """OS 클립보드에 이미지를 복사하는 백엔드"""
+
+    name = "none"
+
+    def available(self) -> bool:
+        return False
+
+    def copy_image(self, image_path: str) -> bool:
+        """image_path 이미지를 클립보드에 복사 (성공 여부)"""
+        return False
+
+
+class MacClipboard(ClipboardBackend):
+    name = "macos"
+
+    def available(self) -> bool:
+        return shutil.which('osascript') is not None
+
+    def copy_image(self, image_path: str) -> bool:
+        script = f'''
+        use framework "AppKit"
+        use scripting additions
+
+        set pb to current application's NSPasteboard's generalPasteboard()
+        pb's clearContents()
+
+        set img to current application's NSImage's alloc()'s initWithContentsOfFile:"{os.path.abspath(image_path)}"
+        pb's writeObjects:{{img}}
+
+        return "OK"
+        '''
+        try:
+            result = subprocess.run(['osascript', '-e', script], capture_output=True, text=True,
+                                    timeout=CLIPBOARD_TIMEOUT)
+            return result.returncode == 0
+        except (OSError, subprocess.SubprocessError):
+            return False
+
+
+class WindowsClipboard(ClipboardBackend):
+    name = "windows"
+
+    def available(self) -> bool:
+        return shutil.which('powershell') is not None
+
+    def copy_image(self, image_path: str) -> bool:
+        script = f'''
+        Add-Type -AssemblyName System.Windows.Forms
+        $image = [System.Drawing.Image]::FromFile("{os.path.abspath(image_path)}")
+        [System.Windows.Forms.Clipboard]::SetImage($image)
+        '''
+        try:
+            result = subprocess.run(['powershell', '-Command', script], capture_output=True,
+                                    timeout=CLIPBOARD_TIMEOUT)
+            return result.returncode == 0
+        except (OSError, subprocess.SubprocessError):
+            return False
+
+
+class _CommandClipboard(ClipboardBackend):
+    """이미지 바이트를 표준 입력으로 받는 클립보드 명령 (wl-copy, xclip)"""
+
+    command = ""
+    display_env = ""
+
+    def available(self) -> bool:
+        return bool(os.environ.get(self.display_env)) and shutil.which(self.command) is not None
+
+    def arguments(self, mime: str):
+        raise NotImplementedError
+
+    def copy_image(self, image_path: str) -> bool:
+        try:
+            with open(image_path, 'rb') as f:
+                data = f.read()
+            # 두 명령 모두 클립보드를 넘길 때까지 백그라운드 프로세스를 남기고 바로 종료됨.
+            # 출력을 파이프로 받으면 그 프로세스가 파이프를 계속 잡고 있어 run()이 끝나지 않으므로 버림
+            result = subprocess.run([self.command] + self.arguments(image_mime(image_path)), input=data,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=True,
+                                    timeout=CLIPBOARD_TIMEOUT)
+            return result.returncode == 0
+        except (OSError, subprocess.SubprocessError):
+            return False
+
+
+class WaylandClipboard(_CommandClipboard):
+    name = "wayland"
+    command = "wl-copy"
+    display_env = "WAYLAND_DISPLAY"
+
+    def arguments(self, mime: str):
+        return ['--type', mime]
+
+
+class X11Clipboard(_CommandClipboard):
+    name = "x11"
+    command = "xclip"
+    display_env = "DISPLAY"
+
+    def arguments(self, mime: str):
+        return ['-selection', 'clipboard', '-t', mime, '-i']
+
+
+_backend: Optional[ClipboardBackend] = None
+
+
+def get_clipboard_backend() -> ClipboardBackend:
+    """현재 환경에서 쓸 수 있는 클립보드 백엔드 (없으면 항상 실패하는 기본 백엔드)"""
+    global _backend
+    if _backend is None:
+        system = platform.system()
+        if system == 'Darwin':
+            candidates = [MacClipboard()]
+        elif system == 'Windows':
+            candidates = [WindowsClipboard()]
+        else:
+            candidates = [WaylandClipboard(), X11Clipboard()]
+        _backend = next((backend for backend in candidates if backend.available()), ClipboardBackend())
+    return _backend
+
+
+# arguments: 대상 요소, base64 바이트, 파일 이름, MIME, 이벤트 종류('paste' 또는 'drop')
+# (에디터가 이벤트를 직접 처리하면 defaultPrevented가 true)
+_DISPATCH_SCRIPT = """
+const [target, encoded, name, mime, mode] = arguments;
+const binary = atob(encoded);
+const bytes = new Uint8Array(binary.length);
+for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+const transfer = new DataTransfer();
+transfer.items.add(new File([bytes], name, {type: mime}));
+
+if (mode === 'paste') {
+    let event;
+    try {
+        event = new ClipboardEvent('paste', {clipboardData: transfer, bubbles: true, cancelable: true});
+    } catch (e) {
+        return false;
+    }
+    if (!event.clipboardData || !event.clipboardData.files.length) return false;
+    target.dispatchEvent(event);
+    return event.defaultPrevented;
+}
+let drop;
+for (const type of ['dragenter', 'dragover', 'drop']) {
+    drop = new DragEvent(type, {dataTransfer: transfer, bubbles: true, cancelable: true});
+    target.dispatchEvent(drop);
+}
+return drop.defaultPrevented;
+"""
+
+
+def dispatch_image_event(driver, target, data: bytes, name: str, mode: str = 'paste') -> bool:
+    """
+    이미지 바이트를 담은 paste/drop 이벤트를 target 요소에 보냄
+
+    Args:
+        driver: 에디터 프레임으로 전환된 WebDriver
+        target: 이벤트를 받을 요소 (에디터 본문)
+        data: 이미지 바이트
+        name: 파일 이름 (MIME 추정에도 사용)
+        mode: 'paste' 또는 'drop'
+
+    Returns:
+        에디터가 이벤트를 받아 처리했는지 여부 (이벤트를 만들 수 없거나 무시되면 False)
+    """
+    encoded = base64.b64encode(data).decode('ascii')
+    return bool(driver.execute_script(_DISPATCH_SCRIPT, target, encoded, os.path.basename(name),
+                                      image_mime(name), mode))
+
+
+# arguments: 대상 요소, 텍스트 (에디터가 붙여넣기를 직접 처리하면 defaultPrevented가 true)
+_TEXT_PASTE_SCRIPT = """
+const [target, text] = arguments;
+const transfer = new DataTransfer();
+transfer.setData('text/plain', text);
+let event;
+try {
+    event = new ClipboardEvent('paste', {clipboardData: transfer, bubbles: true, cancelable: true});
+} catch (e) {
+    return false;
+}
+target.dispatchEvent(event);
+return event.defaultPrevented;
+"""
+
+
+def dispatch_text_event(driver, target, text: str) -> bool:
+    """텍스트를 담은 paste 이벤트를 target 요소에 보냄 (에디터가 받아 처리했는지 여부)"""
+    return bool(driver.execute_script(_TEXT_PASTE_SCRIPT, target, text))
@@ -0,0 +1,158 @@
+"""
+네이버 블로그 크롤링 캐시
+
+포스트 URL(logNo) 기준으로 렌더링된 HTML과 추출 결과를 수집 시각과 함께 저장합니다.
+이미 수집한 포스트는 브라우저로 다시 열지 않고 캐시에서 바로 읽어옵니다.
+"""
+
+import re
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+DEFAULT_CACHE_PATH = "crawl_cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    log_no TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    blog_id TEXT,
+    url TEXT,
+    data TEXT,
+    fetched_at TEXT,
+    PRIMARY KEY (log_no, kind)
+);
+CREATE INDEX IF NOT EXISTS idx_posts_blog ON posts(blog_id, kind);
+CREATE TABLE IF NOT EXISTS blog_meta (
+    blog_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    fetched_at TEXT,
+    PRIMARY KEY (blog_id, key)
+);
+"""
+
+
+def parse_post_url(url: str) -> Dict[str, Optional[str]]:
+    """
+    포스트 URL에서 blog_id와 logNo 추출
+
+    지원 형식:
+        https://blog.naver.com/{blog_id}/{logNo}
+        https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={logNo}
+    """
+    blog_id = None
+    log_no = None
+
+    match = re.search(r'[?&]blogId=([\w-]+)', url)
+    if match:
+        blog_id = match.group(1)
+    match = re.search(r'[?&]logNo=(\d+)', url)
+    if match:
+        log_no = match.group(1)
+
+    if not log_no:
+        match = re.search(r'blog\.naver\.com/([\w-]+)/(\d+)', url)
+        if match:
+            blog_id = blog_id or match.group(1)
+            log_no = match.group(2)
+
+    return {'blog_id': blog_id, 'log_no': log_no}
+
+
+class CrawlCache:
+    """SQLite 기반 포스트 크롤링 캐시"""
+
+    def __init__(self, db_path: str = DEFAULT_CACHE_PATH):
+        """
+        Args:
+            db_path: 캐시 파일 경로
+        """
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+        self.lock = threading.Lock()
+
+    def close(self):
+        """연결 종료"""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def get(self, url: str, kind: str) -> Optional[Dict]:
+        """
+        캐시된 포스트 데이터 조회
+
+        Args:
+            url: 포스트 URL
+            kind: 데이터 종류 (도구별 추출 결과 구분, 예: 'post', 'post_style')
+
+        Returns:
+            저장된 데이터 (없거나 logNo가 없는 URL이면 None)
+        """
+        log_no = parse_post_url(url)['log_no']
+        if not log_no:
+            return None
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT data FROM posts WHERE log_no = ? AND kind = ?",
+                (log_no, kind)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, url: str, kind: str, data: Dict, blog_id: str = None):
+        """포스트 데이터 저장 (같은 logNo/kind는 덮어쓰기, 블로그 메인 등 logNo 없는 URL은 저장 안 함)"""
+        parsed = parse_post_url(url)
+        if not parsed['log_no']:
+            return
+        blog_id = blog_id or parsed['blog_id']
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO posts (log_no, kind, blog_id, url, data, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (parsed['log_no'], kind, blog_id, url,
+                 json.dumps(data, ensure_ascii=False), datetime.now().isoformat())
+            )
+
+    def get_blog_posts(self, blog_id: str, kind: str) -> List[Dict]:
+        """블로그의 캐시된 포스트 전체 (최신 logNo 순)"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT data FROM posts WHERE blog_id = ? AND kind = ? "
+                "ORDER BY CAST(log_no AS INTEGER) DESC",
+                (blog_id, kind)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def latest_log_no(self, blog_id: str, kind: str) -> Optional[int]:
+        """블로그에서 마지막으로 수집한 logNo (logNo는 발행 순으로 증가)"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT MAX(CAST(log_no AS INTEGER)) FROM posts WHERE blog_id = ? AND kind = ?",
+                (blog_id, kind)
+            ).fetchone()
+        return row[0] if row and row[0] is not None else None
+
+    def get_blog_meta(self, blog_id: str, key: str, max_age_hours: float = 24) -> Optional[object]:
+        """블로그 단위 메타데이터 조회 (카테고리 등, max_age_hours 지나면 None)"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT value, fetched_at FROM blog_meta WHERE blog_id = ? AND key = ?",
+                (blog_id, key)
+            ).fetchone()
+        if not row:
+            return None
+        if datetime.now() - datetime.fromisoformat(row[1]) > timedelta(hours=max_age_hours):
+            return None
+        return json.loads(row[0])
+
+    def put_blog_meta(self, blog_id: str, key: str, value: object):
+        """블로그 단위 메타데이터 저장"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO blog_meta (blog_id, key, value, fetched_at) VALUES (?, ?, ?, ?)",
+                (blog_id, key, json.dumps(value, ensure_ascii=False), datetime.now().isoformat())
+            )
@@ -1,9 +1,8 @@
 import google.generativeai as genai
-from openpyxl import load_workbook
 from datetime import datetime
 from dotenv import load_dotenv
+from job_store import JobStore, DONE, FAILED
 import os
-import glob
 
 # .env 파일에서 환경 변수 로드
 load_dotenv()
@@ -138,96 +137,85 @@ A. {{간단한 해결책/팁}}
     except Exception as e:
         raise Exception(f"API 호출 실패: {e}")
 
-def find_blog_file():
+def generate_title_content(title):
     """
-    현재 디렉토리에서 blog+날짜.xlsx 파일을 찾습니다.
+    제목 하나로 본문 생성 (제목 전체를 주요 키워드, 앞 2개 단어를 세부 키워드로 사용)
+    
+    Args:
+        title (str): 블로그 제목
     
     Returns:
-        str: 파일 경로
+        str: 생성된 블로그 본문
     """
-    current_dir = os.getcwd()
-    # blog로 시작하고 .xlsx로 끝나는 파일 찾기
-    pattern = os.path.join(current_dir, "blog*.xlsx")
-    files = glob.glob(pattern)
+    # 제목에서 주요 키워드와 세부 키워드 추출
+    # 제목 전체를 주요 키워드로 사용하고, 제목의 핵심 부분을 세부 키워드로 사용
+    main_keyword = title
+    # 제목에서 핵심 키워드 추출 (예: "파이썬 초보자를 위한 완벽 가이드 2026" -> "파이썬 가이드")
+    # 간단하게 제목의 앞부분을 세부 키워드로 사용
+    words = title.split()
+    if len(words) > 2:
+        sub_keyword = " ".join(words[:2])  # 앞 2개 단어를 세부 키워드로
+    else:
+        sub_keyword = title  # 단어가 적으면 전체를 세부 키워드로
     
-    if not files:
-        raise FileNotFoundError("blog+날짜.xlsx 파일을 찾을 수 없습니다.")
-    
-    # 가장 최근 파일 반환 (여러 개 있을 경우)
-    latest_file = max(files, key=os.path.getmtime)
-    return latest_file
+    # Gemini API로 본문 생성
+    # 기본값: 단락당 120자, 사례/통계/인용은 빈 문자열
+    return generate_blog_content(
+        main_keyword=main_keyword,
+        sub_keyword=sub_keyword,
+        word_count_limit_per_paragraph=120,
+        examples_stats_quotes=""
+    )
 
 def main():
-    # 1. blog+날짜.xlsx 파일 열기
+    # 1. blog+날짜.xlsx를 작업 저장소에 반영
+    store = JobStore()
     try:
-        blog_file = find_blog_file()
-        print(f"엑셀 파일 열기: {blog_file}")
-        wb = load_workbook(blog_file)
-        ws = wb.active
+        batch = store.sync_excel()
+        print(f"엑셀 파일 열기: {batch}")
     except Exception as e:
         print(f"파일 열기 오류: {e}")
+        store.close()
         return
     
-    # 2. A열(제목)의 모든 행을 리스트로 불러오기
-    titles = []
-    max_row = ws.max_row
-    
-    for row in range(2, max_row + 1):  # 2행부터 시작 (1행은 헤더)
-        title = ws[f'A{row}'].value
-        if title:  # 제목이 있는 경우만 추가
-            titles.append((row, title))
+    # 2. 제목이 있는 포스트 불러오기
+    posts = store.get_posts(batch)
     
-    if not titles:
+    if not posts:
         print("처리할 제목이 없습니다.")
-        wb.close()
+        store.close()
         return
     
-    print(f"총 {len(titles)}개의 제목을 처리합니다.\n")
+    print(f"총 {len(posts)}개의 제목을 처리합니다.\n")
     
-    # 3-4. 각 제목을 Gemini API에 입력하여 본문 생성 및 B열에 기록
-    for row, title in titles:
+    # 3-4. 각 제목을 Gemini API에 입력하여 본문 생성 및 저장 (행마다 바로 기록)
+    for post in posts:
         try:
             # 진행 상황 출력
-            print(f"현재 {row}행: {title}")
-            
-            # 제목에서 주요 키워드와 세부 키워드 추출
-            # 제목 전체를 주요 키워드로 사용하고, 제목의 핵심 부분을 세부 키워드로 사용
-            main_keyword = title
-            # 제목에서 핵심 키워드 추출 (예: "파이썬 초보자를 위한 완벽 가이드 2026" -> "파이썬 가이드")
-            # 간단하게 제목의 앞부분을 세부 키워드로 사용
-            words = title.split()
-            if len(words) > 2:
-                sub_keyword = " ".join(words[:2])  # 앞 2개 단어를 세부 키워드로
-            else:
-                sub_keyword = title  # 단어가 적으면 전체를 세부 키워드로
+            print(f"현재 {post['row']}행: {post['title']}")
             
-            # Gemini API로 본문 생성
-            # 기본값: 단락당 120자, 사례/통계/인용은 빈 문자열
-            content = generate_blog_content(
-                main_keyword=main_keyword,
-                sub_keyword=sub_keyword,
-                word_count_limit_per_paragraph=120,
-                examples_stats_quotes=""
-            )
+            content = generate_title_content(post['title'])
             
-            # B열에 본문 기록
-            ws[f'B{row}'] = content
+            store.update_post(post['id'], content=content)
+            store.set_stage(post['id'], 'generate', DONE)
             
             print(f"  ✓ 본문 생성 완료\n")
             
         except Exception as e:
             # 예외 발생 시 행 번호 + 에러 메시지 출력하고 다음 행으로
+            store.set_stage(post['id'], 'generate', FAILED, str(e))
             print(f"  ✗ 오류 발생: {e}\n")
             continue
     
-    # 6. 수정된 데이터를 원본 파일에 덮어쓰기 방식으로 저장
+    # 5. 생성 결과를 엑셀(B열)에도 기록
     try:
-        wb.save(blog_file)
-        print(f"파일 저장 완료: {blog_file}")
+        excel_file = store.export_excel(batch)
+        if excel_file:
+            print(f"파일 저장 완료: {excel_file}")
     except Exception as e:
         print(f"파일 저장 오류: {e}")
     finally:
-        wb.close()
+        store.close()
     
     print("\n작업 완료!")
 
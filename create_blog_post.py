@@ -17,6 +17,8 @@ import pickle
 from anthropic import Anthropic
 from dotenv import load_dotenv
 from typing import Dict, List, Optional
+from image_index_store import ImageIndexStore, is_store_path
+from gdocs_builder import DocumentBuilder
 
 load_dotenv()
 
@@ -56,8 +58,11 @@ class BlogPostCreator:
     def _load_image_index(self):
         """이미지 인덱스 로드"""
         try:
-            with open(self.image_index_path, 'r', encoding='utf-8') as f:
-                self.image_index = json.load(f)
+            if is_store_path(self.image_index_path):
+                self.image_index = ImageIndexStore(self.image_index_path).as_index()
+            else:
+                with open(self.image_index_path, 'r', encoding='utf-8') as f:
+                    self.image_index = json.load(f)
             print(f"✅ 이미지 인덱스 로드: {len(self.image_index.get('images', []))}개")
         except Exception as e:
             print(f"⚠️ 이미지 인덱스 로드 실패: {e}")
@@ -72,6 +77,10 @@ class BlogPostCreator:
 
         matches = []
         for image in self.image_index.get('images', []):
+            # 중복 이미지는 원본만 추천
+            if image.get('duplicate_of'):
+                continue
+
             score = 0
             description = image.get('description', '').lower()
             tags = ' '.join(image.get('tags', [])).lower()
@@ -299,139 +308,62 @@ class BlogPostCreator:
         """문서에 블로그 콘텐츠 작성 (스타일 적용)"""
         print(f"\n✍️ 문서 작성 중...")
 
-        requests = []
-
         # 블로그 스타일 가져오기
         formatting = self.blog_skills.get('formatting_rules', {})
         font_family = formatting.get('default_font_family', '나눔고딕')
         font_size = int(formatting.get('default_font_size', '13px').replace('px', ''))
         text_color = formatting.get('default_text_color', '#444444')
 
-        # 제목은 자동으로 설정되므로 본문부터 시작
-        index = 1
+        # 제목은 자동으로 설정되므로 본문(인덱스 1)부터 시작
+        builder = DocumentBuilder(
+            base_style={
+                'weightedFontFamily': {'fontFamily': font_family},
+                'fontSize': {'magnitude': font_size, 'unit': 'PT'},
+                'foregroundColor': {'color': {'rgbColor': self._hex_to_rgb(text_color)}}
+            },
+            base_fields='weightedFontFamily,fontSize,foregroundColor'
+        )
 
         for section in blog_content['sections']:
             if section['type'] == 'text':
                 content = section['content']
 
-                # 볼드 범위 찾기 (** 제거 전)
+                # 볼드 범위 찾기 (** 제거 전) 후 ** 마커 제거한 깨끗한 텍스트 삽입
                 bold_ranges = self._find_bold_ranges(content)
-
-                # ** 마커 제거한 깨끗한 텍스트
-                clean_content = self._clean_bold_markers(content)
-
-                # 텍스트 삽입
-                requests.append({
-                    'insertText': {
-                        'location': {'index': index},
-                        'text': clean_content + '\n\n'
-                    }
-                })
-
-                text_length = len(clean_content)
-
-                # 기본 스타일 적용
-                requests.append({
-                    'updateTextStyle': {
-                        'range': {
-                            'startIndex': index,
-                            'endIndex': index + text_length
-                        },
-                        'textStyle': {
-                            'weightedFontFamily': {
-                                'fontFamily': font_family
-                            },
-                            'fontSize': {
-                                'magnitude': font_size,
-                                'unit': 'PT'
-                            },
-                            'foregroundColor': {
-                                'color': {
-                                    'rgbColor': self._hex_to_rgb(text_color)
-                                }
-                            }
-                        },
-                        'fields': 'weightedFontFamily,fontSize,foregroundColor'
-                    }
-                })
-
-                # 볼드 처리
-                for start, end in bold_ranges:
-                    requests.append({
-                        'updateTextStyle': {
-                            'range': {
-                                'startIndex': index + start,
-                                'endIndex': index + end
-                            },
-                            'textStyle': {
-                                'bold': True
-                            },
-                            'fields': 'bold'
-                        }
-                    })
-
-                index += text_length + 2
+                builder.add_text(self._clean_bold_markers(content) + '\n\n', bold_ranges)
 
             elif section['type'] == 'image_placeholder':
-                # 이미지 추천 (인덱스가 있으면)
-                suggested_images = self._suggest_images_for_section(
-                    section.get('description', ''), top_k=1
-                )
-
-                if suggested_images and len(suggested_images) > 0:
-                    # 첫 번째 추천 이미지 삽입
-                    top_image = suggested_images[0]
-                    image_url = top_image.get('web_content_link') or top_image.get('web_view_link')
-
-                    if image_url and 'drive.google.com' in image_url:
-                        # Google Drive 이미지 URL을 직접 접근 가능한 형식으로 변환
-                        file_id = self._extract_drive_file_id(image_url)
-                        if file_id:
-                            direct_url = f"https://drive.google.com/uc?export=view&id={file_id}"
-
-                            # 이미지 삽입
-                            requests.append({
-                                'insertInlineImage': {
-                                    'location': {'index': index},
-                                    'uri': direct_url,
-                                    'objectSize': {
-                                        'width': {
-                                            'magnitude': 400,
-                                            'unit': 'PT'
-                                        }
-                                    }
-                                }
-                            })
-                            index += 1  # 이미지는 1 character 차지
-                    else:
-                        # 이미지 URL이 없으면 placeholder
-                        img_text = f"\n[이미지: {section['description']}]\n\n"
-                        requests.append({
-                            'insertText': {
-                                'location': {'index': index},
-                                'text': img_text
-                            }
-                        })
-                        index += len(img_text)
+                placeholder = f"\n[이미지: {section['description']}]\n\n"
+                direct_url = self._suggested_image_url(section.get('description', ''))
+                if direct_url:
+                    # 이미지를 넣을 수 없으면 (권한 없는 URL 등) placeholder로 대체
+                    builder.add_image(direct_url, width_pt=400, fallback_text=placeholder)
                 else:
-                    # 추천 이미지 없으면 placeholder
-                    img_text = f"\n[이미지: {section['description']}]\n\n"
-                    requests.append({
-                        'insertText': {
-                            'location': {'index': index},
-                            'text': img_text
-                        }
-                    })
-                    index += len(img_text)
-
-        # 문서 업데이트
-        if requests:
-            self.docs_service.documents().batchUpdate(
-                documentId=doc_id,
-                body={'requests': requests}
-            ).execute()
-
-        print(f"  ✅ 작성 완료")
+                    builder.add_text(placeholder, styled=False)
+
+        # 문서 업데이트 (크기 제한으로 나눈 배치 단위)
+        stats = builder.write(self.docs_service, doc_id)
+
+        print(f"  ✅ 작성 완료 (batchUpdate {stats['batches']}회, 요청 {stats['requests']}개)")
+        if stats['failed_images']:
+            print(f"  ⚠️ 삽입하지 못한 이미지 {len(stats['failed_images'])}개는 placeholder로 대체했습니다")
+
+    def _suggested_image_url(self, description: str) -> Optional[str]:
+        """섹션 설명에 맞는 추천 이미지의 직접 접근 URL (Google Drive 이미지가 아니면 None)"""
+        suggested_images = self._suggest_images_for_section(description, top_k=1)
+        if not suggested_images:
+            return None
+
+        top_image = suggested_images[0]
+        image_url = top_image.get('web_content_link') or top_image.get('web_view_link')
+        if not image_url or 'drive.google.com' not in image_url:
+            return None
+
+        # Google Drive 이미지 URL을 직접 접근 가능한 형식으로 변환
+        file_id = self._extract_drive_file_id(image_url)
+        if not file_id:
+            return None
+        return f"https://drive.google.com/uc?export=view&id={file_id}"
 
     def create_blog_post(self, source_url: str) -> str:
         """전체 프로세스 실행"""
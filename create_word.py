@@ -8,11 +8,11 @@
 from docx import Document
 from docx.shared import Inches, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from openpyxl import load_workbook
+from job_store import JobStore, DONE, FAILED
+from word_manifest import get_manifest
 from nanobanana import generate_image, generate_blog_images
 from dotenv import load_dotenv
 import os
-import glob
 import re
 import time
 
@@ -23,18 +23,6 @@ OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "output")
 IMAGES_DIR = os.path.join(os.path.dirname(__file__), "images")
 
 
-def find_blog_file():
-    """현재 디렉토리에서 blog+날짜.xlsx 파일 찾기"""
-    current_dir = os.getcwd()
-    pattern = os.path.join(current_dir, "blog*.xlsx")
-    files = glob.glob(pattern)
-    
-    if not files:
-        raise FileNotFoundError("blog+날짜.xlsx 파일을 찾을 수 없습니다.")
-    
-    return max(files, key=os.path.getmtime)
-
-
 def parse_blog_content(content):
     """
     블로그 본문을 섹션별로 파싱
@@ -274,62 +262,105 @@ def create_word_document(parsed_content, output_path, generate_images=True, imag
     return output_path
 
 
-def process_excel_to_word(excel_path=None, generate_images=True, image_provider="dalle"):
+def create_row_document(row, title, content, generate_images=True, image_provider="dalle"):
     """
-    엑셀 파일의 블로그 본문을 워드 문서로 변환
+    엑셀 한 행의 본문을 워드 문서로 변환 (output/post_{row-1:03d}.docx, output/manifest.json에 기록)
     
     Args:
-        excel_path: 엑셀 파일 경로 (None이면 자동 탐색)
+        row: 엑셀 행 번호 (2행부터)
+        title: 블로그 제목
+        content: 블로그 본문
         generate_images: 이미지 생성 여부
         image_provider: 이미지 생성 서비스
     
     Returns:
-        list: 생성된 워드 문서 경로 리스트
+        str: 생성된 워드 문서 경로
     """
-    if excel_path is None:
-        excel_path = find_blog_file()
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    os.makedirs(IMAGES_DIR, exist_ok=True)
     
-    print(f"엑셀 파일: {excel_path}")
+    # 본문 파싱
+    parsed = parse_blog_content(content)
+    if not parsed["title"]:
+        parsed["title"] = title
+    
+    output_path = os.path.join(OUTPUT_DIR, f"post_{row-1:03d}.docx")
+    result = create_word_document(
+        parsed, 
+        output_path, 
+        generate_images=generate_images,
+        image_provider=image_provider
+    )
+    get_manifest(OUTPUT_DIR).record(row, title, content, result)
+    return result
+
+
+def skip_document(row, title, content, status):
+    """
+    워드 문서를 다시 만들 필요가 없는지 확인
     
-    wb = load_workbook(excel_path)
-    ws = wb.active
+    이미 업로드한 포스트이거나, 문서 단계를 마쳤고 목록(manifest)의 문서가 현재 본문으로 만든 것이면 건너뜁니다.
     
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
-    os.makedirs(IMAGES_DIR, exist_ok=True)
+    Args:
+        status: 작업 저장소의 단계별 상태 ({'document': 'done', 'upload': ...})
     
-    word_files = []
-    max_row = ws.max_row
+    Returns:
+        (건너뛸지 여부, 재사용할 문서 경로 또는 None)
+    """
+    if status.get('upload') == DONE:
+        return True, None
+    if status.get('document') == DONE:
+        docx_path, stale = get_manifest(OUTPUT_DIR).resolve(row, title, content)
+        if docx_path and not stale:
+            return True, docx_path
+    return False, None
+
+
+def process_excel_to_word(excel_path=None, generate_images=True, image_provider="dalle"):
+    """
+    엑셀(작업 저장소)의 블로그 본문을 워드 문서로 변환
     
-    for row in range(2, max_row + 1):
-        title = ws[f'A{row}'].value
-        content = ws[f'B{row}'].value
-        
-        if not title or not content:
-            continue
-        
-        print(f"\n{'='*50}")
-        print(f"[{row-1}] {title[:40]}...")
-        print('='*50)
-        
-        # 본문 파싱
-        parsed = parse_blog_content(content)
-        if not parsed["title"]:
-            parsed["title"] = title
+    Args:
+        excel_path: 엑셀 파일 경로 (None이면 가장 최근 blog*.xlsx)
+        generate_images: 이미지 생성 여부
+        image_provider: 이미지 생성 서비스
+    
+    Returns:
+        list: 생성된 워드 문서 경로 리스트
+    """
+    store = JobStore()
+    try:
+        batch = store.sync_excel(excel_path)
+        print(f"엑셀 파일: {batch}")
         
-        output_path = os.path.join(OUTPUT_DIR, f"post_{row-1:03d}.docx")
+        word_files = []
         
-        try:
-            result = create_word_document(
-                parsed, 
-                output_path, 
-                generate_images=generate_images,
-                image_provider=image_provider
-            )
-            word_files.append(result)
-        except Exception as e:
-            print(f"  ✗ 워드 생성 오류: {e}")
-    
-    wb.close()
+        for post in store.get_posts(batch, require_content=True):
+            row = post['row']
+            title = post['title']
+            
+            skip, docx_path = skip_document(row, title, post['content'], post['status'])
+            if skip:
+                print(f"[{row-1}] 이미 처리된 문서, 건너뜀: {title[:40]}")
+                if docx_path:
+                    store.update_post(post['id'], word_file=docx_path)
+                    word_files.append(docx_path)
+                continue
+            
+            print(f"\n{'='*50}")
+            print(f"[{row-1}] {title[:40]}...")
+            print('='*50)
+            
+            try:
+                result = create_row_document(row, title, post['content'], generate_images, image_provider)
+                store.update_post(post['id'], word_file=result)
+                store.set_stage(post['id'], 'document', DONE)
+                word_files.append(result)
+            except Exception as e:
+                store.set_stage(post['id'], 'document', FAILED, str(e))
+                print(f"  ✗ 워드 생성 오류: {e}")
+    finally:
+        store.close()
     
     print(f"\n{'='*50}")
     print(f"완료! 총 {len(word_files)}개 워드 문서 생성")
@@ -338,17 +369,13 @@ def process_excel_to_word(excel_path=None, generate_images=True, image_provider=
     return word_files
 
 
-if __name__ == "__main__":
+def main():
     import sys
     
     print("=== 워드 문서 생성 (이미지 포함) ===\n")
     
     try:
-        excel_file = find_blog_file()
-        print(f"엑셀 파일 발견: {excel_file}\n")
-        
         result = process_excel_to_word(
-            excel_path=excel_file,
             generate_images=True,
             image_provider="dalle"
         )
@@ -366,3 +393,7 @@ if __name__ == "__main__":
         import traceback
         traceback.print_exc()
         sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
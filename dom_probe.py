@@ -0,0 +1,234 @@
+"""
+DOM 스타일 일괄 수집 모듈
+
+요소마다 value_of_css_property를 호출하면 속성 하나당 WebDriver 왕복이 한 번씩 발생합니다.
+주입 스크립트 하나로 computed style, 컴포넌트 클래스, 구조 개수를 한 번에 수집해
+JSON으로 돌려받고, 각 분석기 형식으로 집계하는 함수를 제공합니다.
+"""
+
+import json
+from typing import Dict, Iterable, List, Optional
+
+# 수집할 CSS 속성
+STYLE_PROPERTIES = [
+    'font-size', 'font-family', 'color', 'background-color', 'text-align',
+    'line-height', 'font-weight', 'font-style', 'text-decoration', 'letter-spacing'
+]
+
+# 구조 개수 셀렉터 (blog_crawl_engine.extract_structure 기준)
+COUNT_SELECTORS = {
+    'heading': ".se-text-heading",
+    'subheading': ".se-text-subheading",
+    'bold': "strong, b",
+    'italic': "em, i",
+    'list': "ul, ol",
+    'link': "a",
+    'quote': "blockquote",
+    'paragraph': ".se-text-paragraph",
+    'se_image': "img.se-image-resource",
+    'image': "img"
+}
+
+PROBE_SCRIPT = """
+const root = arguments[0] || document;
+const styleSelector = arguments[1];
+const limit = arguments[2];
+const props = arguments[3];
+const countSelectors = arguments[4];
+
+const styles = Array.from(root.querySelectorAll(styleSelector)).slice(0, limit).map(el => {
+    const cs = window.getComputedStyle(el);
+    const o = {};
+    props.forEach(p => { o[p] = cs.getPropertyValue(p); });
+    return o;
+});
+const components = Array.from(root.querySelectorAll("[class*='se-component']"))
+    .map(el => el.getAttribute('class') || '');
+const counts = {};
+Object.keys(countSelectors).forEach(k => { counts[k] = root.querySelectorAll(countSelectors[k]).length; });
+const firstParagraph = root.querySelector('.se-text-paragraph');
+
+return JSON.stringify({
+    styles: styles,
+    components: components,
+    counts: counts,
+    first_paragraph_align: firstParagraph ? window.getComputedStyle(firstParagraph).textAlign : null
+});
+"""
+
+
+def probe_dom(driver, root=None, style_selector: str = "p, span, div", limit: int = 100) -> Dict:
+    """
+    현재 페이지(또는 root 요소 하위)의 스타일/구조를 한 번의 스크립트 실행으로 수집
+
+    Args:
+        driver: Selenium WebDriver (iframe 전환 후 호출)
+        root: 기준 WebElement (None이면 document 전체)
+        style_selector: computed style을 수집할 요소 셀렉터
+        limit: 스타일을 수집할 최대 요소 수
+
+    Returns:
+        {'styles': [...], 'components': [...], 'counts': {...}, 'first_paragraph_align': str}
+    """
+    payload = driver.execute_script(
+        PROBE_SCRIPT, root, style_selector, limit, STYLE_PROPERTIES, COUNT_SELECTORS
+    )
+    return json.loads(payload)
+
+
+def is_bold(font_weight: Optional[str]) -> bool:
+    """font-weight 값이 볼드인지"""
+    if font_weight == 'bold':
+        return True
+    try:
+        return int(float(font_weight)) >= 700
+    except (TypeError, ValueError):
+        return False
+
+
+def classify_component(class_name: str) -> Optional[str]:
+    """스마트에디터 컴포넌트 클래스 → 종류"""
+    for kind in ('text', 'image', 'video', 'link', 'table', 'divider', 'quote'):
+        if f'se-{kind}' in class_name:
+            return kind
+    return None
+
+
+def count_components(class_names: Iterable[str]) -> Dict:
+    """컴포넌트 종류별 개수 (BlogPostAnalyzer html_structure 형식)"""
+    structure = {
+        'total_components': 0,
+        'text_components': 0,
+        'image_components': 0,
+        'video_components': 0,
+        'link_components': 0,
+        'table_components': 0,
+        'divider_components': 0,
+        'quote_components': 0
+    }
+
+    for class_name in class_names:
+        structure['total_components'] += 1
+        kind = classify_component(class_name)
+        if kind:
+            structure[f'{kind}_components'] += 1
+
+    return structure
+
+
+def structure_from_counts(counts: Dict, first_paragraph_align: Optional[str]) -> Dict:
+    """구조 개수 → NaverBlogCrawler structure 형식"""
+    return {
+        'has_heading': counts.get('heading', 0) > 0,
+        'has_subheading': counts.get('subheading', 0) > 0,
+        'has_bold': counts.get('bold', 0) > 0,
+        'has_italic': counts.get('italic', 0) > 0,
+        'has_list': counts.get('list', 0) > 0,
+        'has_link': counts.get('link', 0) > 0,
+        'has_quote': counts.get('quote', 0) > 0,
+        'paragraph_count': counts.get('paragraph', 0),
+        'image_count': counts.get('se_image', 0),
+        'text_align': first_paragraph_align or 'left'
+    }
+
+
+def aggregate_style_features(styles: Iterable[Dict]) -> Dict:
+    """요소별 스타일 → BlogPostAnalyzer style_features 형식"""
+    features = {
+        'font_sizes': [],
+        'font_families': [],
+        'font_colors': [],
+        'bg_colors': [],
+        'text_aligns': [],
+        'has_bold': False,
+        'has_italic': False,
+        'has_underline': False,
+        'has_strikethrough': False,
+        'line_heights': [],
+        'letter_spacings': []
+    }
+
+    for style in styles:
+        for prop, key in [('font-size', 'font_sizes'), ('color', 'font_colors'),
+                          ('background-color', 'bg_colors'), ('text-align', 'text_aligns'),
+                          ('line-height', 'line_heights'), ('letter-spacing', 'letter_spacings')]:
+            value = style.get(prop)
+            if value and value not in features[key]:
+                features[key].append(value)
+        font_family = style.get('font-family')
+        if font_family:
+            family = font_family.split(',')[0].strip().strip('"\'')
+            if family not in features['font_families']:
+                features['font_families'].append(family)
+
+        if is_bold(style.get('font-weight')):
+            features['has_bold'] = True
+        if style.get('font-style') == 'italic':
+            features['has_italic'] = True
+        decoration = style.get('text-decoration') or ''
+        if 'underline' in decoration:
+            features['has_underline'] = True
+        if 'line-through' in decoration:
+            features['has_strikethrough'] = True
+
+    return features
+
+
+def aggregate_styles(styles: Iterable[Dict], image_count: int, component_classes: List[str]) -> Dict:
+    """요소별 스타일 → BlogStyleExtractor style_analysis 형식"""
+    analysis = {
+        'font_sizes': set(),
+        'font_families': set(),
+        'colors': set(),
+        'bg_colors': set(),
+        'text_aligns': set(),
+        'line_heights': set(),
+        'has_bold': False,
+        'has_italic': False,
+        'has_underline': False,
+        'has_highlight': False,
+        'image_count': image_count,
+        'component_types': []
+    }
+
+    for style in styles:
+        font_size = style.get('font-size')
+        font_family = style.get('font-family')
+        color = style.get('color')
+        bg_color = style.get('background-color')
+        text_align = style.get('text-align')
+        line_height = style.get('line-height')
+
+        if font_size and font_size != 'auto':
+            analysis['font_sizes'].add(font_size)
+        if font_family:
+            analysis['font_families'].add(font_family.split(',')[0].strip())
+        if color and color != 'rgba(0, 0, 0, 0)':
+            analysis['colors'].add(color)
+        if bg_color and bg_color not in ['rgba(0, 0, 0, 0)', 'transparent']:
+            analysis['bg_colors'].add(bg_color)
+            analysis['has_highlight'] = True
+        if text_align:
+            analysis['text_aligns'].add(text_align)
+        if line_height and line_height != 'normal':
+            analysis['line_heights'].add(line_height)
+
+        # 텍스트 스타일
+        if is_bold(style.get('font-weight')):
+            analysis['has_bold'] = True
+        if style.get('font-style') == 'italic':
+            analysis['has_italic'] = True
+        if 'underline' in (style.get('text-decoration') or ''):
+            analysis['has_underline'] = True
+
+    # 스마트에디터 컴포넌트
+    for class_name in component_classes[:50]:
+        kind = classify_component(class_name)
+        if kind in ('text', 'image', 'video', 'divider'):
+            analysis['component_types'].append(kind)
+
+    # set을 list로 변환
+    for key in ['font_sizes', 'font_families', 'colors', 'bg_colors', 'text_aligns', 'line_heights']:
+        analysis[key] = list(analysis[key])
+
+    return analysis
@@ -0,0 +1,245 @@
+"""
+WebDriver 풀 및 병렬 실행 유틸리티
+
+Chrome 인스턴스를 미리 띄워 두고 작업마다 대여/반납하며,
+반납 시 쿠키/iframe 상태를 초기화해 다음 작업에서 재사용합니다.
+여러 블로그/포스트를 동시에 분석할 때 사용합니다.
+
+분석기들은 DOM과 computed style만 필요하므로, 기본 드라이버는 이미지/폰트/미디어와
+광고·트래커 요청을 차단한 크롤링 전용 프로필로 실행합니다.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterable, List, Optional
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# 크롤링 프로필에서 차단할 요청 (Network.setBlockedURLs 와일드카드 패턴)
+# 이미지 src 속성은 DOM에 그대로 남으므로 이미지 URL 수집에는 영향이 없습니다.
+BLOCKED_URL_PATTERNS = [
+    # 이미지/폰트/미디어
+    '*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*', '*.bmp*', '*.ico*',
+    '*.woff*', '*.ttf*', '*.otf*', '*.eot*',
+    '*.mp4*', '*.webm*', '*.m3u8*', '*.mp3*',
+    '*postfiles.pstatic.net*', '*blogthumb.pstatic.net*', '*phinf.pstatic.net*',
+    # 광고/통계/트래커
+    '*veta.naver.com*', '*tveta.naver.net*', '*ssl.pstatic.net/tveta*',
+    '*wcs.naver.net*', '*lcs.naver.com*', '*nlog.naver.com*', '*ntm.pstatic.net*',
+    '*doubleclick.net*', '*googlesyndication.com*', '*googletagmanager.com*',
+    '*google-analytics.com*', '*facebook.net*', '*criteo.com*'
+]
+
+
+def create_chrome_driver(headless: bool = True, lightweight: bool = True) -> webdriver.Chrome:
+    """
+    분석기 공통 드라이버 생성
+
+    Args:
+        headless: 헤드리스(new) 모드 실행 여부
+        lightweight: 크롤링 전용 프로필 사용 (리소스 차단, 이미지 비활성화, eager 로딩)
+    """
+    options = Options()
+    if headless:
+        options.add_argument('--headless=new')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--window-size=1920,1080')
+    options.add_argument(f'--user-agent={USER_AGENT}')
+
+    if lightweight:
+        # DOM 생성까지만 기다림 (이미지/광고 로딩 완료를 기다리지 않음)
+        options.page_load_strategy = 'eager'
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_argument('--disable-extensions')
+        options.add_argument('--disable-background-networking')
+        options.add_argument('--disable-component-update')
+        options.add_argument('--disable-default-apps')
+        options.add_argument('--mute-audio')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2
+        })
+
+    driver = webdriver.Chrome(options=options)
+
+    if lightweight:
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            print(f"⚠️ 요청 차단 설정 실패 (전체 로딩으로 진행): {e}")
+
+    return driver
+
+
+class DriverPool:
+    """재사용 가능한 WebDriver 풀"""
+
+    def __init__(self, size: int = 4, headless: bool = True,
+                 factory: Optional[Callable[[], webdriver.Chrome]] = None, warm: bool = True):
+        """
+        Args:
+            size: 유지할 유휴 드라이버 수
+            headless: 기본 팩토리 사용 시 헤드리스 여부
+            factory: 드라이버 생성 함수 (None이면 create_chrome_driver)
+            warm: 생성 시 size개 드라이버를 미리 띄울지 여부
+        """
+        self.size = size
+        self.factory = factory or (lambda: create_chrome_driver(headless))
+        self.idle = queue.Queue()
+        self.lock = threading.Lock()
+        self.drivers = []
+        self.closed = False
+
+        if warm:
+            self.warm_up()
+
+    def warm_up(self):
+        """유휴 드라이버를 size개까지 병렬로 생성"""
+        missing = self.size - self.idle.qsize()
+        if missing <= 0:
+            return
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            for driver in executor.map(lambda _: self._create(), range(missing)):
+                if driver:
+                    self.idle.put(driver)
+        print(f"✅ WebDriver 풀 준비 완료: {self.idle.qsize()}개")
+
+    def _create(self) -> Optional[webdriver.Chrome]:
+        try:
+            driver = self.factory()
+        except Exception as e:
+            print(f"⚠️ WebDriver 생성 실패: {e}")
+            return None
+        with self.lock:
+            self.drivers.append(driver)
+        return driver
+
+    def acquire(self) -> webdriver.Chrome:
+        """
+        드라이버 대여
+
+        유휴 드라이버가 없으면 기다리지 않고 새로 생성합니다
+        (블로그 작업과 포스트 작업이 동시에 대여해도 교착되지 않도록).
+        """
+        if self.closed:
+            raise RuntimeError("이미 종료된 WebDriver 풀입니다")
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            driver = self._create()
+            if driver is None:
+                raise RuntimeError("WebDriver를 생성할 수 없습니다")
+            return driver
+
+    def release(self, driver: webdriver.Chrome):
+        """드라이버 반납 (상태 초기화 실패 또는 유휴 초과 시 종료)"""
+        if not self.closed and self.idle.qsize() < self.size and self.reset(driver):
+            self.idle.put(driver)
+        else:
+            self._quit(driver)
+
+    @contextmanager
+    def checkout(self):
+        """with 블록 동안 드라이버 대여"""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    @staticmethod
+    def reset(driver: webdriver.Chrome) -> bool:
+        """다음 작업을 위해 드라이버 상태 초기화"""
+        try:
+            driver.switch_to.default_content()
+            driver.delete_all_cookies()
+            driver.get('about:blank')
+            return True
+        except Exception:
+            return False
+
+    def _quit(self, driver: webdriver.Chrome):
+        with self.lock:
+            if driver in self.drivers:
+                self.drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """풀의 모든 드라이버 종료"""
+        self.closed = True
+        with self.lock:
+            drivers = list(self.drivers)
+        for driver in drivers:
+            self._quit(driver)
+        print("✅ WebDriver 풀 종료")
+
+
+class PooledDriverMixin:
+    """
+    분석기의 self.driver를 스레드별로 관리
+
+    driver_pool이 설정되어 있으면 init_driver가 풀에서 대여하고,
+    pooled_session() 블록이 끝날 때 반납합니다. 풀이 없으면 기존처럼 동작합니다.
+    """
+
+    driver_pool: Optional[DriverPool] = None
+
+    @property
+    def _driver_local(self) -> threading.local:
+        return self.__dict__.setdefault('_thread_driver', threading.local())
+
+    @property
+    def driver(self):
+        return getattr(self._driver_local, 'driver', None)
+
+    @driver.setter
+    def driver(self, value):
+        self._driver_local.driver = value
+
+    def acquire_pooled_driver(self) -> bool:
+        """풀이 있으면 현재 스레드용 드라이버를 대여"""
+        if not self.driver_pool:
+            return False
+        self.driver = self.driver_pool.acquire()
+        return True
+
+    @contextmanager
+    def pooled_session(self):
+        """작업 스레드에서 사용한 풀 드라이버를 블록 종료 시 반납"""
+        try:
+            yield
+        finally:
+            if self.driver_pool and self.driver:
+                self.driver_pool.release(self.driver)
+                self.driver = None
+
+
+def run_parallel(items: Iterable, task: Callable, max_workers: int = 4) -> List:
+    """
+    items 각각에 task를 병렬 실행 (결과 순서 유지, 실패한 항목은 None)
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        return [_run_safely(task, item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda item: _run_safely(task, item), items))
+
+
+def _run_safely(task: Callable, item):
+    try:
+        return task(item)
+    except Exception as e:
+        print(f"⚠️ 작업 실패 ({item}): {e}")
+        return None
@@ -0,0 +1,281 @@
+"""
+구글 독스 batchUpdate 요청 빌더
+
+문서 끝에 덧붙일 텍스트/이미지를 차례로 모은 뒤 한 번에 요청으로 바꿔 보냅니다.
+- 이어지는 텍스트는 insertText 하나로 합치고, 붙어 있는 같은 스타일 범위도 updateTextStyle 하나로 합침
+- 인덱스는 구글 독스 기준(UTF-16 코드 단위)으로 계산 (이모지가 있어도 범위가 밀리지 않음)
+- 요청 수/글자 수 제한으로 배치를 나누고, 일시적인 오류가 난 배치만 다시 보냄
+  (서버 오류 응답을 받아도 배치가 이미 적용됐을 수 있으므로, 직전 리비전을 writeControl로 함께 보내고
+  재시도 전에 문서 리비전이 바뀌었는지 확인해 같은 내용이 두 번 들어가지 않게 함)
+- 이미지가 든 배치가 실패하면 조각별로 나눠 보내고, 넣을 수 없는 이미지만 대체 텍스트로 바꿈
+"""
+
+import time
+from typing import Dict, List, Tuple
+
+from googleapiclient.errors import HttpError
+
+# 배치 하나에 넣을 최대 요청 수 / 삽입 글자 수
+MAX_BATCH_REQUESTS = 200
+MAX_BATCH_CHARS = 20000
+
+# 일시적인 오류(요청 한도, 서버 오류) 재시도 횟수와 첫 대기 시간 (초, 매번 두 배)
+BATCH_RETRIES = 3
+RETRY_DELAY = 2.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def utf16_len(text: str) -> int:
+    """구글 독스 인덱스 기준 길이 (UTF-16 코드 단위)"""
+    return len(text.encode('utf-16-le')) // 2
+
+
+def coalesce_ranges(ranges: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """겹치거나 붙어 있는 (시작, 끝) 범위 합치기"""
+    merged = []
+    for start, end in sorted(r for r in ranges if r[1] > r[0]):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class _TextPiece:
+    """이어서 삽입할 텍스트와 스타일 범위 (범위는 텍스트 안의 문자 위치)"""
+
+    def __init__(self):
+        self.text = ""
+        self.styled: List[Tuple[int, int]] = []
+        self.bold: List[Tuple[int, int]] = []
+
+    def append(self, text: str, bold_ranges, styled: bool):
+        offset = len(self.text)
+        self.text += text
+        if styled:
+            self.styled.append((offset, offset + len(text)))
+        self.bold.extend((offset + start, offset + end) for start, end in bold_ranges)
+
+    def split(self, max_chars: int) -> List['_TextPiece']:
+        """max_chars 이하 조각으로 나누기 (가능하면 줄바꿈 뒤에서 자름)"""
+        pieces = []
+        start = 0
+        while start < len(self.text):
+            end = min(start + max_chars, len(self.text))
+            if end < len(self.text):
+                newline = self.text.rfind('\n', start, end)
+                if newline > start:
+                    end = newline + 1
+            piece = _TextPiece()
+            piece.text = self.text[start:end]
+            piece.styled = self._clip(self.styled, start, end)
+            piece.bold = self._clip(self.bold, start, end)
+            pieces.append(piece)
+            start = end
+        return pieces
+
+    @staticmethod
+    def _clip(ranges, start, end):
+        return [(max(s, start) - start, min(e, end) - start) for s, e in ranges if s < end and e > start]
+
+    def request_count(self) -> int:
+        return 1 + len(coalesce_ranges(self.styled)) + len(coalesce_ranges(self.bold))
+
+
+class _ImagePiece:
+    """인라인 이미지 (넣을 수 없으면 fallback_text 삽입)"""
+
+    def __init__(self, uri: str, width_pt: float, fallback_text: str):
+        self.uri = uri
+        self.width_pt = width_pt
+        self.fallback_text = fallback_text
+
+    def request_count(self) -> int:
+        return 1
+
+
+class DocumentBuilder:
+    """문서 끝에 차례로 덧붙일 내용을 모아 batchUpdate로 보내는 빌더"""
+
+    def __init__(self, base_style: Dict = None, base_fields: str = None, start_index: int = 1,
+                 max_requests: int = MAX_BATCH_REQUESTS, max_chars: int = MAX_BATCH_CHARS):
+        """
+        Args:
+            base_style: styled 텍스트에 적용할 textStyle
+            base_fields: base_style의 fields 값 (예: 'weightedFontFamily,fontSize')
+            start_index: 쓰기 시작할 문서 인덱스 (빈 문서 본문은 1)
+            max_requests: 배치 하나의 최대 요청 수
+            max_chars: 배치 하나의 최대 삽입 글자 수
+        """
+        self.base_style = base_style or {}
+        self.base_fields = base_fields or ','.join(self.base_style)
+        self.start_index = start_index
+        self.max_requests = max_requests
+        self.max_chars = max_chars
+        self.pieces: List = []
+        # 마지막으로 확인한 문서 리비전 (batchUpdate의 requiredRevisionId로 사용)
+        self.revision_id = None
+
+    def add_text(self, text: str, bold_ranges: List[Tuple[int, int]] = (), styled: bool = True):
+        """
+        텍스트 추가 (앞 조각이 텍스트면 이어 붙임)
+
+        Args:
+            text: 삽입할 텍스트
+            bold_ranges: text 안의 굵게 표시할 (시작, 끝) 문자 위치
+            styled: base_style 적용 여부
+        """
+        if not text:
+            return
+        if not self.pieces or not isinstance(self.pieces[-1], _TextPiece):
+            self.pieces.append(_TextPiece())
+        self.pieces[-1].append(text, bold_ranges, styled and bool(self.base_style))
+
+    def add_image(self, uri: str, width_pt: float = 400, fallback_text: str = ""):
+        """인라인 이미지 추가 (삽입에 실패하면 fallback_text로 대체)"""
+        self.pieces.append(_ImagePiece(uri, width_pt, fallback_text))
+
+    def batches(self) -> List[List]:
+        """요청 수/글자 수 제한에 맞춘 조각 묶음 목록"""
+        batches, current, requests, chars = [], [], 0, 0
+        for piece in self.pieces:
+            parts = piece.split(self.max_chars) if isinstance(piece, _TextPiece) else [piece]
+            for part in parts:
+                size = len(part.text) if isinstance(part, _TextPiece) else 0
+                count = part.request_count()
+                if current and (requests + count > self.max_requests or chars + size > self.max_chars):
+                    batches.append(current)
+                    current, requests, chars = [], 0, 0
+                current.append(part)
+                requests += count
+                chars += size
+        if current:
+            batches.append(current)
+        return batches
+
+    def build_requests(self, pieces: List, index: int) -> Tuple[List[Dict], int]:
+        """
+        조각 목록을 index부터 쓰는 요청으로 변환
+
+        Returns:
+            (요청 목록, 다음 조각을 쓸 인덱스)
+        """
+        requests = []
+        for piece in pieces:
+            if isinstance(piece, _ImagePiece):
+                requests.append({
+                    'insertInlineImage': {
+                        'location': {'index': index},
+                        'uri': piece.uri,
+                        'objectSize': {'width': {'magnitude': piece.width_pt, 'unit': 'PT'}}
+                    }
+                })
+                index += 1  # 이미지는 1글자 차지
+                continue
+
+            # 문자 위치 → UTF-16 인덱스
+            def at(position, text=piece.text, base=index):
+                return base + utf16_len(text[:position])
+
+            requests.append({'insertText': {'location': {'index': index}, 'text': piece.text}})
+            for start, end in coalesce_ranges(piece.styled):
+                requests.append({
+                    'updateTextStyle': {
+                        'range': {'startIndex': at(start), 'endIndex': at(end)},
+                        'textStyle': self.base_style,
+                        'fields': self.base_fields
+                    }
+                })
+            for start, end in coalesce_ranges(piece.bold):
+                requests.append({
+                    'updateTextStyle': {
+                        'range': {'startIndex': at(start), 'endIndex': at(end)},
+                        'textStyle': {'bold': True},
+                        'fields': 'bold'
+                    }
+                })
+            index += utf16_len(piece.text)
+        return requests, index
+
+    def write(self, docs_service, doc_id: str) -> Dict:
+        """
+        모든 배치를 순서대로 보내기
+
+        Returns:
+            {'batches': 보낸 배치 수, 'requests': 보낸 요청 수, 'failed_images': 대체 텍스트로 바꾼 이미지 URI 목록}
+        """
+        stats = {'batches': 0, 'requests': 0, 'failed_images': []}
+        index = self.start_index
+        self.revision_id = self._current_revision(docs_service, doc_id)
+        for pieces in self.batches():
+            requests, next_index = self.build_requests(pieces, index)
+            try:
+                self._send(docs_service, doc_id, requests)
+                stats['batches'] += 1
+                stats['requests'] += len(requests)
+                index = next_index
+            except HttpError as e:
+                if not any(isinstance(piece, _ImagePiece) for piece in pieces):
+                    raise
+                print(f"  ⚠️ 이미지가 포함된 배치 실패, 조각별로 다시 보냅니다: {e}")
+                index = self._write_pieces(docs_service, doc_id, pieces, index, stats)
+        return stats
+
+    def _write_pieces(self, docs_service, doc_id: str, pieces: List, index: int, stats: Dict) -> int:
+        """조각을 하나씩 보내고 실패한 이미지만 대체 텍스트로 바꿈"""
+        for piece in pieces:
+            requests, next_index = self.build_requests([piece], index)
+            try:
+                self._send(docs_service, doc_id, requests)
+            except HttpError as e:
+                if not isinstance(piece, _ImagePiece):
+                    raise
+                print(f"  ⚠️ 이미지 삽입 실패, 대체 텍스트 사용: {piece.uri} ({e})")
+                stats['failed_images'].append(piece.uri)
+                if not piece.fallback_text:
+                    continue
+                fallback = _TextPiece()
+                fallback.append(piece.fallback_text, (), styled=False)
+                requests, next_index = self.build_requests([fallback], index)
+                self._send(docs_service, doc_id, requests)
+            stats['batches'] += 1
+            stats['requests'] += len(requests)
+            index = next_index
+        return index
+
+    @staticmethod
+    def _current_revision(docs_service, doc_id: str):
+        return docs_service.documents().get(documentId=doc_id, fields='revisionId').execute().get('revisionId')
+
+    def _send(self, docs_service, doc_id: str, requests: List[Dict]):
+        """
+        batchUpdate 한 번 (일시적인 오류면 기다렸다가 같은 배치만 재시도)
+
+        직전 리비전을 requiredRevisionId로 보내므로 이미 적용된 배치를 다시 보내면 거부됩니다.
+        서버 오류(5xx) 뒤에는 문서 리비전을 다시 확인해, 바뀌었으면 적용된 것으로 보고 다시 보내지 않습니다.
+        리비전을 모르면 요청 한도 초과(429)만 재시도합니다.
+        """
+        delay = RETRY_DELAY
+        for attempt in range(BATCH_RETRIES + 1):
+            body = {'requests': requests}
+            if self.revision_id:
+                body['writeControl'] = {'requiredRevisionId': self.revision_id}
+            try:
+                response = docs_service.documents().batchUpdate(documentId=doc_id, body=body).execute()
+                self.revision_id = response.get('writeControl', {}).get('requiredRevisionId')
+                return response
+            except HttpError as e:
+                status = getattr(getattr(e, 'resp', None), 'status', None)
+                if attempt >= BATCH_RETRIES or status not in RETRY_STATUSES:
+                    raise
+                if status != 429:
+                    if not self.revision_id:
+                        raise
+                    current = self._current_revision(docs_service, doc_id)
+                    if current != self.revision_id:
+                        print(f"  ℹ️ batchUpdate 오류 응답({status}) 전에 이미 적용되어 다시 보내지 않습니다")
+                        self.revision_id = current
+                        return None
+                print(f"  ⏳ batchUpdate 일시 오류 ({status}), {delay:.0f}초 후 재시도...")
+                time.sleep(delay)
+                delay *= 2
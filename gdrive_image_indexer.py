@@ -13,28 +13,38 @@ from pathlib import Path
 from typing import Dict, List, Optional
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
+from google.auth.transport.requests import Request, AuthorizedSession
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
 import io
 import pickle
+from image_index_store import ImageIndexStore, is_store_path
+from image_hash import PerceptualHashIndex, dhash, hash_to_hex
 
 # Google Drive API 스코프
 SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
 
+# 중복 이미지가 재사용하는 AI 분석 필드
+ANALYSIS_FIELDS = ['description', 'tags', 'category', 'colors', 'mood', 'subjects', 'context']
+
 class GDriveImageIndexer:
     """구글 드라이브 이미지 인덱서"""
 
-    def __init__(self, gemini_api_key: str, folder_id: str = None):
+    def __init__(self, gemini_api_key: str, folder_id: str = None, dedup_distance: Optional[int] = 5):
         """
         Args:
             gemini_api_key: Gemini API 키
             folder_id: 구글 드라이브 폴더 ID
+            dedup_distance: 중복으로 볼 지각 해시 해밍 거리 (None이면 중복 제거 안 함)
         """
         self.gemini_api_key = gemini_api_key
         self.folder_id = folder_id
+        self.dedup_distance = dedup_distance
         self.service = None
+        self.creds = None
         self.index_file = "image_index.json"
+        # load_index가 연 SQLite 저장소 (검색마다 새 연결을 열지 않도록 재사용)
+        self._store: Optional[ImageIndexStore] = None
 
         # Gemini 설정
         genai.configure(api_key=self.gemini_api_key)
@@ -63,6 +73,7 @@ class GDriveImageIndexer:
             with open(token_path, 'wb') as token:
                 pickle.dump(creds, token)
 
+        self.creds = creds
         self.service = build('drive', 'v3', credentials=creds)
         print("✅ 구글 드라이브 인증 완료")
 
@@ -116,6 +127,18 @@ class GDriveImageIndexer:
             print(f"⚠️ 이미지 다운로드 실패: {e}")
             return None
 
+    def download_thumbnail(self, thumbnail_link: str) -> Optional[bytes]:
+        """썸네일 다운로드 (지각 해시 계산용)"""
+        if not thumbnail_link or not self.creds:
+            return None
+        try:
+            response = AuthorizedSession(self.creds).get(thumbnail_link, timeout=10)
+            if response.status_code == 200:
+                return response.content
+        except Exception as e:
+            print(f"⚠️ 썸네일 다운로드 실패: {e}")
+        return None
+
     def analyze_image_with_gemini(self, image_bytes: bytes, filename: str) -> Dict:
         """Gemini를 사용해 이미지 내용 분석"""
         try:
@@ -198,9 +221,14 @@ class GDriveImageIndexer:
             "folder_id": self.folder_id,
             "created_at": datetime.now().isoformat(),
             "total_images": len(images),
-            "images": []
+            "images": [],
+            "duplicate_clusters": {}
         }
 
+        # 지각 해시 기반 중복 검출
+        hash_index = PerceptualHashIndex(self.dedup_distance) if self.dedup_distance is not None else None
+        analyzed = {}
+
         for i, img in enumerate(images, 1):
             print(f"\n[{i}/{len(images)}] 분석 중: {img['name']}")
 
@@ -216,6 +244,22 @@ class GDriveImageIndexer:
                 "thumbnail_link": img.get('thumbnailLink')
             }
 
+            # 썸네일 해시로 이미 분석한 이미지와 중복인지 확인
+            phash = None
+            if hash_index is not None:
+                phash = dhash(self.download_thumbnail(img.get('thumbnailLink')))
+            if phash is not None:
+                metadata['phash'] = hash_to_hex(phash)
+                original_id = hash_index.find(phash)
+                if original_id:
+                    original = analyzed[original_id]
+                    metadata.update({k: original[k] for k in ANALYSIS_FIELDS if k in original})
+                    metadata['duplicate_of'] = original_id
+                    index['duplicate_clusters'].setdefault(original_id, []).append(img['id'])
+                    index['images'].append(metadata)
+                    print(f"  ♻️ 중복 이미지 (원본: {original['filename']}) - 분석 재사용")
+                    continue
+
             # 이미지 다운로드 및 AI 분석
             image_bytes = self.download_image_temp(img['id'])
 
@@ -224,20 +268,31 @@ class GDriveImageIndexer:
                 metadata.update(ai_analysis)
 
             index['images'].append(metadata)
+            analyzed[img['id']] = metadata
+            if phash is not None:
+                hash_index.add(img['id'], phash)
 
             print(f"  ✅ {img['name']}: {metadata.get('description', 'N/A')[:50]}...")
 
+        duplicate_count = sum(len(ids) for ids in index['duplicate_clusters'].values())
+        if duplicate_count:
+            print(f"\n♻️ 중복 이미지 {duplicate_count}개 - Gemini 분석 생략")
+
         # 3. 인덱스 저장
         self.save_index(index)
 
         return index
 
     def save_index(self, index: Dict, filename: str = None):
-        """인덱스를 JSON 파일로 저장"""
+        """인덱스를 JSON 파일(또는 .db SQLite 저장소)로 저장"""
         filename = filename or self.index_file
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(index, f, ensure_ascii=False, indent=2)
+        if is_store_path(filename):
+            with ImageIndexStore(filename) as store:
+                store.write_index(index)
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(index, f, ensure_ascii=False, indent=2)
 
         print(f"\n💾 인덱스 저장 완료: {filename}")
         print(f"   총 {len(index['images'])}개 이미지 인덱싱됨")
@@ -250,40 +305,63 @@ class GDriveImageIndexer:
             print(f"❌ 인덱스 파일이 없습니다: {filename}")
             return {}
 
+        # SQLite 저장소는 images를 지연 로드 뷰로 반환 (파일당 연결 하나를 재사용)
+        if is_store_path(filename):
+            if self._store is None or self._store.conn is None or self._store.db_path != filename:
+                self.close()
+                self._store = ImageIndexStore(filename)
+            return self._store.as_index()
+
         with open(filename, 'r', encoding='utf-8') as f:
             return json.load(f)
 
-    def search_images_by_context(self, context: str, top_k: int = 5) -> List[Dict]:
-        """문맥에 맞는 이미지 검색"""
+    def close(self):
+        """load_index가 연 SQLite 저장소 연결 종료"""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    @staticmethod
+    def score_image(img: Dict, context: str) -> int:
+        """이미지와 문맥 키워드의 관련도 점수"""
+        # 간단한 키워드 매칭 (향후 임베딩 기반으로 개선 가능)
+        context_lower = context.lower()
+        score = 0
+
+        # 설명에서 매칭
+        if context_lower in img.get('description', '').lower():
+            score += 3
+
+        # 태그에서 매칭
+        for tag in img.get('tags', []):
+            if context_lower in tag.lower() or tag.lower() in context_lower:
+                score += 2
+
+        # 카테고리 매칭
+        if context_lower in img.get('category', '').lower():
+            score += 1
+
+        # 문맥 매칭
+        if context_lower in img.get('context', '').lower():
+            score += 2
+
+        return score
+
+    def search_images_by_context(self, context: str, top_k: int = 5, collapse_duplicates: bool = True) -> List[Dict]:
+        """문맥에 맞는 이미지 검색 (collapse_duplicates면 중복 이미지는 원본만 반환)"""
         index = self.load_index()
 
         if not index or 'images' not in index:
             print("❌ 인덱스가 비어있습니다")
             return []
 
-        # 간단한 키워드 매칭 (향후 임베딩 기반으로 개선 가능)
-        context_lower = context.lower()
         scored_images = []
 
         for img in index['images']:
-            score = 0
-
-            # 설명에서 매칭
-            if context_lower in img.get('description', '').lower():
-                score += 3
+            if collapse_duplicates and img.get('duplicate_of'):
+                continue
 
-            # 태그에서 매칭
-            for tag in img.get('tags', []):
-                if context_lower in tag.lower() or tag.lower() in context_lower:
-                    score += 2
-
-            # 카테고리 매칭
-            if context_lower in img.get('category', '').lower():
-                score += 1
-
-            # 문맥 매칭
-            if context_lower in img.get('context', '').lower():
-                score += 2
+            score = self.score_image(img, context)
 
             if score > 0:
                 img_copy = img.copy()
@@ -0,0 +1,156 @@
+"""
+CSS 셀렉터 기반 텍스트 추출 (파서 백엔드 선택 가능)
+
+트렌드 수집처럼 큰 페이지에서 몇 개 셀렉터만 읽을 때 html.parser는 느리므로
+selectolax → lxml → BeautifulSoup 순으로 설치된 파서를 사용합니다.
+HTML_PARSER_BACKEND 환경 변수나 set_backend()로 백엔드를 고정할 수 있습니다.
+"""
+
+import os
+import importlib.util
+from typing import Callable, Dict, List, Optional
+
+try:
+    # selectolax 1.0부터 기존 parser(Modest) 백엔드는 import 시 오류를 내므로 lexbor 백엔드를 먼저 사용
+    from selectolax.lexbor import LexborHTMLParser as _SelectolaxParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as _SelectolaxParser
+        HAS_SELECTOLAX = True
+    except ImportError:
+        HAS_SELECTOLAX = False
+
+try:
+    import lxml.html as _lxml_html
+    # lxml의 cssselect()에 필요 (설치 여부만 확인)
+    HAS_LXML = importlib.util.find_spec('cssselect') is not None
+except ImportError:
+    HAS_LXML = False
+
+try:
+    from bs4 import BeautifulSoup
+    HAS_BS4 = True
+except ImportError:
+    HAS_BS4 = False
+
+
+class _SelectolaxDocument:
+    def __init__(self, html: str):
+        self.tree = _SelectolaxParser(html)
+
+    def select(self, selector: str):
+        return self.tree.css(selector)
+
+    @staticmethod
+    def select_in(node, selector: str):
+        return node.css_first(selector)
+
+    @staticmethod
+    def text(node) -> str:
+        return node.text(deep=True)
+
+
+class _LxmlDocument:
+    def __init__(self, html: str):
+        self.tree = _lxml_html.fromstring(html) if html.strip() else None
+
+    def select(self, selector: str):
+        return self.tree.cssselect(selector) if self.tree is not None else []
+
+    @staticmethod
+    def select_in(node, selector: str):
+        found = node.cssselect(selector)
+        return found[0] if found else None
+
+    @staticmethod
+    def text(node) -> str:
+        return node.text_content()
+
+
+class _Bs4Document:
+    def __init__(self, html: str):
+        self.tree = BeautifulSoup(html, 'lxml' if HAS_LXML else 'html.parser')
+
+    def select(self, selector: str):
+        return self.tree.select(selector)
+
+    @staticmethod
+    def select_in(node, selector: str):
+        return node.select_one(selector)
+
+    @staticmethod
+    def text(node) -> str:
+        return node.text
+
+
+BACKENDS: Dict[str, Callable] = {}
+if HAS_SELECTOLAX:
+    BACKENDS['selectolax'] = _SelectolaxDocument
+if HAS_LXML:
+    BACKENDS['lxml'] = _LxmlDocument
+if HAS_BS4:
+    BACKENDS['bs4'] = _Bs4Document
+
+_backend: Optional[str] = None
+
+
+def available_backends() -> List[str]:
+    """설치된 백엔드 (빠른 순)"""
+    return list(BACKENDS)
+
+
+def set_backend(name: Optional[str]):
+    """사용할 백엔드 지정 (None이면 자동 선택)"""
+    global _backend
+    if name is not None and name not in BACKENDS:
+        raise ValueError(f"사용할 수 없는 파서 백엔드: {name} (설치됨: {', '.join(BACKENDS) or '없음'})")
+    _backend = name
+
+
+def get_backend() -> str:
+    """현재 백엔드 이름"""
+    name = _backend or os.getenv('HTML_PARSER_BACKEND')
+    if name in BACKENDS:
+        return name
+    if not BACKENDS:
+        raise ImportError("selectolax, lxml(+cssselect), beautifulsoup4 중 하나가 필요합니다")
+    return next(iter(BACKENDS))
+
+
+def parse(html: str, backend: str = None):
+    """HTML 문서 파싱 (select/text 인터페이스를 가진 문서 객체 반환)"""
+    return BACKENDS[backend or get_backend()](html or '')
+
+
+def select_texts(html: str, selector: str, limit: int = 20, min_length: int = 3,
+                 backend: str = None) -> List[str]:
+    """
+    selector에 맞는 요소들의 텍스트
+
+    Args:
+        html: HTML 문자열
+        selector: CSS 셀렉터
+        limit: 확인할 최대 요소 수
+        min_length: 이보다 짧은 텍스트는 제외
+        backend: 파서 백엔드 (None이면 get_backend())
+    """
+    doc = parse(html, backend)
+    texts = []
+    for node in doc.select(selector)[:limit]:
+        text = doc.text(node).strip()
+        if text and len(text) >= min_length:
+            texts.append(text)
+    return texts
+
+
+def select_child_texts(html: str, selector: str, child_selector: str, limit: int = 20,
+                       backend: str = None) -> List[str]:
+    """selector 요소마다 child_selector 첫 요소의 텍스트"""
+    doc = parse(html, backend)
+    texts = []
+    for node in doc.select(selector)[:limit]:
+        child = doc.select_in(node, child_selector)
+        if child is not None:
+            texts.append(doc.text(child).strip())
+    return texts
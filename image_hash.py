@@ -0,0 +1,105 @@
+"""
+이미지 지각 해시 (dHash) 유틸리티
+
+크기 변경/재저장된 거의 같은 이미지를 찾기 위해
+썸네일에서 64비트 dHash를 계산하고 해밍 거리로 비교합니다.
+"""
+
+import io
+from typing import Dict, List, Optional
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+HASH_BITS = 64
+
+
+def dhash(image_bytes: bytes, hash_size: int = 8) -> Optional[int]:
+    """
+    이미지 바이트에서 dHash 계산
+
+    Args:
+        image_bytes: 이미지 파일 바이트 (썸네일 권장)
+        hash_size: 해시 한 변 크기 (8이면 64비트)
+
+    Returns:
+        해시 정수 (Pillow가 없거나 디코딩 실패 시 None)
+    """
+    if not HAS_PIL or not image_bytes:
+        return None
+
+    try:
+        img = Image.open(io.BytesIO(image_bytes)).convert('L')
+        img = img.resize((hash_size + 1, hash_size), Image.LANCZOS)
+        pixels = list(img.getdata())
+    except Exception:
+        return None
+
+    value = 0
+    for row in range(hash_size):
+        offset = row * (hash_size + 1)
+        for col in range(hash_size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 해시의 해밍 거리"""
+    return bin(a ^ b).count('1')
+
+
+def hash_to_hex(value: int) -> str:
+    return f"{value:016x}"
+
+
+def hex_to_hash(value: str) -> int:
+    return int(value, 16)
+
+
+class PerceptualHashIndex:
+    """
+    해밍 거리 기반 근접 중복 검색 인덱스
+
+    64비트 해시를 (max_distance + 1)개 구간으로 나누면, 거리가 max_distance 이하인
+    두 해시는 적어도 한 구간이 완전히 같습니다 (비둘기집 원리).
+    구간별 버킷에서 후보만 비교하므로 전체 이미지와 매번 비교하지 않습니다.
+    """
+
+    def __init__(self, max_distance: int = 5):
+        """
+        Args:
+            max_distance: 중복으로 볼 최대 해밍 거리
+        """
+        self.max_distance = max_distance
+        bands = min(max_distance + 1, HASH_BITS)
+        width = HASH_BITS // bands
+        self._bands = [(i * width, HASH_BITS if i == bands - 1 else (i + 1) * width)
+                       for i in range(bands)]
+        self._buckets: List[Dict[int, List[str]]] = [{} for _ in self._bands]
+        self.hashes: Dict[str, int] = {}
+
+    def _band_keys(self, value: int) -> List[int]:
+        return [(value >> start) & ((1 << (end - start)) - 1) for start, end in self._bands]
+
+    def add(self, item_id: str, value: int):
+        """해시 등록"""
+        self.hashes[item_id] = value
+        for bucket, key in zip(self._buckets, self._band_keys(value)):
+            bucket.setdefault(key, []).append(item_id)
+
+    def find(self, value: int) -> Optional[str]:
+        """max_distance 이내에서 가장 가까운 등록 항목 id"""
+        best_id, best_dist = None, self.max_distance + 1
+        seen = set()
+        for bucket, key in zip(self._buckets, self._band_keys(value)):
+            for item_id in bucket.get(key, []):
+                if item_id in seen:
+                    continue
+                seen.add(item_id)
+                dist = hamming_distance(value, self.hashes[item_id])
+                if dist < best_dist:
+                    best_id, best_dist = item_id, dist
+        return best_id
@@ -0,0 +1,347 @@
+"""
+이미지 인덱스 SQLite 저장소
+
+image_index.json과 동일한 논리 스키마를 SQLite 파일에 저장합니다.
+전체 JSON을 파싱하지 않고 필요한 행/필드만 지연 로드할 수 있으며,
+JSON ↔ SQLite 변환(마이그레이션/내보내기)을 지원합니다.
+"""
+
+import os
+import json
+import sqlite3
+from typing import Dict, Iterator, List, Optional, Union
+
+# 인덱스 파일 확장자 (이 확장자면 SQLite 저장소로 취급)
+STORE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+
+# 인덱스 메타 필드 (images 외 최상위 키)
+META_FIELDS = ['folder_id', 'created_at', 'total_images']
+
+# 컬럼으로 저장하는 이미지 필드
+SCALAR_FIELDS = [
+    'filename', 'mime_type', 'size', 'created_time', 'modified_time',
+    'web_view_link', 'thumbnail_link', 'description', 'category', 'mood', 'context'
+]
+LIST_FIELDS = ['tags', 'colors', 'subjects']
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS images (
+    position INTEGER NOT NULL,
+    id TEXT PRIMARY KEY,
+    filename TEXT,
+    mime_type TEXT,
+    size INTEGER,
+    created_time TEXT,
+    modified_time TEXT,
+    web_view_link TEXT,
+    thumbnail_link TEXT,
+    description TEXT,
+    category TEXT,
+    mood TEXT,
+    context TEXT,
+    tags TEXT,
+    colors TEXT,
+    subjects TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_images_position ON images(position);
+"""
+
+
+def is_store_path(path: Optional[str]) -> bool:
+    """SQLite 저장소 경로인지 확인"""
+    return bool(path) and path.lower().endswith(STORE_EXTENSIONS)
+
+
+class LazyImageList:
+    """
+    저장소의 images 테이블을 리스트처럼 다루는 지연 로드 뷰
+
+    len()은 COUNT, 순회는 커서 스트리밍, 인덱싱은 position 인덱스로 한 행 조회,
+    슬라이스는 position 범위 조회(리스트 반환)로 처리됩니다.
+    """
+
+    def __init__(self, store: 'ImageIndexStore', fields: Optional[List[str]] = None):
+        self.store = store
+        self.fields = fields
+
+    def __len__(self) -> int:
+        return self.store.count()
+
+    def __iter__(self) -> Iterator[Dict]:
+        return self.store.iter_images(self.fields)
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[Dict, List[Dict]]:
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step == 1:
+                return self.store.get_images_between(start, stop, self.fields)
+            return [self.store.get_image_at(j, self.fields) for j in range(start, stop, step)]
+        if i < 0:
+            i += len(self)
+        if i < 0:
+            raise IndexError("image index out of range")
+        return self.store.get_image_at(i, self.fields)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def close(self):
+        """저장소 연결 종료 (이후에는 뷰를 쓸 수 없음)"""
+        self.store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ImageIndexStore:
+    """SQLite 기반 이미지 인덱스 저장소"""
+
+    def __init__(self, db_path: str):
+        """
+        Args:
+            db_path: SQLite 파일 경로
+        """
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+        self._compact_positions()
+
+    def close(self):
+        """연결 종료"""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---- 쓰기 ----
+
+    def write_index(self, index: Dict):
+        """인덱스 전체를 저장 (기존 내용 교체)"""
+        with self.conn:
+            self.conn.execute("DELETE FROM meta")
+            self.conn.execute("DELETE FROM images")
+            self._write_meta(index)
+            self._insert_images(index.get('images', []), start=0)
+
+    def add_images(self, images: List[Dict]):
+        """이미지 행 추가 (같은 id는 덮어쓰기)"""
+        with self.conn:
+            row = self.conn.execute("SELECT COALESCE(MAX(position), -1) FROM images").fetchone()
+            self._insert_images(images, start=row[0] + 1)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('total_images', ?)",
+                (json.dumps(self.count()),)
+            )
+
+    def _write_meta(self, index: Dict):
+        for key, value in index.items():
+            if key == 'images':
+                continue
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (key, json.dumps(value, ensure_ascii=False))
+            )
+
+    def _insert_images(self, images: List[Dict], start: int):
+        """
+        이미지 행 저장 (position은 0부터 빈틈없이 유지)
+
+        이미 있는 id는 원래 position을 그대로 쓰고, 새 id만 start부터 차례로 붙입니다.
+        """
+        columns = ['position', 'id'] + SCALAR_FIELDS + LIST_FIELDS + ['extra']
+        sql = (f"INSERT OR REPLACE INTO images ({', '.join(columns)}) "
+               f"VALUES ({', '.join('?' * len(columns))})")
+        positions = {}
+        rows = []
+        for image in images:
+            image_id = image.get('id')
+            position = positions.get(image_id)
+            if position is None and image_id is not None:
+                row = self.conn.execute("SELECT position FROM images WHERE id = ?", (image_id,)).fetchone()
+                position = row[0] if row else None
+            if position is None:
+                position = start
+                start += 1
+            if image_id is not None:
+                positions[image_id] = position
+            rows.append(self._to_row(image, position))
+        self.conn.executemany(sql, rows)
+
+    def _compact_positions(self):
+        """이전 버전에서 같은 id를 덮어써 position에 빈틈이 생긴 파일 정리"""
+        row = self.conn.execute("SELECT COUNT(*), COALESCE(MAX(position), -1) FROM images").fetchone()
+        if row[0] == row[1] + 1:
+            return
+        rowids = [r[0] for r in self.conn.execute("SELECT rowid FROM images ORDER BY position, rowid")]
+        with self.conn:
+            self.conn.executemany("UPDATE images SET position = ? WHERE rowid = ?",
+                                  ((i, rowid) for i, rowid in enumerate(rowids)))
+
+    def _to_row(self, image: Dict, position: int) -> tuple:
+        known = {'id'} | set(SCALAR_FIELDS) | set(LIST_FIELDS)
+        extra = {k: v for k, v in image.items() if k not in known}
+        return (
+            position,
+            image.get('id'),
+            *[image.get(f) for f in SCALAR_FIELDS],
+            *[json.dumps(image.get(f), ensure_ascii=False) if f in image else None
+              for f in LIST_FIELDS],
+            json.dumps(extra, ensure_ascii=False) if extra else None
+        )
+
+    # ---- 읽기 ----
+
+    def get_meta(self) -> Dict:
+        """인덱스 메타 정보 (images 제외)"""
+        rows = self.conn.execute("SELECT key, value FROM meta").fetchall()
+        return {row['key']: json.loads(row['value']) for row in rows}
+
+    def count(self) -> int:
+        """저장된 이미지 수"""
+        return self.conn.execute("SELECT COUNT(*) FROM images").fetchone()[0]
+
+    def iter_images(self, fields: Optional[List[str]] = None, batch_size: int = 500) -> Iterator[Dict]:
+        """
+        이미지 행을 순서대로 하나씩 반환
+
+        Args:
+            fields: 가져올 필드 목록 (None이면 전체)
+            batch_size: 커서에서 한 번에 가져올 행 수
+        """
+        cursor = self.conn.execute(
+            f"SELECT {self._select_columns(fields)} FROM images ORDER BY position"
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield self._from_row(row, fields)
+
+    def get_image(self, image_id: str, fields: Optional[List[str]] = None) -> Optional[Dict]:
+        """id로 이미지 한 건 조회"""
+        row = self.conn.execute(
+            f"SELECT {self._select_columns(fields)} FROM images WHERE id = ?", (image_id,)
+        ).fetchone()
+        return self._from_row(row, fields) if row else None
+
+    def get_image_at(self, i: int, fields: Optional[List[str]] = None) -> Dict:
+        """순서 기준 i번째 이미지 조회"""
+        row = self.conn.execute(
+            f"SELECT {self._select_columns(fields)} FROM images WHERE position = ?", (i,)
+        ).fetchone()
+        if row is None:
+            raise IndexError("image index out of range")
+        return self._from_row(row, fields)
+
+    def get_images_between(self, start: int, stop: int, fields: Optional[List[str]] = None) -> List[Dict]:
+        """순서 기준 start 이상 stop 미만 이미지 조회"""
+        rows = self.conn.execute(
+            f"SELECT {self._select_columns(fields)} FROM images "
+            f"WHERE position >= ? AND position < ? ORDER BY position",
+            (start, stop)
+        ).fetchall()
+        return [self._from_row(row, fields) for row in rows]
+
+    def as_index(self, fields: Optional[List[str]] = None) -> Dict:
+        """
+        기존 인덱스 dict와 같은 모양의 지연 로드 뷰 반환
+
+        뷰는 이 저장소의 연결을 그대로 쓰므로, 다 쓰면 index['images'].close()
+        (또는 저장소 close)로 연결을 닫습니다.
+        """
+        index = self.get_meta()
+        index['images'] = LazyImageList(self, fields)
+        return index
+
+    def to_dict(self) -> Dict:
+        """전체 인덱스를 JSON 스키마 dict로 구체화"""
+        index = self.get_meta()
+        index['images'] = list(self.iter_images())
+        return index
+
+    def _select_columns(self, fields: Optional[List[str]]) -> str:
+        if not fields:
+            return '*'
+        columns = {'id'}
+        for field in fields:
+            if field in SCALAR_FIELDS or field in LIST_FIELDS:
+                columns.add(field)
+            elif field != 'id':
+                columns.add('extra')
+        return ', '.join(sorted(columns))
+
+    def _from_row(self, row: sqlite3.Row, fields: Optional[List[str]]) -> Dict:
+        keys = row.keys()
+        image = {'id': row['id']}
+        for field in SCALAR_FIELDS:
+            if field in keys and row[field] is not None:
+                image[field] = row[field]
+        for field in LIST_FIELDS:
+            if field in keys and row[field] is not None:
+                image[field] = json.loads(row[field])
+        if 'extra' in keys and row['extra']:
+            image.update(json.loads(row['extra']))
+        if fields:
+            image = {k: v for k, v in image.items() if k in fields or k == 'id'}
+        return image
+
+
+def migrate_json_to_store(json_path: str, db_path: str) -> str:
+    """image_index.json을 SQLite 저장소로 변환"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        index = json.load(f)
+
+    with ImageIndexStore(db_path) as store:
+        store.write_index(index)
+        count = store.count()
+
+    print(f"💾 인덱스 변환 완료: {json_path} → {db_path} ({count}개 이미지)")
+    return db_path
+
+
+def export_store_to_json(db_path: str, json_path: str) -> str:
+    """SQLite 저장소를 image_index.json 형식으로 내보내기"""
+    with ImageIndexStore(db_path) as store:
+        index = store.to_dict()
+
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+
+    print(f"💾 인덱스 내보내기 완료: {db_path} → {json_path} ({len(index['images'])}개 이미지)")
+    return json_path
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 3:
+        print("사용법: python image_index_store.py <원본> <대상>")
+        print("  image_index.json image_index.db  → SQLite로 변환")
+        print("  image_index.db image_index.json  → JSON으로 내보내기")
+        sys.exit(1)
+
+    src, dst = sys.argv[1], sys.argv[2]
+    if not os.path.exists(src):
+        print(f"❌ 파일이 없습니다: {src}")
+        sys.exit(1)
+
+    if is_store_path(dst):
+        migrate_json_to_store(src, dst)
+    else:
+        export_store_to_json(src, dst)
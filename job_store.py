@@ -0,0 +1,293 @@
+"""
+블로그 포스팅 작업 저장소
+
+본문 생성 → 워드+이미지 → 업로드 단계가 주고받는 포스트(제목, 본문, 카테고리, 예약 시간,
+이미지/워드 경로)와 단계별 상태를 SQLite(WAL)에 저장합니다.
+각 단계는 행 단위로 읽고 갱신하므로 워크북 전체를 다시 쓰거나 동시에 같은 파일을 덮어쓰지 않습니다.
+
+blog*.xlsx는 입력/확인용 화면 역할만 합니다.
+- sync_excel(): 엑셀이 마지막 동기화 이후 수정되었으면 작업 저장소로 가져오기
+- export_excel(): 단계가 끝난 뒤 저장소 내용을 엑셀에 다시 기록
+"""
+
+import os
+import glob
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+DEFAULT_JOB_DB_PATH = "blog_jobs.db"
+
+# 단계 이름 (순서대로)
+STAGES = ["generate", "document", "upload"]
+
+# 단계 상태
+DONE = "done"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+# 엑셀 열: A 제목, B 본문, C 카테고리, D 발행시간, E 이미지 경로(쉼표 구분)
+EXCEL_COLUMNS = ["title", "content", "category", "schedule_time", "image_paths"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    name TEXT PRIMARY KEY,
+    path TEXT,
+    synced_mtime REAL,
+    imported_at TEXT
+);
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch TEXT NOT NULL,
+    row INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT,
+    category TEXT,
+    schedule_time TEXT,
+    image_paths TEXT,
+    word_file TEXT,
+    updated_at TEXT,
+    UNIQUE (batch, row)
+);
+CREATE TABLE IF NOT EXISTS post_stages (
+    post_id INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    state TEXT NOT NULL,
+    error TEXT,
+    updated_at TEXT,
+    PRIMARY KEY (post_id, stage)
+);
+"""
+
+# update_post로 바꿀 수 있는 항목
+_POST_FIELDS = {"title", "content", "category", "schedule_time", "image_paths", "word_file"}
+
+
+def find_latest_excel(directory: str = None) -> str:
+    """directory(기본: 현재 디렉토리)에서 가장 최근 blog*.xlsx"""
+    files = glob.glob(os.path.join(directory or os.getcwd(), "blog*.xlsx"))
+    if not files:
+        raise FileNotFoundError("blog+날짜.xlsx 파일을 찾을 수 없습니다.")
+    return max(files, key=os.path.getmtime)
+
+
+def format_schedule(value) -> Optional[str]:
+    """엑셀 발행시간 값(datetime 또는 문자열)을 'YYYY-MM-DD HH:MM' 문자열로"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M")
+    return str(value).strip() or None
+
+
+class JobStore:
+    """SQLite 기반 포스팅 작업 저장소"""
+
+    def __init__(self, db_path: str = DEFAULT_JOB_DB_PATH):
+        """
+        Args:
+            db_path: 저장소 파일 경로 (GUI와 워커가 같은 파일을 공유)
+        """
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+        self.lock = threading.Lock()
+
+    def close(self):
+        """연결 종료"""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    # ==================== 엑셀 연동 ====================
+
+    def sync_excel(self, excel_path: str = None) -> str:
+        """
+        엑셀을 작업 저장소와 맞춤 (마지막 동기화 이후 수정된 경우에만 가져오기)
+
+        Args:
+            excel_path: 엑셀 경로 (None이면 가장 최근 blog*.xlsx)
+
+        Returns:
+            배치 이름 (엑셀 파일명)
+        """
+        excel_path = os.path.abspath(excel_path or find_latest_excel())
+        batch = os.path.basename(excel_path)
+        with self.lock:
+            row = self.conn.execute("SELECT synced_mtime FROM batches WHERE name = ?", (batch,)).fetchone()
+        if row is None or row["synced_mtime"] is None or os.path.getmtime(excel_path) > row["synced_mtime"]:
+            self.import_excel(excel_path)
+        return batch
+
+    def import_excel(self, excel_path: str) -> str:
+        """
+        엑셀 행을 작업 저장소로 가져오기
+
+        제목이 바뀐 행은 새 포스트로 보고 본문/워드/단계 상태를 초기화합니다.
+        엑셀의 본문·이미지 칸이 비어 있으면 저장소에 있는 값(생성 결과)을 유지합니다.
+        """
+        from workbook_io import iter_rows
+
+        excel_path = os.path.abspath(excel_path)
+        batch = os.path.basename(excel_path)
+        rows = [(row, values) for row, values in iter_rows(excel_path, EXCEL_COLUMNS) if values["title"]]
+
+        now = datetime.now().isoformat()
+        with self.lock, self.conn:
+            existing = {r["row"]: r for r in self.conn.execute("SELECT * FROM posts WHERE batch = ?", (batch,))}
+            for row, values in rows:
+                title = str(values["title"]).strip()
+                content = values["content"] or None
+                category = values["category"] or None
+                schedule_time = format_schedule(values["schedule_time"])
+                image_paths = self._encode_images(values["image_paths"])
+                old = existing.pop(row, None)
+
+                if old is None:
+                    self.conn.execute(
+                        "INSERT INTO posts (batch, row, title, content, category, schedule_time, image_paths, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (batch, row, title, content, category, schedule_time, image_paths, now)
+                    )
+                elif old["title"] != title:
+                    self.conn.execute("DELETE FROM post_stages WHERE post_id = ?", (old["id"],))
+                    self.conn.execute(
+                        "UPDATE posts SET title = ?, content = ?, category = ?, schedule_time = ?, image_paths = ?, "
+                        "word_file = NULL, updated_at = ? WHERE id = ?",
+                        (title, content, category, schedule_time, image_paths, now, old["id"])
+                    )
+                else:
+                    self.conn.execute(
+                        "UPDATE posts SET content = COALESCE(?, content), category = ?, schedule_time = ?, "
+                        "image_paths = COALESCE(?, image_paths), updated_at = ? WHERE id = ?",
+                        (content, category, schedule_time, image_paths, now, old["id"])
+                    )
+
+            # 엑셀에서 지운 행
+            for old in existing.values():
+                self.conn.execute("DELETE FROM post_stages WHERE post_id = ?", (old["id"],))
+                self.conn.execute("DELETE FROM posts WHERE id = ?", (old["id"],))
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO batches (name, path, synced_mtime, imported_at) VALUES (?, ?, ?, ?)",
+                (batch, excel_path, os.path.getmtime(excel_path), now)
+            )
+        print(f"작업 저장소로 가져오기: {batch} ({len(rows)}개 행)")
+        return batch
+
+    def export_excel(self, batch: str) -> Optional[str]:
+        """
+        저장소 내용을 배치의 엑셀 파일에 기록 (엑셀이 열려 있어 저장할 수 없으면 None)
+        """
+        from workbook_io import write_columns
+
+        with self.lock:
+            row = self.conn.execute("SELECT path FROM batches WHERE name = ?", (batch,)).fetchone()
+        if row is None or not os.path.exists(row["path"]):
+            return None
+        excel_path = row["path"]
+
+        updates = {}
+        for post in self.get_posts(batch):
+            cells = {"B": post["content"], "C": post["category"], "D": post["schedule_time"]}
+            if post["image_paths"]:
+                cells["E"] = ", ".join(post["image_paths"])
+            updates[post["row"]] = cells
+        try:
+            write_columns(excel_path, updates)
+        except PermissionError as e:
+            print(f"⚠️ 엑셀 저장 실패 (파일이 열려 있는지 확인하세요): {e}")
+            return None
+
+        with self.lock, self.conn:
+            self.conn.execute("UPDATE batches SET synced_mtime = ? WHERE name = ?",
+                              (os.path.getmtime(excel_path), batch))
+        return excel_path
+
+    # ==================== 조회/갱신 ====================
+
+    def get_posts(self, batch: str, require_content: bool = False) -> List[Dict]:
+        """배치의 포스트 목록 (행 순서)"""
+        query = "SELECT * FROM posts WHERE batch = ?"
+        if require_content:
+            query += " AND content IS NOT NULL AND content != ''"
+        with self.lock:
+            rows = self.conn.execute(query + " ORDER BY row", (batch,)).fetchall()
+            stages = self.conn.execute(
+                "SELECT s.post_id, s.stage, s.state FROM post_stages s JOIN posts p ON p.id = s.post_id "
+                "WHERE p.batch = ?", (batch,)
+            ).fetchall()
+        status = {}
+        for s in stages:
+            status.setdefault(s["post_id"], {})[s["stage"]] = s["state"]
+        return [self._to_post(r, status.get(r["id"], {})) for r in rows]
+
+    def get_post(self, post_id: int) -> Optional[Dict]:
+        with self.lock:
+            row = self.conn.execute("SELECT * FROM posts WHERE id = ?", (post_id,)).fetchone()
+            stages = self.conn.execute("SELECT stage, state FROM post_stages WHERE post_id = ?", (post_id,)).fetchall()
+        return self._to_post(row, {s["stage"]: s["state"] for s in stages}) if row else None
+
+    def update_post(self, post_id: int, **fields):
+        """포스트 항목 갱신 (예: content=..., word_file=...)"""
+        unknown = set(fields) - _POST_FIELDS
+        if unknown:
+            raise ValueError(f"알 수 없는 항목: {', '.join(sorted(unknown))}")
+        if "image_paths" in fields:
+            fields["image_paths"] = self._encode_images(fields["image_paths"])
+        if "schedule_time" in fields:
+            fields["schedule_time"] = format_schedule(fields["schedule_time"])
+        if not fields:
+            return
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with self.lock, self.conn:
+            self.conn.execute(f"UPDATE posts SET {assignments}, updated_at = ? WHERE id = ?",
+                              (*fields.values(), datetime.now().isoformat(), post_id))
+
+    def get_scheduled(self) -> List[Dict]:
+        """발행 시간이 정해진 모든 배치의 포스트 (id, batch, category, schedule_time, uploaded)"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT p.id, p.batch, p.category, p.schedule_time, s.state AS upload_state FROM posts p "
+                "LEFT JOIN post_stages s ON s.post_id = p.id AND s.stage = 'upload' "
+                "WHERE p.schedule_time IS NOT NULL AND p.schedule_time != ''"
+            ).fetchall()
+        return [{"id": r["id"], "batch": r["batch"], "category": r["category"],
+                 "schedule_time": r["schedule_time"], "uploaded": r["upload_state"] == DONE} for r in rows]
+
+    def set_schedules(self, timetable: Dict[int, object]):
+        """여러 포스트의 발행 시간을 한 트랜잭션으로 기록 ({포스트 id: 시간})"""
+        now = datetime.now().isoformat()
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "UPDATE posts SET schedule_time = ?, updated_at = ? WHERE id = ?",
+                [(format_schedule(when), now, post_id) for post_id, when in timetable.items()]
+            )
+
+    def set_stage(self, post_id: int, stage: str, state: str, error: str = None):
+        """포스트의 단계 상태 기록"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO post_stages (post_id, stage, state, error, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (post_id, stage, state, error, datetime.now().isoformat())
+            )
+
+    @staticmethod
+    def _encode_images(value) -> Optional[str]:
+        if not value:
+            return None
+        if isinstance(value, str):
+            value = [p.strip() for p in value.split(",")]
+        paths = [p for p in value if p]
+        return json.dumps(paths, ensure_ascii=False) if paths else None
+
+    @staticmethod
+    def _to_post(row: sqlite3.Row, status: Dict[str, str]) -> Dict:
+        post = dict(row)
+        post["image_paths"] = json.loads(post["image_paths"]) if post["image_paths"] else []
+        post["status"] = status
+        return post
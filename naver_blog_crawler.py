@@ -6,47 +6,37 @@
 
 import os
 import json
-import time
 from datetime import datetime
-from typing import Dict, List, Optional
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from typing import Dict, Iterable, List, Optional
 import google.generativeai as genai
+from blog_crawl_engine import BlogCrawlEngine
+from dom_probe import structure_from_counts
+from driver_pool import DriverPool, run_parallel
+from style_profile import StyleProfileAggregator
 
 
 class NaverBlogCrawler:
     """네이버 블로그 크롤러"""
 
-    def __init__(self, headless: bool = False):
+    def __init__(self, headless: bool = False, use_cache: bool = True, use_http: bool = True,
+                 driver_pool: Optional[DriverPool] = None, engine: Optional[BlogCrawlEngine] = None):
         """
         Args:
             headless: 헤드리스 모드 실행 여부
+            use_cache: 이미 수집한 포스트는 크롤링 캐시에서 읽기
+            use_http: 공개 포스트는 브라우저 없이 HTTP로 수집 (실패 시 Chrome 사용)
+            driver_pool: 공유 WebDriver 풀 (병렬 크롤링 시 필요)
+            engine: 다른 도구와 공유할 크롤링 엔진 (None이면 새로 생성)
         """
-        self.headless = headless
-        self.driver = None
+        self.engine = engine or BlogCrawlEngine(headless, use_cache, use_http, driver_pool)
 
     def init_driver(self):
         """WebDriver 초기화"""
-        options = Options()
-        if self.headless:
-            options.add_argument('--headless')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-
-        self.driver = webdriver.Chrome(options=options)
-        print("✅ WebDriver 초기화 완료")
+        self.engine.init_driver()
 
     def close_driver(self):
-        """WebDriver 종료"""
-        if self.driver:
-            self.driver.quit()
-            print("✅ WebDriver 종료")
+        """WebDriver 종료 (풀 사용 시 반납)"""
+        self.engine.close_driver()
 
     def get_blog_post_urls(self, blog_id: str, max_posts: int = 10) -> List[str]:
         """
@@ -59,202 +49,107 @@ class NaverBlogCrawler:
         Returns:
             포스트 URL 목록
         """
-        if not self.driver:
-            self.init_driver()
-
-        blog_url = f"https://blog.naver.com/{blog_id}"
-        self.driver.get(blog_url)
-        time.sleep(3)
-
-        post_urls = []
-
-        try:
-            # iframe으로 전환
-            self.driver.switch_to.frame("mainFrame")
-
-            # 포스트 링크 찾기
-            post_links = self.driver.find_elements(By.CSS_SELECTOR, "a.link_title")
-
-            for link in post_links[:max_posts]:
-                url = link.get_attribute('href')
-                if url:
-                    post_urls.append(url)
+        return self.engine.get_post_urls(blog_id, max_posts)
 
-            self.driver.switch_to.default_content()
-
-        except Exception as e:
-            print(f"⚠️ 포스트 URL 수집 실패: {e}")
-            self.driver.switch_to.default_content()
-
-        print(f"📝 {len(post_urls)}개의 포스트 URL 수집됨")
-        return post_urls
-
-    def extract_post_content(self, post_url: str) -> Dict:
+    def extract_post_content(self, post_url: str, blog_id: str = None) -> Dict:
         """
         포스트 내용 추출
 
         Args:
             post_url: 포스트 URL
+            blog_id: 캐시에 기록할 블로그 ID
 
         Returns:
             포스트 데이터 (제목, 본문, 이미지 등)
         """
-        if not self.driver:
-            self.init_driver()
-
-        self.driver.get(post_url)
-        time.sleep(2)
-
-        post_data = {
+        record = self.engine.fetch_post(post_url, blog_id)
+        content = record.get('content') or {}
+        return {
             'url': post_url,
-            'title': '',
-            'content': '',
-            'raw_html': '',
-            'images': [],
-            'structure': {},
-            'crawled_at': datetime.now().isoformat()
+            'title': record['title'],
+            'content': content.get('text', ''),
+            'raw_html': content.get('html', ''),
+            'images': content.get('images', []),
+            'structure': record.get('structure') or structure_from_counts({}, None),
+            'crawled_at': record['fetched_at'],
+            'fetch_mode': record['fetch_mode']
         }
 
-        try:
-            # iframe으로 전환
-            self.driver.switch_to.frame("mainFrame")
-
-            # 제목
-            try:
-                title_elem = self.driver.find_element(By.CSS_SELECTOR, ".se-title-text")
-                post_data['title'] = title_elem.text
-            except NoSuchElementException:
-                pass
-
-            # 본문 내용 (텍스트)
-            try:
-                content_elem = self.driver.find_element(By.CSS_SELECTOR, ".se-main-container")
-                post_data['content'] = content_elem.text
-                post_data['raw_html'] = content_elem.get_attribute('innerHTML')
-            except NoSuchElementException:
-                pass
-
-            # 이미지 URL 수집
-            try:
-                images = self.driver.find_elements(By.CSS_SELECTOR, "img.se-image-resource")
-                for img in images:
-                    img_url = img.get_attribute('src')
-                    if img_url:
-                        post_data['images'].append(img_url)
-            except NoSuchElementException:
-                pass
-
-            # 구조 분석 (문단, 제목 등)
-            post_data['structure'] = self._analyze_structure()
-
-            self.driver.switch_to.default_content()
-
-        except Exception as e:
-            print(f"⚠️ 포스트 내용 추출 실패: {e}")
-            self.driver.switch_to.default_content()
-
-        return post_data
-
-    def _analyze_structure(self) -> Dict:
-        """포스트 구조 분석 (iframe 내부에서 호출)"""
-        structure = {
-            'has_heading': False,
-            'has_subheading': False,
-            'has_bold': False,
-            'has_italic': False,
-            'has_list': False,
-            'has_link': False,
-            'has_quote': False,
-            'paragraph_count': 0,
-            'image_count': 0,
-            'text_align': 'left'  # 기본값
-        }
-
-        try:
-            # 제목 태그
-            if self.driver.find_elements(By.CSS_SELECTOR, ".se-text-heading"):
-                structure['has_heading'] = True
-
-            # 부제목
-            if self.driver.find_elements(By.CSS_SELECTOR, ".se-text-subheading"):
-                structure['has_subheading'] = True
-
-            # 볼드
-            if self.driver.find_elements(By.CSS_SELECTOR, "strong, b"):
-                structure['has_bold'] = True
-
-            # 이탤릭
-            if self.driver.find_elements(By.CSS_SELECTOR, "em, i"):
-                structure['has_italic'] = True
-
-            # 리스트
-            if self.driver.find_elements(By.CSS_SELECTOR, "ul, ol"):
-                structure['has_list'] = True
-
-            # 링크
-            if self.driver.find_elements(By.CSS_SELECTOR, "a"):
-                structure['has_link'] = True
-
-            # 인용구
-            if self.driver.find_elements(By.CSS_SELECTOR, "blockquote"):
-                structure['has_quote'] = True
-
-            # 문단 수
-            paragraphs = self.driver.find_elements(By.CSS_SELECTOR, ".se-text-paragraph")
-            structure['paragraph_count'] = len(paragraphs)
-
-            # 이미지 수
-            images = self.driver.find_elements(By.CSS_SELECTOR, "img.se-image-resource")
-            structure['image_count'] = len(images)
-
-            # 텍스트 정렬 (첫 번째 문단 기준)
-            if paragraphs:
-                text_align = paragraphs[0].value_of_css_property('text-align')
-                structure['text_align'] = text_align
-
-        except Exception as e:
-            print(f"⚠️ 구조 분석 중 오류: {e}")
-
-        return structure
-
-    def crawl_blog(self, blog_id: str, max_posts: int = 5) -> List[Dict]:
+    def crawl_blog(self, blog_id: str, max_posts: int = 5, max_workers: int = 1,
+                   only_new: bool = False) -> List[Dict]:
         """
         블로그 전체 크롤링
 
         Args:
             blog_id: 블로그 ID
             max_posts: 수집할 최대 포스트 개수
+            max_workers: 포스트 동시 수집 수 (driver_pool이 있을 때만 적용)
+            only_new: 캐시에 있는 마지막 포스트 이후 발행된 글만 수집
 
         Returns:
-            포스트 데이터 리스트
+            포스트 데이터 리스트 (RSS에서 찾은 경우 published_at 포함)
         """
         print(f"\n🕷️ 블로그 크롤링 시작: {blog_id}")
         print("="*60)
 
-        # 포스트 URL 수집
-        post_urls = self.get_blog_post_urls(blog_id, max_posts)
+        # 포스트 목록 수집 (RSS 우선)
+        since_log_no = self.engine.latest_log_no(blog_id) if only_new else None
+        entries = self.engine.discover_posts(blog_id, max_posts, since_log_no)
 
-        if not post_urls:
+        if not entries:
             print("❌ 수집된 포스트가 없습니다")
             return []
 
         # 각 포스트 내용 추출
-        posts = []
-        for i, url in enumerate(post_urls, 1):
-            print(f"\n[{i}/{len(post_urls)}] 크롤링: {url}")
-            post_data = self.extract_post_content(url)
+        def crawl_post(item):
+            i, entry = item
+            with self.engine.pooled_session():
+                return self._crawl_post(blog_id, entry, f"{i}/{len(entries)}")
+
+        workers = max_workers if self.engine.driver_pool else 1
+        results = run_parallel(enumerate(entries, 1), crawl_post, workers)
+        return [post for post in results if post]
+
+    def _crawl_post(self, blog_id: str, entry: Dict, label: str) -> Optional[Dict]:
+        """포스트 하나 수집 (엔진 캐시 우선)"""
+        url = entry['url']
+        print(f"\n[{label}] 크롤링: {url}")
+
+        post_data = self.extract_post_content(url, blog_id)
+        post_data['published_at'] = entry.get('published_at')
+
+        if not post_data['title']:
+            print("  ⚠️ 내용 추출 실패")
+            return None
+
+        print(f"  ✅ 제목: {post_data['title'][:50]}...")
+        print(f"     본문: {len(post_data['content'])}자")
+        print(f"     이미지: {len(post_data['images'])}개")
+        return post_data
 
-            if post_data['title']:
-                print(f"  ✅ 제목: {post_data['title'][:50]}...")
-                print(f"     본문: {len(post_data['content'])}자")
-                print(f"     이미지: {len(post_data['images'])}개")
-                posts.append(post_data)
-            else:
-                print("  ⚠️ 내용 추출 실패")
+    def crawl_blogs(self, blog_ids: List[str], max_posts: int = 5,
+                    max_workers: int = 4, post_workers: int = 1,
+                    only_new: bool = False) -> Dict[str, List[Dict]]:
+        """
+        여러 블로그 동시 크롤링 (driver_pool 필요)
 
-            time.sleep(2)  # 요청 간격
+        Args:
+            blog_ids: 블로그 ID 목록
+            max_posts: 블로그당 최대 포스트 개수
+            max_workers: 블로그 동시 처리 수
+            post_workers: 블로그별 포스트 동시 수집 수
+            only_new: 블로그별로 마지막 수집 이후 발행된 글만 수집
 
-        return posts
+        Returns:
+            {blog_id: 포스트 데이터 리스트}
+        """
+        def crawl(blog_id):
+            with self.engine.pooled_session():
+                return self.crawl_blog(blog_id, max_posts, post_workers, only_new)
+
+        workers = max_workers if self.engine.driver_pool else 1
+        results = run_parallel(blog_ids, crawl, workers)
+        return {blog_id: posts or [] for blog_id, posts in zip(blog_ids, results)}
 
     def save_to_json(self, blog_id: str, posts: List[Dict], filename: str = None):
         """크롤링 결과를 JSON으로 저장"""
@@ -287,39 +182,30 @@ class BlogStyleAnalyzer:
         genai.configure(api_key=self.gemini_api_key)
         self.model = genai.GenerativeModel('gemini-1.5-flash')
 
-    def analyze_blog_style(self, posts: List[Dict]) -> Dict:
+    def analyze_blog_style(self, posts: Iterable[Dict], profile: Optional[StyleProfileAggregator] = None) -> Dict:
         """
         블로그 포스트들을 분석해서 스타일 추출
 
         Args:
-            posts: 포스트 데이터 리스트
+            posts: 포스트 데이터 (하나씩 프로필에 반영하므로 제너레이터도 가능)
+            profile: 이어서 누적할 기존 프로필 (None이면 새로 생성)
 
         Returns:
             스타일 분석 결과
         """
-        if not posts:
+        profile = profile or StyleProfileAggregator()
+        profile.add_posts(posts)
+
+        if not profile.post_count:
             return {}
 
         print("\n🔍 블로그 스타일 분석 중...")
 
         # 전체 포스트 정보 요약
-        summary = {
-            'total_posts': len(posts),
-            'avg_content_length': sum(len(p['content']) for p in posts) / len(posts),
-            'avg_image_count': sum(len(p['images']) for p in posts) / len(posts),
-            'structure_patterns': self._aggregate_structures([p['structure'] for p in posts])
-        }
-
-        # 샘플 텍스트 추출 (처음 3개 포스트)
-        sample_texts = []
-        for post in posts[:3]:
-            sample_texts.append({
-                'title': post['title'],
-                'content': post['content'][:500]  # 처음 500자만
-            })
+        summary = profile.blog_summary()
 
-        # Gemini로 스타일 분석
-        ai_analysis = self._analyze_with_gemini(sample_texts, summary)
+        # Gemini로 스타일 분석 (프로필에 보관된 샘플 사용)
+        ai_analysis = self._analyze_with_gemini(profile.samples, summary)
 
         # 최종 결과 통합
         style_profile = {
@@ -330,29 +216,6 @@ class BlogStyleAnalyzer:
 
         return style_profile
 
-    def _aggregate_structures(self, structures: List[Dict]) -> Dict:
-        """구조 패턴 집계"""
-        if not structures:
-            return {}
-
-        total = len(structures)
-        aggregated = {
-            'heading_usage': sum(s.get('has_heading', False) for s in structures) / total * 100,
-            'bold_usage': sum(s.get('has_bold', False) for s in structures) / total * 100,
-            'list_usage': sum(s.get('has_list', False) for s in structures) / total * 100,
-            'avg_paragraph_count': sum(s.get('paragraph_count', 0) for s in structures) / total,
-            'avg_image_count': sum(s.get('image_count', 0) for s in structures) / total,
-            'common_text_align': self._most_common([s.get('text_align', 'left') for s in structures])
-        }
-
-        return aggregated
-
-    def _most_common(self, items: List) -> str:
-        """가장 많이 사용된 항목"""
-        if not items:
-            return ''
-        return max(set(items), key=items.count)
-
     def _analyze_with_gemini(self, sample_texts: List[Dict], summary: Dict) -> Dict:
         """Gemini를 사용한 스타일 분석"""
         prompt = f"""다음은 네이버 블로그 포스트 샘플입니다. 이 블로그의 작성 스타일을 분석해주세요.
@@ -420,20 +283,26 @@ def main():
         '1234ssem'
     ]
 
-    crawler = NaverBlogCrawler(headless=False)
+    pool = DriverPool(size=2, headless=True)
+    crawler = NaverBlogCrawler(headless=True, driver_pool=pool)
     analyzer = BlogStyleAnalyzer(os.getenv('GEMINI_API_KEY'))
 
     try:
+        # 블로그/포스트 동시 크롤링
+        crawled = crawler.crawl_blogs(blog_ids, max_posts=5, max_workers=4, post_workers=2)
+
         for blog_id in blog_ids:
-            # 크롤링
-            posts = crawler.crawl_blog(blog_id, max_posts=5)
+            posts = crawled[blog_id]
 
             if posts:
                 # JSON 저장
                 json_file = crawler.save_to_json(blog_id, posts)
 
-                # 스타일 분석
-                style_profile = analyzer.analyze_blog_style(posts)
+                # 스타일 분석 (저장된 프로필에 새 포스트만 누적)
+                profile_file = f"blog_profile_{blog_id}.json"
+                profile = StyleProfileAggregator.load(profile_file, blog_id)
+                style_profile = analyzer.analyze_blog_style(posts, profile)
+                profile.save(profile_file)
 
                 # 스타일 프로필 저장
                 style_file = f"blog_style_{blog_id}.json"
@@ -446,7 +315,7 @@ def main():
             print("\n" + "="*60 + "\n")
 
     finally:
-        crawler.close_driver()
+        pool.close()
 
 
 if __name__ == "__main__":
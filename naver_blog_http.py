@@ -0,0 +1,267 @@
+"""
+네이버 블로그 HTTP 수집기
+
+공개 포스트는 브라우저 없이 mainFrame iframe의 원본 주소(PostView.naver)를 직접 요청해
+정적 HTML을 파싱합니다. 구조/스타일 추출은 blog_crawl_engine의 추출기가 담당합니다.
+본문이 스크립트로 렌더링되어 정적 HTML에 없으면 None을 반환하고, 호출 측이 Chrome으로 수집합니다.
+
+포스트 목록은 RSS(rss.blog.naver.com/{blog_id}.xml)에서, RSS가 부족하면
+글 목록 API(PostTitleListAsync.naver)를 페이지 단위로 요청해 발행일과 함께 가져옵니다.
+"""
+
+import re
+import json
+import importlib.util
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional
+from urllib.parse import unquote_plus
+import xml.etree.ElementTree as ET
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
+from crawl_cache import parse_post_url
+
+# lxml이 설치되어 있으면 BeautifulSoup 파서로 사용 (설치 여부만 확인)
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+TITLE_SELECTORS = ["div.se-title-text", "h3.se_textarea", "div.pcol1", ".post_title", ".se-title"]
+CONTENT_SELECTORS = ["div.se-main-container", "div.se_component_wrap", "div#postViewArea", "div.post-view", ".post_ct"]
+
+RSS_URL = "https://rss.blog.naver.com/{blog_id}.xml"
+POST_LIST_URL = ("https://blog.naver.com/PostTitleListAsync.naver?blogId={blog_id}"
+                 "&viewdate=&currentPage={page}&categoryNo=0&parentCategoryNo=&countPerPage={per_page}")
+
+# 스마트에디터 클래스 → 스타일 값 (정적 HTML에는 computed style이 없으므로 클래스로 추정)
+_SE_FONT_SIZE = re.compile(r'se-fs-fs(\d+)')
+_SE_FONT_FAMILY = re.compile(r'se-ff-([\w-]+)')
+_SE_ALIGN = re.compile(r'se-text-paragraph-align-(\w+)')
+
+
+def to_postview_url(url: str) -> Optional[str]:
+    """포스트 URL을 mainFrame iframe이 불러오는 PostView.naver 주소로 변환"""
+    parsed = parse_post_url(url)
+    if not parsed['blog_id'] or not parsed['log_no']:
+        return None
+    return (f"https://blog.naver.com/PostView.naver?blogId={parsed['blog_id']}"
+            f"&logNo={parsed['log_no']}&redirect=Dlog&widgetTypeCall=true&directAccess=false")
+
+
+def parse_inline_style(style: str) -> Dict[str, str]:
+    """style 속성 문자열을 dict로 변환"""
+    result = {}
+    for decl in (style or '').split(';'):
+        if ':' in decl:
+            key, value = decl.split(':', 1)
+            result[key.strip().lower()] = value.strip()
+    return result
+
+
+def element_styles(elem) -> Dict[str, str]:
+    """요소의 인라인 스타일 + 스마트에디터 클래스에서 스타일 추정"""
+    styles = parse_inline_style(elem.get('style', ''))
+    class_name = ' '.join(elem.get('class', []))
+
+    match = _SE_FONT_SIZE.search(class_name)
+    if match and 'font-size' not in styles:
+        styles['font-size'] = f"{match.group(1)}px"
+    match = _SE_FONT_FAMILY.search(class_name)
+    if match and 'font-family' not in styles:
+        styles['font-family'] = match.group(1)
+    match = _SE_ALIGN.search(class_name)
+    if match and 'text-align' not in styles:
+        styles['text-align'] = match.group(1)
+
+    if elem.name in ('b', 'strong'):
+        styles.setdefault('font-weight', '700')
+    if elem.name in ('i', 'em'):
+        styles.setdefault('font-style', 'italic')
+    if elem.name == 'u':
+        styles.setdefault('text-decoration', 'underline')
+    if elem.name in ('s', 'strike', 'del'):
+        styles.setdefault('text-decoration', 'line-through')
+    return styles
+
+
+def post_url(blog_id: str, log_no) -> str:
+    """포스트 표준 URL"""
+    return f"https://blog.naver.com/{blog_id}/{log_no}"
+
+
+def _post_entry(blog_id: str, log_no: str, title: str, published_at: Optional[str], category: str = '') -> Dict:
+    return {
+        'url': post_url(blog_id, log_no),
+        'log_no': str(log_no),
+        'title': title,
+        'published_at': published_at,
+        'category': category
+    }
+
+
+def parse_rss(xml_text: str, blog_id: str) -> List[Dict]:
+    """
+    블로그 RSS에서 포스트 목록 추출 (최신순)
+
+    Returns:
+        [{'url', 'log_no', 'title', 'published_at', 'category'}, ...]
+    """
+    try:
+        root = ET.fromstring(xml_text)
+    except ET.ParseError:
+        return []
+
+    entries = []
+    for item in root.iter('item'):
+        link = item.findtext('link') or item.findtext('guid') or ''
+        log_no = parse_post_url(link)['log_no']
+        if not log_no:
+            continue
+
+        published_at = None
+        pub_date = item.findtext('pubDate')
+        if pub_date:
+            try:
+                published_at = parsedate_to_datetime(pub_date).isoformat()
+            except (TypeError, ValueError):
+                pass
+
+        entries.append(_post_entry(blog_id, log_no, (item.findtext('title') or '').strip(),
+                                   published_at, (item.findtext('category') or '').strip()))
+    return entries
+
+
+def parse_post_list(text: str, blog_id: str) -> List[Dict]:
+    """PostTitleListAsync 응답에서 포스트 목록 추출 (응답에 잘못된 \\' 이스케이프가 섞여 있음)"""
+    try:
+        data = json.loads(text.replace("\\'", "'"))
+    except ValueError:
+        return []
+
+    entries = []
+    for post in data.get('postList', []):
+        log_no = post.get('logNo')
+        if not log_no:
+            continue
+        published_at = None
+        add_date = (post.get('addDate') or '').strip()
+        try:
+            # "2026. 1. 29." 형식만 변환 (최근 글은 "3시간 전"처럼 상대 시간으로 옴)
+            published_at = datetime.strptime(add_date.rstrip('.'), '%Y. %m. %d').isoformat()
+        except ValueError:
+            pass
+        entries.append(_post_entry(blog_id, log_no, unquote_plus(post.get('title', '')), published_at))
+    return entries
+
+
+def select_first(soup, selectors: List[str]):
+    for selector in selectors:
+        elem = soup.select_one(selector)
+        if elem is not None:
+            return elem
+    return None
+
+
+def image_src(img) -> Optional[str]:
+    return img.get('data-lazy-src') or img.get('src')
+
+
+class NaverBlogHttpFetcher:
+    """브라우저 없이 공개 포스트를 수집하는 HTTP 클라이언트"""
+
+    def __init__(self, pool_size: int = 20, timeout: int = 10):
+        """
+        Args:
+            pool_size: 커넥션 풀 크기 (동시 요청 수)
+            timeout: 요청 타임아웃 (초)
+        """
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Referer': 'https://blog.naver.com/'
+        })
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=2)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def close(self):
+        self.session.close()
+
+    def fetch(self, url: str) -> Optional[str]:
+        """URL의 HTML 반환 (실패 시 None)"""
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            if response.status_code != 200:
+                return None
+            response.encoding = response.encoding or 'utf-8'
+            return response.text
+        except requests.RequestException as e:
+            print(f"  ⚠️ HTTP 요청 실패: {e}")
+            return None
+
+    def discover_posts(self, blog_id: str, max_posts: int = 10, since_log_no: int = None,
+                       per_page: int = 30) -> List[Dict]:
+        """
+        포스트 목록 (RSS 우선, 부족하면 글 목록 API 페이지 순회)
+
+        Args:
+            blog_id: 블로그 ID
+            max_posts: 최대 포스트 개수
+            since_log_no: 이 logNo 이하(이미 수집한 포스트)는 제외
+            per_page: 글 목록 API 페이지 크기
+
+        Returns:
+            [{'url', 'log_no', 'title', 'published_at', 'category'}, ...] (최신순)
+        """
+        entries: List[Dict] = []
+        seen = set()
+
+        def collect(new_entries: List[Dict]) -> bool:
+            """목록에 추가, 더 볼 필요가 없으면 True"""
+            for entry in new_entries:
+                if since_log_no is not None and int(entry['log_no']) <= since_log_no:
+                    return True  # 최신순이므로 이후는 모두 수집한 포스트
+                if entry['log_no'] not in seen:
+                    seen.add(entry['log_no'])
+                    entries.append(entry)
+                if len(entries) >= max_posts:
+                    return True
+            return False
+
+        xml_text = self.fetch(RSS_URL.format(blog_id=blog_id))
+        if xml_text and collect(parse_rss(xml_text, blog_id)):
+            return entries
+
+        # RSS가 없거나 max_posts보다 적으면 글 목록 페이지 순회
+        page = 1
+        while len(entries) < max_posts:
+            text = self.fetch(POST_LIST_URL.format(blog_id=blog_id, page=page, per_page=per_page))
+            page_entries = parse_post_list(text, blog_id) if text else []
+            if not page_entries or collect(page_entries) or len(page_entries) < per_page:
+                break
+            page += 1
+
+        return entries
+
+    def fetch_post(self, post_url: str):
+        """
+        포스트의 정적 HTML 파싱 결과
+
+        Returns:
+            (soup, 본문 컨테이너) 또는 본문이 정적 HTML에 없으면 None
+        """
+        postview_url = to_postview_url(post_url)
+        if not postview_url:
+            return None
+
+        html = self.fetch(postview_url)
+        if not html:
+            return None
+
+        soup = BeautifulSoup(html, HTML_PARSER)
+        container = select_first(soup, CONTENT_SELECTORS)
+        if container is None or not container.get_text(strip=True):
+            return None
+        return soup, container
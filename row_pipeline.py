@@ -0,0 +1,240 @@
+"""
+행 단위 스트리밍 파이프라인
+
+엑셀의 각 행을 본문 생성 → 워드+이미지 → 업로드 단계로 흘려보냅니다.
+단계별로 동시 실행 수를 따로 두고, 한 행이 앞 단계를 마치면 바로 다음 단계에 들어가므로
+첫 글은 전체 배치가 아니라 글 하나를 처리하는 시간만에 발행됩니다.
+
+행마다 단계 상태가 바뀔 때 stage_worker.emit_event(kind="row", ...)로 알려
+GUI의 행별 진행 표에 표시됩니다. 본문/워드 경로/단계 상태는 작업 저장소(job_store)에 행 단위로 기록합니다.
+"""
+
+import os
+import tempfile
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from stage_worker import emit_event
+from job_store import JobStore
+
+# 파이프라인 단계 (순서대로)
+PIPELINE_STAGES = ["generate", "document", "upload"]
+
+STAGE_LABELS = {
+    "generate": "본문 생성",
+    "document": "워드+이미지",
+    "upload": "업로드",
+}
+
+# 단계별 동시 실행 수 (업로드는 브라우저 하나를 쓰므로 1)
+STAGE_CONCURRENCY = {
+    "generate": 3,
+    "document": 2,
+    "upload": 1,
+}
+
+# 행 상태
+WAITING = "waiting"
+RUNNING = "running"
+DONE = "done"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+
+class RowPipeline:
+    """행마다 단계를 순서대로 실행하되, 행끼리는 단계별 동시 실행 수만큼 겹쳐 실행"""
+
+    def __init__(self, stages: List[Tuple[str, Callable[[Dict], Optional[bool]], int]],
+                 on_status: Callable[[Dict, str, str], None] = None):
+        """
+        Args:
+            stages: (단계 이름, 행 처리 함수, 동시 실행 수) 목록. 처리 함수가 False를 반환하면 건너뜀으로 기록
+            on_status: 상태 변경 시 호출 (item, 단계 이름, 상태)
+        """
+        self.stages = stages
+        self.on_status = on_status
+        self.executors = [ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix=f"pipeline-{name}")
+                          for name, _, workers in stages]
+        self.pending = 0
+        self.finished = threading.Condition()
+
+    def run(self, items: List[Dict]) -> List[Dict]:
+        """
+        모든 행 처리 (행별 단계 상태는 item['status'][단계]에 기록)
+
+        Returns:
+            items
+        """
+        for item in items:
+            item.setdefault("status", {})
+            for name, _, _ in self.stages:
+                self._set_status(item, name, WAITING)
+
+        with self.finished:
+            self.pending = len(items)
+        try:
+            for item in items:
+                self._submit(item, 0)
+            with self.finished:
+                self.finished.wait_for(lambda: self.pending == 0)
+        finally:
+            for executor in self.executors:
+                executor.shutdown(wait=True)
+        return items
+
+    def _submit(self, item: Dict, index: int):
+        if index >= len(self.stages):
+            with self.finished:
+                self.pending -= 1
+                self.finished.notify_all()
+            return
+        self.executors[index].submit(self._run_stage, item, index)
+
+    def _run_stage(self, item: Dict, index: int):
+        name, func, _ = self.stages[index]
+        self._set_status(item, name, RUNNING)
+        try:
+            result = func(item)
+        except Exception as e:
+            print(f"  ✗ {item.get('row')}행 {STAGE_LABELS.get(name, name)} 실패: {e}")
+            traceback.print_exc()
+            item.setdefault("errors", {})[name] = str(e)
+            self._set_status(item, name, FAILED)
+            # 이후 단계는 진행하지 않음
+            self._submit(item, len(self.stages))
+            return
+        self._set_status(item, name, SKIPPED if result is False else DONE)
+        self._submit(item, index + 1)
+
+    def _set_status(self, item: Dict, stage: str, state: str):
+        item["status"][stage] = state
+        if self.on_status:
+            try:
+                self.on_status(item, stage, state)
+            except Exception:
+                pass
+
+
+class BlogRowStages:
+    """작업 저장소의 포스트를 본문 생성/워드 생성/업로드하는 단계 함수 모음"""
+
+    def __init__(self, store: JobStore, batch: str, generate_images: bool = True, image_provider: str = "dalle"):
+        # 워커에서 실행하면 이미 import된 모듈(모델, 로그인된 브라우저)을 그대로 재사용
+        import create
+        import create_word
+        self.create = create
+        self.create_word = create_word
+        self.upload_bot = None
+        self.store = store
+        self.batch = batch
+        self.generate_images = generate_images
+        self.image_provider = image_provider
+        # 워드 이미지 임시 파일 폴더 (close에서 삭제)
+        self._temp = tempfile.TemporaryDirectory()
+        self.temp_dir = self._temp.name
+
+    def close(self):
+        """임시 폴더 삭제"""
+        self._temp.cleanup()
+
+    def load_rows(self) -> List[Dict]:
+        items = self.store.get_posts(self.batch)
+        for item in items:
+            item["stored_status"] = item.pop("status")
+        return items
+
+    def generate(self, item: Dict):
+        """본문이 비어 있는 행만 생성"""
+        if item.get("content"):
+            return False
+        print(f"[{item['row']}행] 본문 생성: {item['title']}")
+        item["content"] = self.create.generate_title_content(item["title"])
+        self.store.update_post(item["id"], content=item["content"])
+
+    def document(self, item: Dict):
+        """이미 업로드했거나 현재 본문으로 만든 문서가 있으면 건너뜀"""
+        skip, docx_path = self.create_word.skip_document(item["row"], item["title"], item["content"],
+                                                         item["stored_status"])
+        if skip:
+            if docx_path:
+                item["word_file"] = docx_path
+            return False
+        print(f"[{item['row']}행] 워드+이미지 생성")
+        item["word_file"] = self.create_word.create_row_document(
+            item["row"], item["title"], item["content"],
+            generate_images=self.generate_images, image_provider=self.image_provider
+        )
+        self.store.update_post(item["id"], word_file=item["word_file"])
+
+    def upload(self, item: Dict):
+        """이미 업로드한 포스트는 건너뜀"""
+        if item["stored_status"].get("upload") == DONE:
+            return False
+        if self.upload_bot is None:
+            import upload_bot
+            self.upload_bot = upload_bot
+        self.upload_bot.ensure_login()
+
+        word_file = item.get("word_file")
+        content_sequence = None
+        if word_file and os.path.exists(word_file):
+            content_sequence = self.upload_bot.extract_from_word_sequence(word_file, self.temp_dir)
+        try:
+            self.upload_bot.upload_post(item["row"], item["title"], item["content"], item["category"],
+                                        item["schedule_time"], item["image_paths"], content_sequence)
+        except Exception:
+            try:
+                self.upload_bot.driver.switch_to.default_content()
+            except Exception:
+                pass
+            raise
+
+    def pipeline_stages(self) -> List[Tuple[str, Callable[[Dict], Optional[bool]], int]]:
+        return [(name, getattr(self, name), STAGE_CONCURRENCY[name]) for name in PIPELINE_STAGES]
+
+    def report_status(self, item: Dict, stage: str, state: str):
+        """상태를 작업 저장소에 기록하고 GUI에 전달"""
+        if state in (DONE, SKIPPED, FAILED) and not (state == SKIPPED and item["stored_status"].get(stage)):
+            self.store.set_stage(item["id"], stage, state, item.get("errors", {}).get(stage))
+        emit_event(kind="row", row=item["row"], title=item["title"], stage=stage, state=state)
+
+
+def main():
+    store = JobStore()
+    try:
+        try:
+            batch = store.sync_excel()
+        except FileNotFoundError:
+            print("blog*.xlsx 파일을 찾을 수 없습니다.")
+            raise SystemExit(1)
+        print(f"엑셀 파일: {batch}")
+
+        stages = BlogRowStages(store, batch)
+        try:
+            items = stages.load_rows()
+            if not items:
+                print("처리할 제목이 없습니다.")
+                return
+            print(f"총 {len(items)}개 행을 처리합니다. "
+                  + ", ".join(f"{STAGE_LABELS[name]} {STAGE_CONCURRENCY[name]}개" for name in PIPELINE_STAGES) + " 동시 실행\n")
+
+            try:
+                RowPipeline(stages.pipeline_stages(), on_status=stages.report_status).run(items)
+            finally:
+                # 생성된 본문을 엑셀에도 반영
+                store.export_excel(batch)
+
+            failed = [item for item in items if FAILED in item["status"].values()]
+            uploaded = sum(1 for item in items if item["status"].get("upload") == DONE)
+            print(f"\n완료: 업로드 {uploaded}개, 실패 {len(failed)}개")
+            if failed and not uploaded:
+                raise SystemExit(1)
+        finally:
+            stages.close()
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+예약 발행 시간표 계산
+
+대기 중인 포스트 전체에 대해 한 번에 발행 시간을 배정합니다.
+- 같은 계정의 글 사이 최소 간격
+- 같은 카테고리 글 사이 최소 간격
+- 발행 제외 시간대 (예: 0~7시)
+- 계정별 하루 최대 발행 수
+- 이미 예약/발행된 글(장부)과 겹치지 않도록 슬롯 확보
+
+계정마다 시간 순으로 한 번 훑으며 장부는 정렬된 목록에서 이분 탐색하므로
+포스트 n개, 장부 m개에 대해 O((n + m) log m)로 계산됩니다.
+"""
+
+import bisect
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 네이버 예약 발행의 분 단위 (10분)
+SLOT_MINUTES = 10
+
+
+def parse_schedule(value) -> Optional[datetime]:
+    """'YYYY-MM-DD HH:MM' 문자열 또는 datetime → datetime (형식이 다르면 None)"""
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return None
+    try:
+        return datetime.strptime(str(value).strip(), "%Y-%m-%d %H:%M")
+    except ValueError:
+        return None
+
+
+def blackout_hours(start_hour: int, end_hour: int) -> List[int]:
+    """start_hour 이상 end_hour 미만 시간대 (자정을 넘는 22~6 같은 범위 지원, 같으면 없음)"""
+    if start_hour == end_hour:
+        return []
+    if start_hour < end_hour:
+        return list(range(start_hour, end_hour))
+    return list(range(start_hour, 24)) + list(range(0, end_hour))
+
+
+class _AccountLedger:
+    """계정 하나의 예약 현황 (정렬된 시간 목록, 카테고리별 시간 목록, 날짜별 개수)"""
+
+    def __init__(self):
+        self.times: List[datetime] = []
+        self.by_category: Dict[str, List[datetime]] = defaultdict(list)
+        self.day_counts: Dict = defaultdict(int)
+
+    def add(self, when: datetime, category: str = None):
+        bisect.insort(self.times, when)
+        if category:
+            bisect.insort(self.by_category[category], when)
+        self.day_counts[when.date()] += 1
+
+    @staticmethod
+    def conflict(times: List[datetime], when: datetime, gap: timedelta) -> Optional[datetime]:
+        """when과 gap 미만으로 붙어 있는 가장 늦은 시간 (없으면 None)"""
+        if not times or gap <= timedelta(0):
+            return None
+        # (when - gap, when + gap) 구간에 있는 마지막 항목
+        index = bisect.bisect_left(times, when + gap) - 1
+        if index >= 0 and times[index] > when - gap:
+            return times[index]
+        return None
+
+
+class SchedulePlanner:
+    """제약 조건을 지키는 발행 시간표 계산기"""
+
+    def __init__(self, start: datetime, interval_minutes: int = 30, category_spacing_minutes: int = 0,
+                 blocked_hours: Iterable[int] = (), daily_cap: int = 0):
+        """
+        Args:
+            start: 가장 이른 발행 시간 (시각은 하루 발행 시작 시각으로도 사용 - 하루 최대 발행 수를 넘기면 다음 날 이 시각부터 배정)
+            interval_minutes: 같은 계정 글 사이 최소 간격
+            category_spacing_minutes: 같은 카테고리 글 사이 최소 간격 (0이면 제한 없음)
+            blocked_hours: 발행하지 않을 시간대 (0~23)
+            daily_cap: 계정별 하루 최대 발행 수 (0이면 제한 없음)
+        """
+        self.blocked_hours = set(blocked_hours)
+        if len(self.blocked_hours) >= 24:
+            raise ValueError("모든 시간대가 발행 제외 시간입니다")
+        self.start = self._round_up(start)
+        self.day_start = self.start.time()
+        self.interval = timedelta(minutes=max(interval_minutes, SLOT_MINUTES))
+        self.category_spacing = timedelta(minutes=category_spacing_minutes)
+        self.daily_cap = daily_cap
+        self.ledgers: Dict[str, _AccountLedger] = defaultdict(_AccountLedger)
+
+    def reserve(self, account: str, when, category: str = None):
+        """이미 예약/발행된 글을 장부에 기록"""
+        when = parse_schedule(when)
+        if when:
+            self.ledgers[account].add(when, category or None)
+
+    def plan(self, posts: List[Dict], default_account: str = "default") -> Dict[int, datetime]:
+        """
+        포스트 목록의 발행 시간 계산 (계정 안에서는 목록 순서대로 배정)
+
+        Args:
+            posts: 'id', 'category', 선택적으로 'account'를 가진 포스트 목록
+            default_account: account가 없는 포스트의 계정
+
+        Returns:
+            {포스트 id: 발행 시간}
+        """
+        by_account: Dict[str, List[Dict]] = defaultdict(list)
+        for post in posts:
+            by_account[post.get("account") or default_account].append(post)
+
+        timetable = {}
+        for account, account_posts in by_account.items():
+            ledger = self.ledgers[account]
+            cursor = self.start
+            last_by_category: Dict[str, datetime] = {}
+            for post in account_posts:
+                category = post.get("category") or None
+                earliest = cursor
+                if category in last_by_category:
+                    earliest = max(earliest, last_by_category[category] + self.category_spacing)
+                when = self._next_slot(ledger, earliest, category)
+                ledger.add(when, category)
+                timetable[post["id"]] = when
+                cursor = when + self.interval
+                if category:
+                    last_by_category[category] = when
+        return timetable
+
+    def _next_slot(self, ledger: _AccountLedger, when: datetime, category: Optional[str]) -> datetime:
+        """when 이후 모든 제약을 만족하는 가장 이른 슬롯"""
+        when = self._round_up(when)
+        while True:
+            if when.hour in self.blocked_hours:
+                when = when.replace(minute=0) + timedelta(hours=1)
+                continue
+            if self.daily_cap and ledger.day_counts[when.date()] >= self.daily_cap:
+                # 자정이 아니라 다음 날 발행 시작 시각부터
+                when = datetime.combine(when.date() + timedelta(days=1), self.day_start)
+                continue
+            taken = ledger.conflict(ledger.times, when, self.interval)
+            if taken:
+                when = self._round_up(taken + self.interval)
+                continue
+            if category:
+                taken = ledger.conflict(ledger.by_category.get(category, []), when, self.category_spacing)
+                if taken:
+                    when = self._round_up(taken + self.category_spacing)
+                    continue
+            return when
+
+    @staticmethod
+    def _round_up(when: datetime) -> datetime:
+        """SLOT_MINUTES 단위로 올림"""
+        when = when.replace(second=0, microsecond=0)
+        extra = when.minute % SLOT_MINUTES
+        return when + timedelta(minutes=SLOT_MINUTES - extra) if extra else when
+
+
+def plan_schedule(pending: List[Dict], scheduled: Iterable[Tuple[str, object, str]], start: datetime,
+                  **options) -> Dict[int, datetime]:
+    """
+    SchedulePlanner 간편 실행
+
+    Args:
+        pending: 시간을 배정할 포스트 목록
+        scheduled: 장부 (계정, 발행 시간, 카테고리) 목록
+        start: 가장 이른 발행 시간
+        options: SchedulePlanner 옵션 (interval_minutes, category_spacing_minutes, blocked_hours, daily_cap)
+    """
+    planner = SchedulePlanner(start, **options)
+    for account, when, category in scheduled:
+        planner.reserve(account, when, category)
+    return planner.plan(pending)
+
+
+def check_overflow_window() -> bool:
+    """하루 최대 발행 수를 넘긴 글이 다음 날 발행 시작 시각 이후에 배정되는지 확인"""
+    ok = True
+    for blocked in ([], blackout_hours(0, 7)):
+        planner = SchedulePlanner(datetime(2026, 1, 5, 9, 0), interval_minutes=30, blocked_hours=blocked, daily_cap=4)
+        slots = sorted(planner.plan([{"id": i, "category": None} for i in range(10)]).values())
+        early = [slot for slot in slots if slot.time() < planner.day_start]
+        if early:
+            ok = False
+            print(f"  ✗ 제외 시간 {blocked or '없음'}: 발행 시작 시각 전 배정 {[s.strftime('%m-%d %H:%M') for s in early]}")
+        else:
+            print(f"  ✓ 제외 시간 {blocked or '없음'}: {slots[0]:%m-%d %H:%M} ~ {slots[-1]:%m-%d %H:%M}")
+    return ok
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(0 if check_overflow_window() else 1)
@@ -0,0 +1,380 @@
+"""
+단계 실행 워커 프로세스
+
+GUI가 단계(엑셀 생성, 본문 생성, 워드 생성, 업로드, 주제 추천)마다 새 파이썬을 띄우면
+selenium/google-generativeai/openpyxl/python-docx import와 모델·브라우저 초기화를 매번 반복합니다.
+워커는 한 번 띄운 뒤 단계 모듈을 import한 상태로 유지하고 각 단계를 작업으로 실행하므로,
+두 번째 작업부터는 모델 클라이언트와 로그인된 브라우저를 그대로 재사용합니다.
+단계 모듈은 import할 때 .env 값(계정, API 키, 헤드리스 여부)을 읽으므로, 작업 사이에 .env가
+바뀌면 브라우저를 닫고 프로젝트 모듈을 새로 import합니다.
+
+프로토콜 (stdin/stdout, 한 줄에 JSON 하나):
+    요청: {"id": 1, "stage": "create.py"}  /  {"cmd": "shutdown"}
+    응답: {"id": 1, "type": "log", "line": "..."}  (작업 출력, 줄 단위)
+          {"id": 1, "type": "event", ...}     (emit_event로 보낸 진행 상황)
+          {"id": 1, "type": "done", "ok": true, "seconds": 0.42}
+    네이티브 출력(chromedriver, C 확장)은 stderr 파이프로 따로 받아 로그 줄로 전달합니다.
+
+사용법:
+    python stage_worker.py --serve             # 워커 실행 (보통 StageWorker가 띄움)
+    python stage_worker.py create.py           # 단계 하나를 워커로 실행
+"""
+
+import os
+import sys
+import json
+import time
+import importlib
+import threading
+import traceback
+import subprocess
+from typing import Callable, Dict, Optional
+
+try:
+    from dotenv import dotenv_values
+    HAS_DOTENV = True
+except ImportError:
+    HAS_DOTENV = False
+
+# 단계 스크립트 → (모듈, 진입 함수)
+STAGES = {
+    "trend_analyzer.py": ("trend_analyzer", "main"),
+    "excel_create.py": ("excel_create", "main"),
+    "create.py": ("create", "main"),
+    "create_word.py": ("create_word", "main"),
+    "upload_bot.py": ("upload_bot", "main"),
+    "row_pipeline.py": ("row_pipeline", "main"),
+}
+
+# 워커 시작 시 미리 import할 무거운 라이브러리 (설치되지 않은 것은 건너뜀)
+PRELOAD_MODULES = ["openpyxl", "docx", "selenium.webdriver", "google.generativeai"]
+
+WORKER_SCRIPT = os.path.abspath(__file__)
+PROJECT_DIR = os.path.dirname(WORKER_SCRIPT)
+
+# 바뀌면 단계 모듈을 다시 import할 설정 파일
+CONFIG_FILE = os.path.join(PROJECT_DIR, ".env")
+
+# 실행 중인 워커 (워커 프로세스 안에서만 설정됨)
+_server = None
+
+
+def emit_event(**event):
+    """
+    작업 진행 상황 전달 (GUI의 on_event로 전달됨)
+
+    워커 밖에서 단계를 직접 실행 중이면 로그 한 줄로 출력합니다.
+    """
+    if _server is not None:
+        _server.send({"id": _server.output.job_id, "type": "event", **event})
+    else:
+        print(" ".join(f"{key}={value}" for key, value in event.items()))
+
+
+# ==================== 워커 (서버) ====================
+
+class _JobOutput:
+    """print 출력을 현재 작업의 log 메시지로 전달하는 스트림"""
+
+    def __init__(self, send: Callable[[Dict], None]):
+        self.send = send
+        self.job_id = None
+        self.buffer = ""
+        self.lock = threading.Lock()
+
+    def write(self, text: str) -> int:
+        with self.lock:
+            self.buffer += text
+            *lines, self.buffer = self.buffer.split("\n")
+        for line in lines:
+            self.send({"id": self.job_id, "type": "log", "line": line.rstrip("\r")})
+        return len(text)
+
+    def flush(self):
+        with self.lock:
+            line, self.buffer = self.buffer, ""
+        if line:
+            self.send({"id": self.job_id, "type": "log", "line": line})
+
+    def isatty(self) -> bool:
+        return False
+
+
+class StageServer:
+    """stdin으로 받은 작업을 순서대로 실행하는 워커"""
+
+    def __init__(self):
+        self.protocol_out = sys.stdout
+        self.send_lock = threading.Lock()
+        self.output = _JobOutput(self.send)
+        self.modules = {}
+        # 워커 시작 시 환경 변수 (.env보다 우선, load_dotenv 기본 동작과 같음)
+        self.base_env = dict(os.environ)
+        self.config_stamp = self._config_stamp()
+        # .env에서 들어온 환경 변수 (단계 모듈의 load_dotenv가 넣을 값)
+        self.config_keys = set(self._read_config()) if self.config_stamp else set()
+
+    def send(self, message: Dict):
+        with self.send_lock:
+            self.protocol_out.write(json.dumps(message, ensure_ascii=False) + "\n")
+            self.protocol_out.flush()
+
+    def preload(self):
+        for name in PRELOAD_MODULES:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                pass
+
+    @staticmethod
+    def _config_stamp():
+        try:
+            stat = os.stat(CONFIG_FILE)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def _read_config(self) -> Dict[str, str]:
+        """워커 시작 시 환경 변수에 없던 .env 값"""
+        if not HAS_DOTENV:
+            return {}
+        return {key: value for key, value in dotenv_values(CONFIG_FILE).items()
+                if value is not None and key not in self.base_env}
+
+    def refresh_config(self):
+        """
+        .env가 바뀌었으면 환경 변수를 다시 읽고 단계 모듈을 버림 (다음 load_stage에서 새로 import)
+
+        단계 모듈이 import한 login/gemini 등도 import 시점 값을 들고 있으므로
+        stage_worker를 제외한 프로젝트 폴더의 모듈을 모두 sys.modules에서 지웁니다.
+        """
+        stamp = self._config_stamp()
+        if stamp == self.config_stamp:
+            return
+        self.config_stamp = stamp
+        print("🔄 .env 변경 감지: 설정을 다시 읽고 단계 모듈을 새로 불러옵니다")
+
+        values = self._read_config() if stamp else {}
+        for key in self.config_keys - set(values):
+            os.environ.pop(key, None)
+        os.environ.update(values)
+        self.config_keys = set(values)
+
+        self.shutdown()
+        self.modules.clear()
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, "__file__", None)
+            if name in ("__main__", "stage_worker") or not path:
+                continue
+            if os.path.dirname(os.path.abspath(path)) == PROJECT_DIR:
+                del sys.modules[name]
+
+    def load_stage(self, stage: str):
+        """단계 모듈 import (.env가 바뀌기 전까지 유지)"""
+        module_name, _ = STAGES[stage]
+        if module_name not in self.modules:
+            self.modules[module_name] = importlib.import_module(module_name)
+        return self.modules[module_name]
+
+    def run_job(self, job_id, stage: str) -> bool:
+        self.output.job_id = job_id
+        try:
+            if stage not in STAGES:
+                print(f"알 수 없는 단계: {stage}")
+                return False
+            self.refresh_config()
+            module = self.load_stage(stage)
+            getattr(module, STAGES[stage][1])()
+            return True
+        except SystemExit as e:
+            return e.code in (None, 0)
+        except Exception:
+            traceback.print_exc()
+            return False
+        finally:
+            self.output.flush()
+
+    def serve(self):
+        global _server
+        _server = self
+        # 네이티브 출력(chromedriver, C 확장)이 fd 1에 직접 써도 프로토콜 줄이 깨지지 않도록
+        # 프로토콜은 복제한 fd로 보내고 fd 1은 stderr 파이프로 돌림
+        sys.stdout.flush()
+        self.protocol_out = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+        os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+        # 작업 출력(스레드에서 찍는 로그 포함)이 프로토콜 스트림에 섞이지 않도록 교체
+        sys.stdout = sys.stderr = self.output
+        self.preload()
+        self.send({"id": None, "type": "ready", "pid": os.getpid()})
+
+        for raw in sys.stdin:
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                request = json.loads(raw)
+            except ValueError:
+                continue
+            if request.get("cmd") == "shutdown":
+                break
+
+            start = time.time()
+            ok = self.run_job(request.get("id"), request.get("stage", ""))
+            self.output.job_id = None
+            self.send({"id": request.get("id"), "type": "done", "ok": ok,
+                       "seconds": round(time.time() - start, 3)})
+
+        self.shutdown()
+
+    def shutdown(self):
+        """단계 모듈의 정리 함수 호출 (브라우저 종료 등)"""
+        for module in self.modules.values():
+            cleanup = getattr(module, "shutdown", None)
+            if callable(cleanup):
+                try:
+                    cleanup()
+                except Exception:
+                    pass
+
+
+# ==================== 클라이언트 ====================
+
+class WorkerUnavailable(RuntimeError):
+    """워커 프로세스를 시작할 수 없음"""
+
+
+class StageWorker:
+    """GUI 쪽에서 워커 프로세스를 띄우고 단계를 작업으로 보내는 클라이언트"""
+
+    def __init__(self, python: str = None, cwd: str = None):
+        """
+        Args:
+            python: 워커를 실행할 파이썬 (None이면 현재 인터프리터)
+            cwd: 워커 작업 디렉토리 (단계 스크립트가 blog*.xlsx를 찾는 위치)
+        """
+        self.python = python or sys.executable
+        self.cwd = cwd or PROJECT_DIR
+        self.process: Optional[subprocess.Popen] = None
+        self.lock = threading.Lock()
+        self.next_id = 0
+        # 워커 stderr 줄을 받을 콜백 (작업 중에는 그 작업의 on_line)
+        self.stderr_handler: Optional[Callable[[str], None]] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        """워커가 없으면 실행 (미리 띄워 두면 첫 작업도 바로 시작)"""
+        with self.lock:
+            self._ensure_started()
+
+    def _ensure_started(self):
+        if self.alive:
+            return
+        env = dict(os.environ, PYTHONIOENCODING="utf-8", PYTHONUNBUFFERED="1")
+        try:
+            self.process = subprocess.Popen(
+                [self.python, WORKER_SCRIPT, "--serve"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                text=True, encoding="utf-8", errors="replace", bufsize=1, cwd=self.cwd, env=env
+            )
+        except OSError as e:
+            self.process = None
+            raise WorkerUnavailable(f"워커 실행 실패: {e}")
+        threading.Thread(target=self._forward_stderr, args=(self.process.stderr,), daemon=True).start()
+
+    def _forward_stderr(self, stream):
+        """워커 밖(C 확장, chromedriver 등)에서 직접 찍은 출력을 로그 줄로 전달"""
+        for raw in stream:
+            line = raw.rstrip("\n")
+            if not line.strip():
+                continue
+            handler = self.stderr_handler
+            if handler:
+                handler(line)
+            else:
+                sys.stderr.write(raw)
+
+    def run(self, stage: str, on_line: Callable[[str], None] = print,
+            on_event: Callable[[Dict], None] = None) -> bool:
+        """
+        단계 하나를 워커에서 실행
+
+        Args:
+            stage: 단계 스크립트 이름 (STAGES 키)
+            on_line: 작업 출력 한 줄마다 호출
+            on_event: emit_event로 보낸 진행 상황마다 호출
+
+        Returns:
+            성공 여부 (작업 중 워커가 죽으면 False, 다음 작업에서 다시 띄움)
+
+        Raises:
+            WorkerUnavailable: 워커를 시작할 수 없을 때
+        """
+        with self.lock:
+            self._ensure_started()
+            self.next_id += 1
+            job_id = self.next_id
+            try:
+                self.process.stdin.write(json.dumps({"id": job_id, "stage": stage}) + "\n")
+                self.process.stdin.flush()
+            except OSError as e:
+                raise WorkerUnavailable(f"워커에 작업 전달 실패: {e}")
+
+            self.stderr_handler = on_line
+            try:
+                for raw in self.process.stdout:
+                    try:
+                        message = json.loads(raw)
+                    except ValueError:
+                        continue
+                    if message.get("type") == "log":
+                        on_line(message.get("line", ""))
+                    elif message.get("type") == "event":
+                        if on_event:
+                            on_event(message)
+                    elif message.get("type") == "done" and message.get("id") == job_id:
+                        return bool(message.get("ok"))
+            finally:
+                self.stderr_handler = None
+
+            on_line("워커 프로세스가 종료되었습니다")
+            self.process = None
+            return False
+
+    def close(self, timeout: float = 10):
+        """워커 종료 (업로드 브라우저도 함께 종료)"""
+        with self.lock:
+            if not self.alive:
+                return
+            try:
+                self.process.stdin.write(json.dumps({"cmd": "shutdown"}) + "\n")
+                self.process.stdin.flush()
+                self.process.wait(timeout=timeout)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+            self.process = None
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "--serve":
+        # 단계 모듈이 import하는 stage_worker가 이 실행 중인 모듈을 가리키도록
+        sys.modules.setdefault("stage_worker", sys.modules[__name__])
+        StageServer().serve()
+        return
+
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    worker = StageWorker()
+    try:
+        ok = all(worker.run(stage) for stage in sys.argv[1:])
+    finally:
+        worker.close()
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
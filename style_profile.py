@@ -0,0 +1,277 @@
+"""
+블로그 스타일 프로필 누적 집계
+
+포스트를 하나씩 반영하면서 평균(합계/개수), 사용 비율, 폰트/색상/정렬 빈도 상위 k개만 유지합니다.
+원문 전체를 메모리에 들고 있지 않아도 되고, JSON으로 저장했다가 새 포스트만 이어서 반영하거나
+다른 프로세스에서 만든 프로필과 합칠 수 있습니다.
+"""
+
+import os
+import json
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from crawl_cache import parse_post_url
+
+# 평균을 낼 수치 항목
+NUMERIC_FIELDS = ['content_length', 'image_count', 'paragraph_count', 'components']
+
+# 사용 비율을 낼 항목 (해당 특징이 있는 포스트 수)
+FLAG_FIELDS = ['heading', 'bold', 'list', 'images', 'dividers']
+
+# 빈도 상위 k개를 유지할 항목
+SKETCH_FIELDS = ['text_align', 'font_sizes', 'colors', 'font_families']
+
+
+class FrequencySketch:
+    """
+    상위 빈도 항목 요약 (Misra-Gries)
+
+    최대 capacity개 카운터만 유지하며, 빈도가 전체의 1/(capacity+1)보다 큰 항목은 항상 남습니다.
+    같은 방식으로 만든 요약끼리 합칠 수 있습니다.
+    """
+
+    def __init__(self, capacity: int = 64, counts: Optional[Dict[str, int]] = None):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = dict(counts or {})
+
+    def add(self, item: str, count: int = 1):
+        if not item:
+            return
+        if item in self.counts or len(self.counts) < self.capacity:
+            self.counts[item] = self.counts.get(item, 0) + count
+            return
+        # 가득 찼으면 모든 카운터를 줄이고 0 이하는 제거
+        decrement = min(count, min(self.counts.values()))
+        for key in list(self.counts):
+            self.counts[key] -= decrement
+            if self.counts[key] <= 0:
+                del self.counts[key]
+        if count > decrement:
+            self.counts[item] = count - decrement
+
+    def merge(self, other: 'FrequencySketch'):
+        for item, count in other.counts.items():
+            self.counts[item] = self.counts.get(item, 0) + count
+        if len(self.counts) > self.capacity:
+            # capacity+1번째 카운트만큼 전체에서 빼서 크기 복원
+            threshold = sorted(self.counts.values(), reverse=True)[self.capacity]
+            self.counts = {k: v - threshold for k, v in self.counts.items() if v > threshold}
+
+    def top(self, k: int = 5) -> List[str]:
+        return [item for item, _ in sorted(self.counts.items(), key=lambda kv: (-kv[1], kv[0]))[:k]]
+
+
+class StyleProfileAggregator:
+    """포스트 단위로 누적되는 블로그 스타일 프로필"""
+
+    def __init__(self, blog_id: str = None, sketch_size: int = 64, max_samples: int = 3):
+        """
+        Args:
+            blog_id: 블로그 ID
+            sketch_size: 빈도 요약에 유지할 항목 수
+            max_samples: Gemini 분석용으로 보관할 샘플 포스트 수
+        """
+        self.blog_id = blog_id
+        self.sketch_size = sketch_size
+        self.max_samples = max_samples
+        self.post_count = 0
+        self.sums = {field: 0.0 for field in NUMERIC_FIELDS}
+        self.counts = {field: 0 for field in NUMERIC_FIELDS}
+        self.flags = {field: 0 for field in FLAG_FIELDS}
+        self.sketches = {field: FrequencySketch(sketch_size) for field in SKETCH_FIELDS}
+        self.samples: List[Dict] = []
+        self.seen: set = set()
+        self.updated_at = None
+
+    # ==================== 누적 ====================
+
+    def add_post(self, post: Dict) -> bool:
+        """
+        포스트 하나 반영
+
+        NaverBlogCrawler 포스트(content/images/structure)와
+        BlogPostAnalyzer 분석 결과(html_structure/style_features) 형식을 모두 받습니다.
+
+        Returns:
+            반영 여부 (이미 반영한 포스트면 False)
+        """
+        key = self._post_key(post)
+        if key and key in self.seen:
+            return False
+        if key:
+            self.seen.add(key)
+
+        self.post_count += 1
+        structure = post.get('structure') or {}
+        html_structure = post.get('html_structure') or {}
+        features = post.get('style_features') or {}
+        content = post.get('content')
+        if content is None:
+            content = post.get('content_preview')
+
+        if content is not None:
+            self._add_value('content_length', len(content))
+        if 'images' in post:
+            self._add_value('image_count', len(post['images']))
+        elif html_structure:
+            self._add_value('image_count', html_structure.get('image_components', 0))
+        if structure:
+            self._add_value('paragraph_count', structure.get('paragraph_count', 0))
+        if html_structure:
+            self._add_value('components', html_structure.get('total_components', 0))
+
+        self._add_flag('heading', structure.get('has_heading'))
+        self._add_flag('bold', structure.get('has_bold') or features.get('has_bold'))
+        self._add_flag('list', structure.get('has_list'))
+        self._add_flag('images', structure.get('image_count', 0) > 0 or html_structure.get('image_components', 0) > 0)
+        self._add_flag('dividers', html_structure.get('divider_components', 0) > 0)
+
+        if structure:
+            self.sketches['text_align'].add(structure.get('text_align', 'left'))
+        for align in features.get('text_aligns', []):
+            self.sketches['text_align'].add(align)
+        for size in features.get('font_sizes', []):
+            self.sketches['font_sizes'].add(size)
+        for color in features.get('font_colors', []):
+            self.sketches['colors'].add(color)
+        for family in features.get('font_families', []):
+            self.sketches['font_families'].add(family)
+
+        if len(self.samples) < self.max_samples and post.get('title'):
+            self.samples.append({'title': post['title'], 'content': (content or '')[:500]})
+
+        self.updated_at = datetime.now().isoformat()
+        return True
+
+    def add_posts(self, posts: Iterable[Dict]) -> int:
+        """여러 포스트 반영, 새로 반영한 개수 반환"""
+        return sum(1 for post in posts if self.add_post(post))
+
+    def merge(self, other: 'StyleProfileAggregator'):
+        """
+        다른 프로필 합치기
+
+        두 프로필에 같은 포스트가 모두 반영되어 있으면 중복 집계됩니다
+        (반영한 포스트 목록은 합쳐지므로 이후 add_post에서는 중복되지 않음).
+        """
+        self.post_count += other.post_count
+        for field in NUMERIC_FIELDS:
+            self.sums[field] += other.sums.get(field, 0.0)
+            self.counts[field] += other.counts.get(field, 0)
+        for field in FLAG_FIELDS:
+            self.flags[field] += other.flags.get(field, 0)
+        for field in SKETCH_FIELDS:
+            self.sketches[field].merge(other.sketches[field])
+        self.samples = (self.samples + other.samples)[:self.max_samples]
+        self.seen |= other.seen
+        self.updated_at = datetime.now().isoformat()
+
+    def _add_value(self, field: str, value: float):
+        self.sums[field] += value
+        self.counts[field] += 1
+
+    def _add_flag(self, field: str, value):
+        if value:
+            self.flags[field] += 1
+
+    @staticmethod
+    def _post_key(post: Dict) -> Optional[str]:
+        url = post.get('url')
+        if not url:
+            return None
+        return parse_post_url(url)['log_no'] or url
+
+    # ==================== 조회 ====================
+
+    def mean(self, field: str) -> float:
+        count = self.counts.get(field, 0)
+        return self.sums[field] / count if count else 0
+
+    def rate(self, field: str) -> float:
+        """특징을 사용한 포스트 비율 (%)"""
+        return self.flags[field] / self.post_count * 100 if self.post_count else 0
+
+    def top(self, field: str, k: int = 5) -> List[str]:
+        return self.sketches[field].top(k)
+
+    def structure_patterns(self) -> Dict:
+        """BlogStyleAnalyzer 구조 패턴 형식"""
+        if not self.post_count:
+            return {}
+        common_align = self.top('text_align', 1)
+        return {
+            'heading_usage': self.rate('heading'),
+            'bold_usage': self.rate('bold'),
+            'list_usage': self.rate('list'),
+            'avg_paragraph_count': self.mean('paragraph_count'),
+            'avg_image_count': self.mean('image_count'),
+            'common_text_align': common_align[0] if common_align else ''
+        }
+
+    def blog_summary(self) -> Dict:
+        """BlogStyleAnalyzer blog_summary 형식"""
+        return {
+            'total_posts': self.post_count,
+            'avg_content_length': self.mean('content_length'),
+            'avg_image_count': self.mean('image_count'),
+            'structure_patterns': self.structure_patterns()
+        }
+
+    def style_summary(self) -> Dict:
+        """BlogPostAnalyzer style_summary 형식"""
+        common_align = self.top('text_align', 1)
+        return {
+            'avg_components': self.mean('components'),
+            'common_font_sizes': self.top('font_sizes'),
+            'common_colors': self.top('colors'),
+            'common_font_families': self.top('font_families'),
+            'common_alignment': common_align[0] if common_align else '',
+            'uses_bold': self.flags['bold'] > 0,
+            'uses_images': self.flags['images'] > 0,
+            'uses_dividers': self.flags['dividers'] > 0
+        }
+
+    # ==================== 저장 ====================
+
+    def to_dict(self) -> Dict:
+        return {
+            'blog_id': self.blog_id,
+            'sketch_size': self.sketch_size,
+            'max_samples': self.max_samples,
+            'post_count': self.post_count,
+            'sums': self.sums,
+            'counts': self.counts,
+            'flags': self.flags,
+            'sketches': {field: sketch.counts for field, sketch in self.sketches.items()},
+            'samples': self.samples,
+            'seen': sorted(self.seen),
+            'updated_at': self.updated_at
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StyleProfileAggregator':
+        profile = cls(data.get('blog_id'), data.get('sketch_size', 64), data.get('max_samples', 3))
+        profile.post_count = data.get('post_count', 0)
+        profile.sums.update(data.get('sums', {}))
+        profile.counts.update(data.get('counts', {}))
+        profile.flags.update(data.get('flags', {}))
+        for field, counts in data.get('sketches', {}).items():
+            if field in profile.sketches:
+                profile.sketches[field] = FrequencySketch(profile.sketch_size, counts)
+        profile.samples = data.get('samples', [])
+        profile.seen = set(data.get('seen', []))
+        profile.updated_at = data.get('updated_at')
+        return profile
+
+    def save(self, path: str):
+        """JSON 파일로 저장"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path: str, blog_id: str = None) -> 'StyleProfileAggregator':
+        """JSON 파일에서 불러오기 (파일이 없으면 빈 프로필)"""
+        if not os.path.exists(path):
+            return cls(blog_id)
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
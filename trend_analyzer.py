@@ -1,16 +1,25 @@
 """
 트렌드 분석 및 AI 주제 추천 모듈
+
+트렌드/뉴스/블로그 소스는 공유 세션으로 동시에 요청하고,
+결과는 15분간 trend_cache.json에 보관해 반복 실행 시 다시 수집하지 않습니다.
+페이지 파싱은 html_select(selectolax/lxml 우선)를 사용합니다.
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 import google.generativeai as genai
 from openpyxl import Workbook
 from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import os
 import json
 import re
+import threading
+import time
+from html_select import select_texts, select_child_texts
+from naver_blog_http import parse_rss
 
 load_dotenv()
 
@@ -23,167 +32,261 @@ if not GEMINI_API_KEY:
 genai.configure(api_key=GEMINI_API_KEY)
 model = genai.GenerativeModel('gemini-2.5-flash')
 
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+}
+REQUEST_TIMEOUT = 10
+NEWS_CATEGORIES = ['politics', 'economy', 'society', 'life', 'world', 'it']
 
-def get_naver_trending_keywords():
-    """네이버 실시간 급상승 검색어 수집"""
-    print("네이버 트렌드 키워드 수집 중...")
-    
-    keywords = []
-    
-    try:
-        url = "https://www.naver.com/"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        trend_items = soup.select('.ah_roll_area .ah_item, .ah_list .ah_item')
-        for item in trend_items[:20]:
-            keyword = item.select_one('.ah_k')
-            if keyword:
-                keywords.append(keyword.text.strip())
-    except Exception as e:
-        print(f"  네이버 메인 수집 실패: {e}")
-    
-    try:
-        signal_url = "https://www.signal.bz/news"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-        response = requests.get(signal_url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        news_items = soup.select('.rank-text, .news-title, h3 a')
-        for item in news_items[:20]:
-            text = item.text.strip()
-            if text and len(text) > 2:
-                keywords.append(text)
-    except Exception as e:
-        print(f"  Signal.bz 수집 실패: {e}")
-    
-    try:
-        zum_url = "https://zum.com/"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-        response = requests.get(zum_url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        issue_items = soup.select('.issue_keyword a, .keyword_item')
-        for item in issue_items[:20]:
-            text = item.text.strip()
-            if text and len(text) > 2:
-                keywords.append(text)
-    except Exception as e:
-        print(f"  ZUM 수집 실패: {e}")
-    
+# 일괄 추천: 한 번의 Gemini 호출에 묶을 최대 블로그 수 / 프롬프트 글자 수
+BLOGS_PER_CALL = 8
+MAX_PROMPT_CHARS = 24000
+
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "trend_cache.json")
+CACHE_TTL_SECONDS = 15 * 60
+
+# 공유 세션의 연결 수 / 동시에 보내는 최대 요청 수 (네이버에 한꺼번에 몰리지 않도록 연결 수보다 작게)
+POOL_SIZE = 16
+MAX_FETCH_WORKERS = 8
+
+_session = requests.Session()
+_session.headers.update(HEADERS)
+_session.mount('https://', HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE))
+_cache_lock = threading.Lock()
+
+
+# ==================== 공통 ====================
+
+def _get_html(url):
+    """공유 세션으로 페이지 요청"""
+    response = _session.get(url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.text
+
+
+def _load_cache():
+    if not os.path.exists(CACHE_FILE):
+        return {}
     try:
-        google_url = "https://trends.google.co.kr/trending?geo=KR"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-        response = requests.get(google_url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        trend_items = soup.select('.feed-item, .title a')
-        for item in trend_items[:20]:
-            text = item.text.strip()
-            if text and len(text) > 2:
-                keywords.append(text)
-    except Exception as e:
-        print(f"  Google Trends 수집 실패: {e}")
-    
+        with open(CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def cached(key, fetch, ttl=CACHE_TTL_SECONDS):
+    """
+    TTL 캐시를 거쳐 소스 수집
+
+    Args:
+        key: 캐시 키 (소스 이름)
+        fetch: 캐시가 없거나 만료됐을 때 호출할 함수
+        ttl: 유효 시간 (초)
+    """
+    with _cache_lock:
+        entry = _load_cache().get(key)
+    if entry and time.time() - entry['fetched_at'] < ttl:
+        return entry['data']
+
+    data = fetch()
+    if data:  # 실패/빈 결과는 캐시하지 않음
+        with _cache_lock:
+            cache = _load_cache()
+            cache[key] = {'fetched_at': time.time(), 'data': data}
+            with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+    return data
+
+
+def clear_cache():
+    """트렌드 캐시 삭제"""
+    with _cache_lock:
+        if os.path.exists(CACHE_FILE):
+            os.remove(CACHE_FILE)
+
+
+def run_concurrently(tasks):
+    """
+    (이름, 함수) 목록을 동시에 실행해 {이름: 결과} 반환
+
+    실패한 작업은 메시지를 출력하고 빈 리스트로 채웁니다.
+    동시 실행 수는 MAX_FETCH_WORKERS로 제한합니다.
+    """
+    def run(task):
+        name, func = task
+        try:
+            return func()
+        except Exception as e:
+            print(f"  {name} 수집 실패: {e}")
+            return []
+
+    if not tasks:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(len(tasks), MAX_FETCH_WORKERS)) as executor:
+        results = list(executor.map(run, tasks))
+    return {name: result for (name, _), result in zip(tasks, results)}
+
+
+# ==================== 트렌드 소스 ====================
+
+def _fetch_naver_main():
+    return select_child_texts(_get_html("https://www.naver.com/"), '.ah_roll_area .ah_item, .ah_list .ah_item', '.ah_k')
+
+
+def _fetch_signal():
+    return select_texts(_get_html("https://www.signal.bz/news"), '.rank-text, .news-title, h3 a')
+
+
+def _fetch_zum():
+    return select_texts(_get_html("https://zum.com/"), '.issue_keyword a, .keyword_item')
+
+
+def _fetch_google_trends():
+    return select_texts(_get_html("https://trends.google.co.kr/trending?geo=KR"), '.feed-item, .title a')
+
+
+TREND_SOURCES = [
+    ("네이버 메인", "trend:naver", _fetch_naver_main),
+    ("Signal.bz", "trend:signal", _fetch_signal),
+    ("ZUM", "trend:zum", _fetch_zum),
+    ("Google Trends", "trend:google", _fetch_google_trends),
+]
+
+
+def _trend_tasks():
+    return [(name, lambda key=key, fetch=fetch: cached(key, fetch)) for name, key, fetch in TREND_SOURCES]
+
+
+def _merge_keywords(results):
+    keywords = []
+    for name, _, _ in TREND_SOURCES:
+        keywords.extend(results.get(name) or [])
     unique_keywords = list(dict.fromkeys(keywords))
     print(f"  수집된 키워드: {len(unique_keywords)}개")
-    
     return unique_keywords[:30]
 
 
-def get_naver_news_headlines():
-    """네이버 뉴스 헤드라인 수집"""
-    print("네이버 뉴스 헤드라인 수집 중...")
-    
+def get_naver_trending_keywords():
+    """네이버 실시간 급상승 검색어 수집 (소스 동시 요청)"""
+    print("네이버 트렌드 키워드 수집 중...")
+    return _merge_keywords(run_concurrently(_trend_tasks()))
+
+
+# ==================== 뉴스 ====================
+
+def _fetch_news_section(category):
+    html = _get_html(f"https://news.naver.com/section/{category}")
+    return [{"category": category, "title": text}
+            for text in select_texts(html, '.sa_text_title, .cluster_text_headline', limit=5, min_length=11)]
+
+
+def _news_tasks(categories):
+    return [(f"{category} 뉴스", lambda category=category: cached(f"news:{category}", lambda: _fetch_news_section(category)))
+            for category in categories]
+
+
+def _merge_headlines(results, categories):
     headlines = []
-    categories = ['politics', 'economy', 'society', 'life', 'world', 'it']
-    
-    for category in categories[:4]:
-        try:
-            url = f"https://news.naver.com/section/{category}"
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            news_items = soup.select('.sa_text_title, .cluster_text_headline')
-            for item in news_items[:5]:
-                text = item.text.strip()
-                if text and len(text) > 10:
-                    headlines.append({"category": category, "title": text})
-        except Exception as e:
-            print(f"  {category} 뉴스 수집 실패: {e}")
-    
+    for category in categories:
+        headlines.extend(results.get(f"{category} 뉴스") or [])
     print(f"  수집된 헤드라인: {len(headlines)}개")
     return headlines
 
 
-def analyze_user_blog(blog_id):
-    """사용자 블로그 분석"""
-    print(f"블로그 분석 중: {blog_id}")
-    
+def get_naver_news_headlines():
+    """네이버 뉴스 헤드라인 수집 (카테고리 동시 요청)"""
+    print("네이버 뉴스 헤드라인 수집 중...")
+    categories = NEWS_CATEGORIES[:4]
+    return _merge_headlines(run_concurrently(_news_tasks(categories)), categories)
+
+
+# ==================== 사용자 블로그 ====================
+
+def _fetch_blog_post_list(blog_id):
+    html = _get_html(f"https://blog.naver.com/PostList.naver?blogId={blog_id}&categoryNo=0&from=postList")
+    return {
+        "titles": select_texts(html, '.pcol2 .ell, .title a, .se-title-text', min_length=4),
+        "categories": select_texts(html, '.category a, .link_category', limit=10, min_length=1)
+    }
+
+
+def _fetch_blog_rss(blog_id):
+    entries = parse_rss(_get_html(f"https://rss.blog.naver.com/{blog_id}.xml"), blog_id)
+    return [entry['title'] for entry in entries[:20] if entry['title']]
+
+
+def _blog_tasks(blog_id):
+    return [
+        (f"{blog_id} 블로그 분석", lambda: cached(f"blog:{blog_id}:list", lambda: _fetch_blog_post_list(blog_id))),
+        (f"{blog_id} RSS 분석", lambda: cached(f"blog:{blog_id}:rss", lambda: _fetch_blog_rss(blog_id))),
+    ]
+
+
+def _merge_blog_data(blog_id, results):
+    post_list = results.get(f"{blog_id} 블로그 분석") or {}
     blog_data = {
         "blog_id": blog_id,
-        "titles": [],
-        "categories": [],
+        "titles": list(dict.fromkeys(post_list.get("titles", []) + (results.get(f"{blog_id} RSS 분석") or [])))[:20],
+        "categories": list(dict.fromkeys(post_list.get("categories", [])))[:10],
         "keywords": []
     }
     
-    try:
-        url = f"https://blog.naver.com/PostList.naver?blogId={blog_id}&categoryNo=0&from=postList"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        title_items = soup.select('.pcol2 .ell, .title a, .se-title-text')
-        for item in title_items[:20]:
-            text = item.text.strip()
-            if text and len(text) > 3:
-                blog_data["titles"].append(text)
-        
-        cat_items = soup.select('.category a, .link_category')
-        for item in cat_items[:10]:
-            text = item.text.strip()
-            if text:
-                blog_data["categories"].append(text)
-                
-    except Exception as e:
-        print(f"  블로그 분석 실패: {e}")
-    
-    try:
-        rss_url = f"https://rss.blog.naver.com/{blog_id}.xml"
-        response = requests.get(rss_url, timeout=10)
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'xml')
-            items = soup.find_all('item')
-            for item in items[:20]:
-                title = item.find('title')
-                if title:
-                    blog_data["titles"].append(title.text.strip())
-    except Exception as e:
-        print(f"  RSS 분석 실패: {e}")
-    
-    blog_data["titles"] = list(dict.fromkeys(blog_data["titles"]))[:20]
-    blog_data["categories"] = list(dict.fromkeys(blog_data["categories"]))[:10]
-    
     print(f"  분석된 글 제목: {len(blog_data['titles'])}개")
     print(f"  발견된 카테고리: {len(blog_data['categories'])}개")
     
     return blog_data
 
 
+def analyze_user_blog(blog_id):
+    """사용자 블로그 분석 (글 목록/RSS 동시 요청)"""
+    print(f"블로그 분석 중: {blog_id}")
+    return _merge_blog_data(blog_id, run_concurrently(_blog_tasks(blog_id)))
+
+
+def collect_trend_data(blog_id=None):
+    """
+    트렌드/뉴스/블로그 소스를 한 번에 동시 수집
+
+    전체 소요 시간은 가장 느린 소스 하나와 같습니다.
+
+    Returns:
+        (trends, news, blog_data)
+    """
+    print("트렌드/뉴스/블로그 데이터 동시 수집 중...")
+    categories = NEWS_CATEGORIES[:4]
+    tasks = _trend_tasks() + _news_tasks(categories)
+    if blog_id:
+        tasks += _blog_tasks(blog_id)
+
+    results = run_concurrently(tasks)
+
+    trends = _merge_keywords(results)
+    news = _merge_headlines(results, categories)
+    blog_data = _merge_blog_data(blog_id, results) if blog_id else {}
+    return trends, news, blog_data
+
+
+def collect_batch_trend_data(blog_ids):
+    """
+    트렌드/뉴스는 한 번만, 블로그들은 동시에 수집
+
+    Returns:
+        (trends, news, {blog_id: blog_data})
+    """
+    print(f"트렌드/뉴스 + 블로그 {len(blog_ids)}개 동시 수집 중...")
+    categories = NEWS_CATEGORIES[:4]
+    tasks = _trend_tasks() + _news_tasks(categories)
+    for blog_id in blog_ids:
+        tasks += _blog_tasks(blog_id)
+
+    results = run_concurrently(tasks)
+
+    trends = _merge_keywords(results)
+    news = _merge_headlines(results, categories)
+    blogs = {blog_id: _merge_blog_data(blog_id, results) for blog_id in blog_ids}
+    return trends, news, blogs
+
+
 def generate_topic_recommendations(trends, news, blog_data, num_topics=10):
     """AI 기반 주제 추천"""
     print("AI 주제 추천 생성 중...")
@@ -243,6 +346,137 @@ def generate_topic_recommendations(trends, news, blog_data, num_topics=10):
         return []
 
 
+def _blog_context(blog_data):
+    return (f"- 블로그 ID: {blog_data.get('blog_id', 'unknown')}\n"
+            f"- 기존 글 제목들: {', '.join(blog_data.get('titles', [])[:10]) if blog_data.get('titles') else '분석된 글 없음'}\n"
+            f"- 카테고리: {', '.join(blog_data.get('categories', [])) if blog_data.get('categories') else '카테고리 정보 없음'}")
+
+
+def pack_blogs(blogs, blogs_per_call=BLOGS_PER_CALL, max_chars=MAX_PROMPT_CHARS):
+    """
+    블로그 컨텍스트를 Gemini 호출 단위로 묶기
+
+    한 묶음은 최대 blogs_per_call개이며 블로그 컨텍스트 합이 max_chars를 넘지 않습니다.
+    """
+    batches, current, size = [], [], 0
+    for blog_data in blogs:
+        length = len(_blog_context(blog_data))
+        if current and (len(current) >= blogs_per_call or size + length > max_chars):
+            batches.append(current)
+            current, size = [], 0
+        current.append(blog_data)
+        size += length
+    if current:
+        batches.append(current)
+    return batches
+
+
+def generate_batch_recommendations(trends, news, blogs, num_topics=10):
+    """
+    여러 블로그의 주제를 한 번의 Gemini 호출로 추천
+
+    트렌드/뉴스는 프롬프트에 한 번만 넣고 블로그별 컨텍스트를 이어 붙입니다.
+
+    Returns:
+        {blog_id: recommendations} (응답에서 빠진 블로그는 포함되지 않음)
+    """
+    blog_sections = "\n\n".join(
+        f"### 블로그 {i}\n{_blog_context(blog_data)}" for i, blog_data in enumerate(blogs, 1)
+    )
+    blog_ids = [blog_data['blog_id'] for blog_data in blogs]
+    
+    prompt = f"""당신은 네이버 블로그 SEO 전문가입니다.
+
+## 현재 트렌드 키워드
+{', '.join(trends[:20]) if trends else '수집된 키워드 없음'}
+
+## 최신 뉴스 헤드라인
+{json.dumps(news[:15], ensure_ascii=False, indent=2) if news else '수집된 뉴스 없음'}
+
+## 블로그별 분석 결과
+{blog_sections}
+
+## 요청
+위 정보를 바탕으로 각 블로그에 가장 적합한 블로그 글 주제를 블로그마다 {num_topics}개씩 추천해주세요.
+블로그끼리 같은 제목을 추천하지 마세요.
+
+## 추천 기준
+1. 현재 트렌드와 관련성 높은 주제
+2. 각 블로그 스타일/분야에 맞는 주제
+3. 네이버 검색 상위 노출 가능성 높은 주제
+4. 클릭을 유도하는 매력적인 제목
+
+## 출력 형식 (JSON)
+정확히 아래 형식으로만 출력하세요. 블로그 ID({', '.join(blog_ids)})를 키로 사용하고 다른 텍스트 없이 JSON만 출력:
+{{
+  "blogs": {{
+    "블로그ID": [
+      {{
+        "title": "블로그 제목 (35자 이내)",
+        "category": "카테고리",
+        "trend_keyword": "관련 트렌드 키워드",
+        "reason": "추천 이유 (1문장)"
+      }}
+    ]
+  }}
+}}
+"""
+
+    try:
+        response = model.generate_content(prompt)
+        json_match = re.search(r'\{[\s\S]*\}', response.text.strip())
+        if not json_match:
+            print(f"  JSON 파싱 실패: {', '.join(blog_ids)}")
+            return {}
+        result = json.loads(json_match.group()).get("blogs", {})
+        return {blog_id: result[blog_id] for blog_id in blog_ids if result.get(blog_id)}
+    except Exception as e:
+        print(f"  AI 일괄 추천 실패 ({', '.join(blog_ids)}): {e}")
+        return {}
+
+
+def recommend_topics_batch(blog_ids, num_topics=10, blogs_per_call=BLOGS_PER_CALL, output_path=None):
+    """
+    여러 블로그 일괄 주제 추천
+
+    트렌드/뉴스는 한 번만 수집하고, 블로그는 동시에 분석한 뒤
+    여러 블로그를 묶어 Gemini 호출 수를 줄입니다. 묶음 응답에서 빠진 블로그만 개별 호출합니다.
+
+    Returns:
+        저장된 엑셀 경로 (블로그당 시트 하나), 추천이 하나도 없으면 None
+    """
+    print("=" * 50)
+    print(f"트렌드 기반 AI 주제 일괄 추천 ({len(blog_ids)}개 블로그)")
+    print("=" * 50 + "\n")
+    
+    trends, news, blogs = collect_batch_trend_data(blog_ids)
+    
+    batches = pack_blogs([blogs[blog_id] for blog_id in blog_ids], blogs_per_call)
+    print(f"\nAI 주제 추천 생성 중... (Gemini 호출 {len(batches)}회)")
+    
+    batch_tasks = [(f"추천 묶음 {i}", lambda batch=batch: generate_batch_recommendations(trends, news, batch, num_topics))
+                   for i, batch in enumerate(batches, 1)]
+    results = {}
+    for batch_result in run_concurrently(batch_tasks).values():
+        results.update(batch_result or {})
+    
+    # 묶음 응답에서 빠진 블로그는 개별 호출
+    for blog_id in blog_ids:
+        if blog_id not in results:
+            print(f"  {blog_id}: 개별 추천으로 재시도")
+            results[blog_id] = generate_topic_recommendations(trends, news, blogs[blog_id], num_topics)
+    
+    results = {blog_id: results[blog_id] for blog_id in blog_ids if results.get(blog_id)}
+    if not results:
+        print("\n✗ 주제 추천 생성 실패")
+        return None
+    
+    for blog_id, recommendations in results.items():
+        print(f"  {blog_id}: {len(recommendations)}개")
+    
+    return save_batch_recommendations_to_excel(results, output_path)
+
+
 def save_recommendations_to_excel(recommendations, output_path=None):
     """추천 주제를 엑셀 파일로 저장"""
     if output_path is None:
@@ -252,7 +486,16 @@ def save_recommendations_to_excel(recommendations, output_path=None):
     wb = Workbook()
     ws = wb.active
     ws.title = "블로그 주제"
+    _write_recommendation_sheet(ws, recommendations)
     
+    wb.save(output_path)
+    print(f"\n✓ 엑셀 저장 완료: {output_path}")
+    
+    return output_path
+
+
+def _write_recommendation_sheet(ws, recommendations):
+    """추천 주제 시트 작성 (blog*.xlsx 형식)"""
     ws['A1'] = '제목'
     ws['B1'] = '본문'
     ws['C1'] = '카테고리'
@@ -271,9 +514,27 @@ def save_recommendations_to_excel(recommendations, output_path=None):
         ws[f'C{i}'] = rec.get('category', '')
         ws[f'E{i}'] = rec.get('trend_keyword', '')
         ws[f'F{i}'] = rec.get('reason', '')
+
+
+def save_batch_recommendations_to_excel(results, output_path=None):
+    """
+    블로그별 추천 주제를 한 통합 문서에 블로그당 시트 하나로 저장
+
+    파일명은 blog*.xlsx 자동 탐색에 걸리지 않도록 topics+날짜.xlsx를 사용합니다.
+    """
+    if output_path is None:
+        today = datetime.now().strftime("%Y%m%d")
+        output_path = os.path.join(os.path.dirname(__file__), f"topics{today}.xlsx")
+    
+    wb = Workbook()
+    wb.remove(wb.active)
+    for blog_id, recommendations in results.items():
+        # 시트 이름은 31자 제한, 일부 특수문자 불가
+        title = re.sub(r'[\\/*?:\[\]]', '_', blog_id)[:31] or "blog"
+        _write_recommendation_sheet(wb.create_sheet(title), recommendations)
     
     wb.save(output_path)
-    print(f"\n✓ 엑셀 저장 완료: {output_path}")
+    print(f"\n✓ 엑셀 저장 완료: {output_path} (시트 {len(results)}개)")
     
     return output_path
 
@@ -284,16 +545,11 @@ def recommend_topics(num_topics=10):
     print("트렌드 기반 AI 주제 추천 시스템")
     print("=" * 50 + "\n")
     
-    trends = get_naver_trending_keywords()
-    
-    news = get_naver_news_headlines()
-    
-    blog_data = {}
-    if NAVER_ID:
-        blog_data = analyze_user_blog(NAVER_ID)
-    else:
+    if not NAVER_ID:
         print("⚠️ .env에 NAVER_ID가 없어 블로그 분석을 건너뜁니다.")
     
+    trends, news, blog_data = collect_trend_data(NAVER_ID)
+    
     print()
     recommendations = generate_topic_recommendations(trends, news, blog_data, num_topics)
     
@@ -315,7 +571,23 @@ def recommend_topics(num_topics=10):
         return None
 
 
-if __name__ == "__main__":
-    result = recommend_topics(num_topics=10)
+def get_configured_blog_ids():
+    """.env의 NAVER_BLOG_IDS(쉼표 구분), 없으면 NAVER_ID"""
+    blog_ids = [b.strip() for b in os.getenv("NAVER_BLOG_IDS", "").split(",") if b.strip()]
+    if not blog_ids and NAVER_ID:
+        blog_ids = [NAVER_ID]
+    return blog_ids
+
+
+def main():
+    blog_ids = get_configured_blog_ids()
+    if len(blog_ids) > 1:
+        result = recommend_topics_batch(blog_ids, num_topics=10)
+    else:
+        result = recommend_topics(num_topics=10)
     if result:
         print(f"\n완료! 엑셀 파일을 확인하세요: {result}")
+
+
+if __name__ == "__main__":
+    main()
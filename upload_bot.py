@@ -6,27 +6,44 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.action_chains import ActionChains
-from openpyxl import load_workbook
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from dotenv import load_dotenv
 from datetime import datetime
 from docx import Document
-from utils import extract_content_sequence, ensure_english_filenames, sanitize_filename
+from utils import extract_content_sequence, ensure_english_filenames, sanitize_filename, DocxMedia
+from clipboard_backend import get_clipboard_backend, dispatch_image_event, dispatch_text_event
+from job_store import JobStore, DONE, FAILED
+from word_manifest import get_manifest
 import zipfile
 import pyperclip
-import pyautogui
 import platform
 import time
 import os
 import glob
-import re
 import tempfile
 
-pyautogui.FAILSAFE = True
-pyautogui.PAUSE = 0.3
-
 # .env 파일에서 환경 변수 로드
 load_dotenv()
 
+# 헤드리스 모드: 화면 없이 브라우저를 띄우고 OS 클립보드/키보드(pyautogui) 없이 DOM으로만 입력
+# (UPLOAD_HEADLESS=1 이거나 화면이 없는 리눅스 서버/컨테이너이면 사용)
+HEADLESS = os.getenv("UPLOAD_HEADLESS", "").lower() in ("1", "true", "yes") or (
+    platform.system() == 'Linux' and not os.getenv("DISPLAY") and not os.getenv("WAYLAND_DISPLAY")
+)
+
+# 파일 선택 창 조작용 (화면이 있을 때 마지막 대체 수단으로만 사용)
+try:
+    if HEADLESS:
+        raise ImportError("headless")
+    import pyautogui
+    pyautogui.FAILSAFE = True
+    pyautogui.PAUSE = 0.3
+    HAS_PYAUTOGUI = True
+except Exception:
+    # 화면이 없으면 import 자체가 실패할 수 있음
+    pyautogui = None
+    HAS_PYAUTOGUI = False
+
 # 네이버 계정 정보 (.env 파일에서 읽어오기)
 NAVER_ID = os.getenv("NAVER_ID")
 NAVER_PW = os.getenv("NAVER_PW")
@@ -38,32 +55,59 @@ if not NAVER_ID or not NAVER_PW:
 # OS에 따른 붙여넣기 키 설정 (Mac: Command, Windows/Linux: Control)
 PASTE_KEY = Keys.COMMAND if platform.system() == 'Darwin' else Keys.CONTROL
 
+# 에디터에 들어간 이미지 컴포넌트, 이미지 하나가 서버에 올라가 들어올 때까지 기다릴 시간 (초)
+IMAGE_COMPONENT_SELECTOR = ".se-component.se-image"
+IMAGE_UPLOAD_TIMEOUT = 15
+# 다음 방법으로 넘어가기 전, 늦게 끝난 업로드가 들어오는지 한 번 더 확인할 때까지의 대기 시간 (초)
+IMAGE_UPLOAD_GRACE = 3
+
+# 브라우저 세션별로 실패한 이미지 넣기 방법 (같은 세션에서는 다시 시도하지 않음)
+_failed_image_methods = {}
+
 # Chrome 옵션 설정
 chrome_options = Options()
 chrome_options.add_argument('--no-sandbox')
 chrome_options.add_argument('--disable-dev-shm-usage')
+if HEADLESS:
+    chrome_options.add_argument('--headless=new')
+    chrome_options.add_argument('--window-size=1280,1000')
 
 # WebDriver 초기화
 driver = webdriver.Chrome(options=chrome_options)
 
-def find_blog_excel_file():
-    """
-    현재 디렉토리에서 blog+날짜.xlsx 파일을 찾습니다.
-    
-    Returns:
-        str: 파일 경로
-    """
-    current_dir = os.getcwd()
-    # blog로 시작하고 .xlsx로 끝나는 파일 찾기
-    pattern = os.path.join(current_dir, "blog*.xlsx")
-    files = glob.glob(pattern)
-    
-    if not files:
-        raise FileNotFoundError("blog+날짜.xlsx 파일을 찾을 수 없습니다.")
-    
-    # 가장 최근 파일 반환 (여러 개 있을 경우)
-    latest_file = max(files, key=os.path.getmtime)
-    return latest_file
+# 이 브라우저에서 로그인했는지 여부 (워커에서 모듈을 재사용할 때 로그인을 한 번만 하도록)
+logged_in = False
+
+# React가 관리하는 input/select 값을 바꾸고 이벤트를 보내는 스크립트 (arguments: 요소, 값)
+_SET_VALUE_SCRIPT = """
+const [element, value] = arguments;
+const prototype = element instanceof HTMLSelectElement ? HTMLSelectElement.prototype : HTMLInputElement.prototype;
+Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, value);
+element.dispatchEvent(new Event('input', {bubbles: true}));
+element.dispatchEvent(new Event('change', {bubbles: true}));
+return element.value;
+"""
+
+def set_value(element, value):
+    """DOM으로 input/select 값 설정 (키보드 입력 없음)"""
+    return driver.execute_script(_SET_VALUE_SCRIPT, element, value)
+
+def fill_input(element, value):
+    """로그인 입력칸 채우기 (화면이 있으면 클립보드 붙여넣기, 안 되거나 헤드리스면 DOM으로 설정)"""
+    element.click()
+    time.sleep(0.5)
+    if not HEADLESS:
+        try:
+            pyperclip.copy(value)
+            element.send_keys(PASTE_KEY, 'v')
+            time.sleep(1)
+        except pyperclip.PyperclipException:
+            pass
+    if not element.get_attribute('value'):
+        if not HEADLESS:
+            print("  클립보드 방식 실패, JavaScript 방식 시도...")
+        set_value(element, value)
+        time.sleep(0.5)
 
 def naver_login():
     print("네이버 로그인 페이지 접속 중...")
@@ -74,33 +118,11 @@ def naver_login():
     id_input = WebDriverWait(driver, 10).until(
         EC.presence_of_element_located((By.ID, "id"))
     )
-    id_input.click()
-    time.sleep(0.5)
-    pyperclip.copy(NAVER_ID)
-    id_input.send_keys(PASTE_KEY, 'v')
-    time.sleep(1)
-    
-    current_id = id_input.get_attribute('value')
-    if not current_id:
-        print("  클립보드 방식 실패, JavaScript 방식 시도...")
-        driver.execute_script(f"arguments[0].value = '{NAVER_ID}';", id_input)
-        driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", id_input)
-        time.sleep(0.5)
+    fill_input(id_input, NAVER_ID)
     
     print("비밀번호 입력 중...")
     pw_input = driver.find_element(By.ID, "pw")
-    pw_input.click()
-    time.sleep(0.5)
-    pyperclip.copy(NAVER_PW)
-    pw_input.send_keys(PASTE_KEY, 'v')
-    time.sleep(1)
-    
-    current_pw = pw_input.get_attribute('value')
-    if not current_pw:
-        print("  클립보드 방식 실패, JavaScript 방식 시도...")
-        driver.execute_script(f"arguments[0].value = '{NAVER_PW}';", pw_input)
-        driver.execute_script("arguments[0].dispatchEvent(new Event('input', { bubbles: true }));", pw_input)
-        time.sleep(0.5)
+    fill_input(pw_input, NAVER_PW)
     
     print("로그인 버튼 클릭 중...")
     login_button = driver.find_element(By.ID, "log.login")
@@ -109,12 +131,39 @@ def naver_login():
     print("로그인 처리 중... (3초 대기)")
     time.sleep(3)
     
+    global logged_in
     current_url = driver.current_url
     if "nidlogin" not in current_url:
         print("로그인 성공!\n")
+        logged_in = True
     else:
         print("로그인 실패 - 수동 확인 필요\n")
 
+def ensure_login():
+    """브라우저가 살아 있고 로그인 쿠키가 남아 있으면 로그인 생략, 아니면 (브라우저 재시작 후) 로그인"""
+    global driver, logged_in
+    try:
+        has_session = any(c.get('name') == 'NID_AUT' for c in driver.get_cookies())
+    except Exception:
+        print("브라우저가 종료되어 다시 실행합니다...")
+        driver = webdriver.Chrome(options=chrome_options)
+        logged_in = False
+        has_session = False
+    
+    if logged_in and has_session:
+        print("기존 로그인 세션 사용\n")
+        return
+    naver_login()
+
+def shutdown():
+    """브라우저 종료 (워커 종료 시 호출)"""
+    global logged_in
+    logged_in = False
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
 def select_category(category_name):
     """발행 레이어에서 카테고리 선택"""
     if not category_name:
@@ -150,8 +199,6 @@ def set_schedule_time(schedule_time_str):
     
     print(f"  예약 발행 설정 중: {schedule_time_str}")
     try:
-        from selenium.webdriver.support.ui import Select
-        
         parts = schedule_time_str.strip().split()
         if len(parts) != 2:
             print(f"    - 잘못된 형식 (YYYY-MM-DD HH:MM 필요)")
@@ -182,12 +229,12 @@ def set_schedule_time(schedule_time_str):
         except:
             print(f"    - 날짜 선택 실패, 기본 날짜 사용")
         
-        hour_select = Select(driver.find_element(By.CSS_SELECTOR, "select.hour_option__J_heO"))
-        hour_select.select_by_value(hour.zfill(2))
+        hour_select = driver.find_element(By.CSS_SELECTOR, "select.hour_option__J_heO")
+        set_value(hour_select, hour.zfill(2))
         print(f"    - 시간 {hour}시 선택")
         
-        minute_select = Select(driver.find_element(By.CSS_SELECTOR, "select.minute_option__Vb3xB"))
-        minute_select.select_by_value(minute_rounded)
+        minute_select = driver.find_element(By.CSS_SELECTOR, "select.minute_option__Vb3xB")
+        set_value(minute_select, minute_rounded)
         print(f"    - 분 {minute_rounded}분 선택")
         
         time.sleep(0.5)
@@ -197,54 +244,192 @@ def set_schedule_time(schedule_time_str):
 
 
 def copy_image_to_clipboard(image_path):
-    import subprocess
+    """OS 클립보드에 이미지 복사 (macOS/Windows/Wayland/X11 중 현재 환경의 백엔드 사용)"""
+    return get_clipboard_backend().copy_image(image_path)
+
+
+def _image_count():
+    return len(driver.find_elements(By.CSS_SELECTOR, IMAGE_COMPONENT_SELECTOR))
+
+
+def _wait_image_added(before, timeout=IMAGE_UPLOAD_TIMEOUT):
+    """에디터의 이미지 컴포넌트가 before개보다 많아질 때까지 대기 (시간 초과 후 유예 시간 뒤 한 번 더 확인)"""
+    try:
+        WebDriverWait(driver, timeout).until(lambda d: _image_count() > before)
+        return True
+    except TimeoutException:
+        time.sleep(IMAGE_UPLOAD_GRACE)
+        return _image_count() > before
+
+
+def _image_method_failed(method):
+    return method in _failed_image_methods.get(driver.session_id, ())
+
+
+def _mark_image_method_failed(method):
+    print(f"    - {method} not supported in this browser session, skipping it from now on")
+    _failed_image_methods.setdefault(driver.session_id, set()).add(method)
+
+
+def upload_image_in_browser(target, data, name, before):
+    """
+    이미지 바이트를 paste(안 되면 drop) 이벤트로 에디터에 직접 전달 (OS 클립보드/키보드 포커스 불필요)
     
-    if platform.system() == 'Darwin':
-        script = f'''
-        use framework "AppKit"
-        use scripting additions
-        
-        set pb to current application's NSPasteboard's generalPasteboard()
-        pb's clearContents()
-        
-        set img to current application's NSImage's alloc()'s initWithContentsOfFile:"{image_path}"
-        pb's writeObjects:{{img}}
-        
-        return "OK"
-        '''
-        try:
-            result = subprocess.run(['osascript', '-e', script], capture_output=True, text=True)
-            return result.returncode == 0
-        except:
+    에디터가 이벤트를 처리하지 않으면 기다리지 않고 넘어가며, 그 방법은 이 브라우저 세션에서 다시 쓰지 않습니다.
+    처리했지만 이미지가 제때 나타나지 않은 경우(큰 이미지, 네트워크 지연)는 실패로 기록하지 않고,
+    늦게 들어온 이미지가 중복되지 않도록 다음 방법 전에 개수를 다시 확인합니다.
+    """
+    handled_mode = None
+    for mode in ('paste', 'drop'):
+        if handled_mode and _image_count() > before:
+            return handled_mode
+        if _image_method_failed(mode):
+            continue
+        if not dispatch_image_event(driver, target, data, name, mode):
+            _mark_image_method_failed(mode)
+            continue
+        if _wait_image_added(before):
+            return mode
+        print(f"    - {mode} handled but no image appeared in time")
+        handled_mode = mode
+    if handled_mode and _image_count() > before:
+        return handled_mode
+    return None
+
+
+# 가로채기를 켜면 에디터가 만드는 파일 input의 click()이 파일 선택 창 대신 input을 보관 (arguments: 켜기 여부)
+_FILE_INPUT_HOOK_SCRIPT = """
+if (!window.__uploadFileHook) {
+    const click = HTMLInputElement.prototype.click;
+    HTMLInputElement.prototype.click = function () {
+        if (this.type !== 'file' || !window.__uploadFileIntercept) return click.apply(this, arguments);
+        window.__uploadFileInput = this;
+        if (!this.isConnected) {
+            this.style.display = 'none';
+            document.body.appendChild(this);
+        }
+    };
+    window.__uploadFileHook = true;
+}
+window.__uploadFileIntercept = arguments[0];
+window.__uploadFileInput = null;
+"""
+
+
+def _find_marked_node(root, attribute):
+    """DOM.getDocument 트리에서 attribute가 붙은 노드 id (iframe/shadow root 포함)"""
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if attribute in node.get('attributes', [])[0::2]:
+            return node['nodeId']
+        stack.extend(node.get('children', []))
+        stack.extend(node.get('shadowRoots', []))
+        if 'contentDocument' in node:
+            stack.append(node['contentDocument'])
+    return None
+
+
+def set_file_input_cdp(file_input, abs_path):
+    """CDP DOM.setFileInputFiles로 파일 지정 (send_keys를 받지 않는 숨은 input용)"""
+    if not hasattr(driver, 'execute_cdp_cmd'):
+        return False
+    marker = 'data-upload-target'
+    driver.execute_script("arguments[0].setAttribute(arguments[1], '1');", file_input, marker)
+    try:
+        root = driver.execute_cdp_cmd('DOM.getDocument', {'depth': -1, 'pierce': True})['root']
+        node_id = _find_marked_node(root, marker)
+        if node_id is None:
             return False
-    elif platform.system() == 'Windows':
-        script = f'''
-        Add-Type -AssemblyName System.Windows.Forms
-        $image = [System.Drawing.Image]::FromFile("{image_path}")
-        [System.Windows.Forms.Clipboard]::SetImage($image)
-        '''
-        try:
-            subprocess.run(['powershell', '-Command', script], check=True, capture_output=True)
-            return True
-        except:
+        driver.execute_cdp_cmd('DOM.setFileInputFiles', {'files': [abs_path], 'nodeId': node_id})
+        return True
+    except WebDriverException:
+        return False
+    finally:
+        driver.execute_script("arguments[0].removeAttribute(arguments[1]);", file_input, marker)
+
+
+def upload_image_file_input(abs_path, before):
+    """에디터 이미지 버튼의 파일 input에 경로 지정 (파일 선택 창/키보드 불필요)"""
+    if _image_method_failed('file input'):
+        return False
+    try:
+        image_btn = WebDriverWait(driver, 5).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "button[data-name='image']"))
+        )
+    except TimeoutException:
+        return False
+    driver.execute_script(_FILE_INPUT_HOOK_SCRIPT, True)
+    try:
+        driver.execute_script("arguments[0].click();", image_btn)
+        time.sleep(1)
+        file_input = driver.execute_script(
+            "return window.__uploadFileInput || document.querySelector(\"input[type='file'][accept*='image']\")"
+            " || document.querySelector(\"input[type='file']\");"
+        )
+    finally:
+        # 이후 파일 선택 창 방식이 정상 동작하도록 가로채기 해제
+        driver.execute_script(_FILE_INPUT_HOOK_SCRIPT, False)
+    if file_input is None:
+        _mark_image_method_failed('file input')
+        return False
+    try:
+        file_input.send_keys(abs_path)
+    except WebDriverException:
+        if not set_file_input_cdp(file_input, abs_path):
+            _mark_image_method_failed('file input')
             return False
-    
-    return False
+    return _wait_image_added(before)
 
 
-def upload_image(image_path):
-    if not image_path or not os.path.exists(image_path):
-        print(f"  - Image not found: {image_path}")
+def upload_image(image, temp_dir=None):
+    """
+    커서 위치에 이미지 업로드
+    
+    브라우저 이벤트 → 파일 input → OS 클립보드 붙여넣기 → 파일 선택 창 순서로 시도합니다.
+    헤드리스 모드에서는 앞의 두 방법만 사용합니다 (OS 클립보드/키보드 불필요).
+    
+    Args:
+        image: 이미지 파일 경로 또는 워드 문서 안의 이미지(DocxMedia)
+        temp_dir: DocxMedia를 파일로 저장할 폴더 (extract_content_sequence에 넘긴 temp_dir)
+    """
+    media = image if isinstance(image, DocxMedia) else None
+    if media is None and (not image or not os.path.exists(image)):
+        print(f"  - Image not found: {image}")
         return False
     
-    abs_path = os.path.abspath(image_path)
-    print(f"  Uploading: {os.path.basename(image_path)}")
+    name = media.name if media else image
+    print(f"  Uploading: {os.path.basename(name)}")
     
     try:
         content_area = driver.find_element(By.CSS_SELECTOR, ".se-component-content")
         driver.execute_script("arguments[0].click();", content_area)
         time.sleep(0.3)
         
+        # 모든 방법은 같은 기준 개수로 확인 (늦게 들어온 이미지를 다음 방법이 또 넣지 않도록)
+        before = _image_count()
+        if media:
+            data = media.data
+        else:
+            with open(image, 'rb') as f:
+                data = f.read()
+        mode = upload_image_in_browser(content_area, data, name, before)
+        if mode:
+            print(f"    - Upload complete (browser {mode})")
+            return True
+        
+        # 아래 방법은 파일 경로가 필요 (워드 이미지는 이때만 임시 파일로 저장)
+        abs_path = os.path.abspath(media.materialize(temp_dir or tempfile.gettempdir()) if media else image)
+        if upload_image_file_input(abs_path, before):
+            print("    - Upload complete (file input)")
+            return True
+        if _image_count() > before:
+            print("    - Upload complete (delayed)")
+            return True
+        
+        if HEADLESS or not HAS_PYAUTOGUI:
+            print("    - Upload failed (no desktop for clipboard/file dialog)")
+            return False
         if copy_image_to_clipboard(abs_path):
             ActionChains(driver).key_down(PASTE_KEY).send_keys('v').key_up(PASTE_KEY).perform()
             time.sleep(3)
@@ -279,14 +464,29 @@ def upload_image(image_path):
             return True
     except Exception as e:
         print(f"    - Upload failed: {e}")
-        try:
-            pyautogui.press('escape')
-        except:
-            pass
+        if HAS_PYAUTOGUI:
+            try:
+                pyautogui.press('escape')
+            except:
+                pass
         time.sleep(0.5)
         return False
 
 
+def paste_text(target, text):
+    """
+    커서 위치(target)에 텍스트 붙여넣기
+    
+    화면이 있으면 OS 클립보드로 붙여넣고, 헤드리스 모드에서는 텍스트를 담은 paste 이벤트를 보내며
+    에디터가 받지 않으면 키 입력으로 넣습니다.
+    """
+    if not HEADLESS:
+        pyperclip.copy(text)
+        ActionChains(driver).key_down(PASTE_KEY).send_keys('v').key_up(PASTE_KEY).perform()
+    elif not dispatch_text_event(driver, target, text):
+        ActionChains(driver).send_keys(text).perform()
+
+
 def write_blog_post(title, content, category=None, schedule_time=None, image_paths=None, content_sequence=None):
     print("Navigate to blog write page...")
     driver.get("https://blog.naver.com/GoBlogWrite.naver")
@@ -319,8 +519,7 @@ def write_blog_post(title, content, category=None, schedule_time=None, image_pat
     title_paragraph.click()
     time.sleep(0.3)
     
-    pyperclip.copy(str(title))
-    ActionChains(driver).key_down(PASTE_KEY).send_keys('v').key_up(PASTE_KEY).perform()
+    paste_text(title_paragraph, str(title))
     time.sleep(0.5)
     
     if content_sequence:
@@ -331,13 +530,13 @@ def write_blog_post(title, content, category=None, schedule_time=None, image_pat
                 text_paragraph = driver.find_element(By.CSS_SELECTOR, ".se-section-text .se-text-paragraph")
                 driver.execute_script("arguments[0].click();", text_paragraph)
                 time.sleep(0.3)
-                pyperclip.copy(item["content"])
-                ActionChains(driver).key_down(PASTE_KEY).send_keys('v').key_up(PASTE_KEY).perform()
+                paste_text(text_paragraph, item["content"])
                 ActionChains(driver).send_keys(Keys.ENTER).perform()
                 time.sleep(0.5)
             elif item["type"] == "image":
-                print(f"  [{i+1}] Image: {os.path.basename(item['path'])}")
-                upload_image(item["path"])
+                image = item.get("media") or item["path"]
+                print(f"  [{i+1}] Image: {os.path.basename(getattr(image, 'name', image))}")
+                upload_image(image, getattr(item, "temp_dir", None))
                 time.sleep(1)
     else:
         print("Input content...")
@@ -352,8 +551,7 @@ def write_blog_post(title, content, category=None, schedule_time=None, image_pat
         time.sleep(0.3)
         
         content_str = str(content) if content else ""
-        pyperclip.copy(content_str)
-        ActionChains(driver).key_down(PASTE_KEY).send_keys('v').key_up(PASTE_KEY).perform()
+        paste_text(text_paragraph, content_str)
         time.sleep(1)
         
         if image_paths:
@@ -421,39 +619,50 @@ def extract_from_word_sequence(docx_path, temp_dir):
     return extract_content_sequence(docx_path, temp_dir)
 
 
-def find_word_file(output_dir, title, row_num=None):
-    if not os.path.exists(output_dir):
-        return None
+def upload_post(row, title, content, category=None, schedule_time=None, image_paths=None, content_sequence=None):
+    print(f"[Row {row}] Start upload")
+    print(f"  Title: {title}")
+    if category:
+        print(f"  Category: {category}")
+    if schedule_time:
+        print(f"  Schedule: {schedule_time}")
+    if content_sequence:
+        img_count = len([i for i in content_sequence if i["type"] == "image"])
+        print(f"  Sequence: {len(content_sequence)} items, {img_count} images")
+    elif image_paths:
+        print(f"  Images: {len(image_paths)}")
     
-    if row_num is not None:
-        new_format = os.path.join(output_dir, f"post_{row_num:03d}.docx")
-        if os.path.exists(new_format):
-            return new_format
+    write_blog_post(title, content, category, schedule_time, image_paths, content_sequence)
     
-    for f in os.listdir(output_dir):
-        if f.endswith('.docx') and not f.startswith('test_'):
-            name = re.sub(r'^\d+_', '', f.replace('.docx', ''))
-            if title in name or name in title:
-                return os.path.join(output_dir, f)
-    return None
+    print(f"[Row {row}] Upload complete\n")
+    print("-" * 50 + "\n")
+
+
+def find_word_file(output_dir, title, row, content=None):
+    """
+    행의 워드 문서 (output/manifest.json 조회)
+    
+    문서를 만든 뒤 본문이 바뀌었으면 None을 반환해 엑셀 본문으로 업로드하게 합니다.
+    """
+    word_file, stale = get_manifest(output_dir).resolve(row, title, content)
+    if stale:
+        print(f"[Row {row}] Word file is older than the current content, using sheet content: {os.path.basename(word_file)}")
+        return None
+    return word_file
 
 
 def main():
+    store = JobStore()
+    # 워드 이미지 임시 파일 폴더 (끝나면 삭제)
+    temp = tempfile.TemporaryDirectory()
     try:
-        excel_file = find_blog_excel_file()
-        print(f"Open excel: {excel_file}")
-        wb = load_workbook(excel_file)
-        ws = wb.active
-        
-        if ws is None:
-            print("No active worksheet found")
-            wb.close()
-            return
+        batch = store.sync_excel()
+        print(f"Open excel: {batch}")
         
         base_dir = os.path.dirname(os.path.abspath(__file__))
         output_dir = os.path.join(base_dir, "output")
         images_dir = os.path.join(base_dir, "images")
-        temp_dir = tempfile.mkdtemp()
+        temp_dir = temp.name
         
         ensure_english_filenames(output_dir)
         ensure_english_filenames(images_dir)
@@ -463,18 +672,17 @@ def main():
             docx_files = [f for f in os.listdir(output_dir) if f.endswith('.docx')]
             print(f"Word files: {len(docx_files)}")
         
-        max_row = ws.max_row or 1
         blog_posts = []
         
-        for row in range(2, max_row + 1):
-            title = ws[f'A{row}'].value
-            category = ws[f'C{row}'].value
-            schedule_time = ws[f'D{row}'].value
+        for post in store.get_posts(batch):
+            row = post['row']
+            title = post['title']
             
-            if not title:
+            if post['status'].get('upload') == DONE:
+                print(f"[Row {row}] Already uploaded, skip")
                 continue
             
-            word_file = find_word_file(output_dir, str(title), row - 1)
+            word_file = find_word_file(output_dir, title, row, post['content'])
             content_sequence = None
             content = None
             image_paths = []
@@ -485,51 +693,32 @@ def main():
                 text_items = [item["content"] for item in content_sequence if item["type"] == "text"]
                 content = '\n'.join(text_items)
             else:
-                content = ws[f'B{row}'].value
-                image_paths_str = ws[f'E{row}'].value
-                if image_paths_str:
-                    for p in str(image_paths_str).split(','):
-                        p = p.strip()
-                        if os.path.exists(p):
-                            image_paths.append(p)
+                content = post['content']
+                if post['image_paths']:
+                    image_paths = [p for p in post['image_paths'] if os.path.exists(p)]
                 else:
                     pattern = os.path.join(images_dir, f"section_{row-1}_*.png")
                     found = glob.glob(pattern)
                     if found:
                         image_paths = sorted(found)
             
-            if title and (content or content_sequence):
-                blog_posts.append((row, title, content, category, schedule_time, image_paths, content_sequence))
+            if content or content_sequence:
+                blog_posts.append((post['id'], row, title, content, post['category'], post['schedule_time'], image_paths, content_sequence))
         
         if not blog_posts:
             print("No blog posts to process.")
-            wb.close()
             return
         
         print(f"Total {len(blog_posts)} posts to upload.\n")
         
-        naver_login()
+        ensure_login()
         
-        for row, title, content, category, schedule_time, image_paths, content_sequence in blog_posts:
+        for post_id, row, title, content, category, schedule_time, image_paths, content_sequence in blog_posts:
             try:
-                print(f"[Row {row}] Start upload")
-                print(f"  Title: {title}")
-                if category:
-                    print(f"  Category: {category}")
-                if schedule_time:
-                    print(f"  Schedule: {schedule_time}")
-                if content_sequence:
-                    img_count = len([i for i in content_sequence if i["type"] == "image"])
-                    print(f"  Sequence: {len(content_sequence)} items, {img_count} images")
-                elif image_paths:
-                    print(f"  Images: {len(image_paths)}")
-                
-                write_blog_post(title, content, category, schedule_time, image_paths, content_sequence)
-                
-                print(f"[Row {row}] Upload complete\n")
-                print("-" * 50 + "\n")
-                
+                upload_post(row, title, content, category, schedule_time, image_paths, content_sequence)
+                store.set_stage(post_id, 'upload', DONE)
             except Exception as e:
+                store.set_stage(post_id, 'upload', FAILED, str(e))
                 print(f"[Row {row}] Error: {e}")
                 import traceback
                 traceback.print_exc()
@@ -540,7 +729,6 @@ def main():
                     pass
                 continue
         
-        wb.close()
         print("All posts uploaded!")
         
     except Exception as e:
@@ -548,9 +736,10 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
+        store.close()
+        temp.cleanup()
         # 브라우저 닫기 (필요시 주석 처리)
         # driver.quit()
-        pass
 
 if __name__ == "__main__":
     main()
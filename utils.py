@@ -1,9 +1,8 @@
 import os
 import re
+import hashlib
 import zipfile
 import xml.etree.ElementTree as ET
-from docx import Document
-from docx.oxml.ns import qn
 
 
 def sanitize_filename(filename, max_length=50):
@@ -21,84 +20,152 @@ def sanitize_path(path):
     return os.path.join(dirname, sanitize_filename(filename))
 
 
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+A_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+R_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+V_NS = 'urn:schemas-microsoft-com:vml'
+PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+
+def _w(tag):
+    return f'{{{W_NS}}}{tag}'
+
+
+class DocxMedia:
+    """
+    docx 안의 이미지 하나 (필요할 때만 읽음)
+    
+    data: 이미지 바이트 (클립보드 업로드 등에 바로 사용, 만들 때 주지 않았으면 처음 접근할 때 읽음)
+    materialize(temp_dir): 내용 해시 이름으로 파일 저장 후 경로 반환
+        (같은 temp_dir을 여러 포스트가 써도 서로 덮어쓰지 않음)
+    """
+    
+    def __init__(self, docx_path, name, data=None):
+        self.docx_path = docx_path
+        self.name = name
+        self.ext = os.path.splitext(name)[1]
+        self._data = data
+    
+    @property
+    def data(self):
+        if self._data is None:
+            with zipfile.ZipFile(self.docx_path, 'r') as z:
+                self._data = z.read(self.name)
+        return self._data
+    
+    @property
+    def digest(self):
+        return hashlib.sha1(self.data).hexdigest()[:16]
+    
+    def materialize(self, temp_dir):
+        os.makedirs(temp_dir, exist_ok=True)
+        path = os.path.join(temp_dir, f"img_{self.digest}{self.ext}")
+        if not os.path.exists(path):
+            with open(path, 'wb') as f:
+                f.write(self.data)
+        return path
+
+
+class ImageItem(dict):
+    """{"type": "image", "media": DocxMedia} - item["path"]에 처음 접근할 때 파일로 저장"""
+    
+    def __init__(self, media, temp_dir):
+        super().__init__(type="image", media=media)
+        self.temp_dir = temp_dir
+    
+    def __missing__(self, key):
+        if key != "path":
+            raise KeyError(key)
+        self["path"] = self["media"].materialize(self.temp_dir)
+        return self["path"]
+
+
+def _paragraph_text(para):
+    parts = []
+    for node in para.iter():
+        if node.tag == _w('t') and node.text:
+            parts.append(node.text)
+        elif node.tag == _w('tab'):
+            parts.append('\t')
+        elif node.tag in (_w('br'), _w('cr')):
+            parts.append('\n')
+    return ''.join(parts)
+
+
+def _paragraph_image_rids(para):
+    rids = [blip.get(f'{{{R_NS}}}embed') for blip in para.iter(f'{{{A_NS}}}blip')]
+    rids += [img.get(f'{{{R_NS}}}id') for img in para.iter(f'{{{V_NS}}}imagedata')]
+    return [rid for rid in rids if rid]
+
+
 def extract_content_sequence(docx_path, temp_dir):
-    doc = Document(docx_path)
+    """
+    docx의 텍스트/이미지 순서 추출
+    
+    zip을 한 번만 열어 문서 XML, 관계 정보, 본문에서 쓰는 이미지 바이트를 모두 읽습니다.
+    이미지는 업로드할 때 item["media"].data(바이트) 또는 item["path"](필요할 때만 파일로 저장)로 꺼냅니다.
+    """
     sequence = []
-    image_map = {}
+    media = {}
     rid_to_media = {}
     
-    try:
-        with zipfile.ZipFile(docx_path, 'r') as z:
-            media_files = [n for n in z.namelist() if n.startswith('word/media/')]
-            for i, name in enumerate(media_files):
-                ext = os.path.splitext(name)[1]
-                img_filename = f"img_{i:03d}{ext}"
-                img_path = os.path.join(temp_dir, img_filename)
-                with z.open(name) as src, open(img_path, 'wb') as dst:
-                    dst.write(src.read())
-                image_map[os.path.basename(name)] = img_path
-            
-            if 'word/_rels/document.xml.rels' in z.namelist():
-                with z.open('word/_rels/document.xml.rels') as f:
-                    tree = ET.parse(f)
-                    root = tree.getroot()
-                    ns = {'r': 'http://schemas.openxmlformats.org/package/2006/relationships'}
-                    for rel in root.findall('.//r:Relationship', ns):
-                        rid = rel.get('Id')
-                        target = rel.get('Target')
-                        if target and 'media/' in target:
-                            media_name = os.path.basename(target)
-                            if media_name in image_map:
-                                rid_to_media[rid] = image_map[media_name]
-    except Exception as e:
-        print(f"  Image extraction error: {e}")
-    
-    current_text = []
-    image_index = 0
-    image_list = list(image_map.values())
-    
-    for para in doc.paragraphs:
-        drawings = para._element.findall('.//' + qn('w:drawing'))
-        picts = para._element.findall('.//' + qn('w:pict'))
-        has_image = len(drawings) > 0 or len(picts) > 0
+    with zipfile.ZipFile(docx_path, 'r') as z:
+        names = z.namelist()
+        for name in names:
+            if name.startswith('word/media/'):
+                media[os.path.basename(name)] = DocxMedia(docx_path, name)
         
-        if has_image:
-            if current_text:
-                text_content = '\n'.join(current_text).strip()
-                if text_content:
-                    sequence.append({"type": "text", "content": text_content})
-                current_text = []
-            
-            img_path = None
-            for drawing in drawings:
-                blips = drawing.findall('.//' + qn('a:blip'))
-                for blip in blips:
-                    embed = blip.get(qn('r:embed'))
-                    if embed and embed in rid_to_media:
-                        img_path = rid_to_media[embed]
-                        break
-                if img_path:
-                    break
-            
-            if not img_path and image_index < len(image_list):
-                img_path = image_list[image_index]
-                image_index += 1
+        try:
+            if 'word/_rels/document.xml.rels' in names:
+                root = ET.fromstring(z.read('word/_rels/document.xml.rels'))
+                for rel in root.iter(f'{{{PKG_REL_NS}}}Relationship'):
+                    target = rel.get('Target')
+                    if target and 'media/' in target:
+                        media_name = os.path.basename(target)
+                        if media_name in media:
+                            rid_to_media[rel.get('Id')] = media[media_name]
+        except Exception as e:
+            print(f"  Image extraction error: {e}")
+        
+        body = ET.fromstring(z.read('word/document.xml')).find(_w('body'))
+        
+        current_text = []
+        image_index = 0
+        image_list = list(media.values())
+        
+        for para in (body.findall(_w('p')) if body is not None else []):
+            has_image = para.find('.//' + _w('drawing')) is not None or para.find('.//' + _w('pict')) is not None
             
-            if img_path:
-                sequence.append({"type": "image", "path": img_path})
+            if has_image:
+                if current_text:
+                    text_content = '\n'.join(current_text).strip()
+                    if text_content:
+                        sequence.append({"type": "text", "content": text_content})
+                    current_text = []
+                
+                image = next((rid_to_media[rid] for rid in _paragraph_image_rids(para) if rid in rid_to_media), None)
+                
+                if not image and image_index < len(image_list):
+                    image = image_list[image_index]
+                    image_index += 1
+                
+                if image:
+                    sequence.append(ImageItem(image, temp_dir))
             
-            para_text = para.text.strip()
-            if para_text:
-                current_text.append(para_text)
-        else:
-            para_text = para.text.strip()
+            para_text = _paragraph_text(para).strip()
             if para_text:
                 current_text.append(para_text)
-    
-    if current_text:
-        text_content = '\n'.join(current_text).strip()
-        if text_content:
-            sequence.append({"type": "text", "content": text_content})
+        
+        if current_text:
+            text_content = '\n'.join(current_text).strip()
+            if text_content:
+                sequence.append({"type": "text", "content": text_content})
+        
+        # 본문에 들어간 이미지만 같은 zip에서 바로 읽어 둠 (업로드할 때 다시 열지 않도록)
+        for item in sequence:
+            media_item = item.get("media")
+            if media_item is not None and media_item._data is None:
+                media_item._data = z.read(media_item.name)
     
     return sequence
 
@@ -0,0 +1,137 @@
+"""
+워드 문서 목록 (output/manifest.json)
+
+create_word가 문서를 만들 때마다 행 번호, 제목 해시, 문서 경로, 포함된 이미지, 본문 해시를 기록합니다.
+업로드 시 폴더를 훑거나 제목을 부분 일치로 찾지 않고 행 번호/제목 해시로 바로 찾으며,
+문서를 만든 뒤 본문이 바뀌었으면 (본문 해시 불일치) 오래된 문서로 판단합니다.
+"""
+
+import os
+import json
+import hashlib
+import zipfile
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+MANIFEST_NAME = "manifest.json"
+
+_manifests: Dict[str, 'WordManifest'] = {}
+_manifests_lock = threading.Lock()
+
+
+def text_hash(text: Optional[str]) -> Optional[str]:
+    """앞뒤 공백을 무시한 텍스트 해시 (None이면 None)"""
+    if text is None:
+        return None
+    return hashlib.sha1(str(text).strip().encode('utf-8')).hexdigest()[:16]
+
+
+def docx_images(docx_path: str) -> List[str]:
+    """문서에 포함된 이미지 목록 (word/media/ 항목 이름)"""
+    try:
+        with zipfile.ZipFile(docx_path, 'r') as z:
+            return [name for name in z.namelist() if name.startswith('word/media/')]
+    except (OSError, zipfile.BadZipFile):
+        return []
+
+
+class WordManifest:
+    """행 번호 → 워드 문서 정보"""
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, MANIFEST_NAME)
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict] = {}
+        self.by_title: Dict[str, str] = {}
+        self.loaded_mtime = None
+        self.load()
+
+    def load(self):
+        entries = {}
+        mtime = self._mtime()
+        if mtime is not None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    entries = json.load(f).get('entries', {})
+            except (OSError, ValueError) as e:
+                print(f"⚠️ 워드 문서 목록을 읽을 수 없습니다 (새로 만듭니다): {e}")
+        with self.lock:
+            self.entries = entries
+            self.loaded_mtime = mtime
+            self._reindex()
+
+    def _mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.path)
+        except OSError:
+            return None
+
+    def refresh(self):
+        """다른 프로세스가 목록을 갱신했으면 다시 읽기"""
+        if self._mtime() != self.loaded_mtime:
+            self.load()
+
+    def _reindex(self):
+        self.by_title = {entry['title_hash']: row for row, entry in self.entries.items()}
+
+    def record(self, row: int, title: str, content: str, docx_path: str) -> Dict:
+        """문서 생성 결과 기록 후 저장 (다른 프로세스가 기록한 항목을 덮어쓰지 않도록 먼저 다시 읽음)"""
+        self.refresh()
+        entry = {
+            'row': row,
+            'title': title,
+            'title_hash': text_hash(title),
+            'docx': os.path.abspath(docx_path),
+            'images': docx_images(docx_path),
+            'content_hash': text_hash(content),
+            'created_at': datetime.now().isoformat()
+        }
+        with self.lock:
+            self.entries[str(row)] = entry
+            self._reindex()
+            self._save()
+        return entry
+
+    def _save(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'entries': self.entries}, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.path)
+        self.loaded_mtime = self._mtime()
+
+    def lookup(self, row: int, title: str) -> Optional[Dict]:
+        """행 번호와 제목이 맞는 문서 (행이 다르면 같은 제목 문서)"""
+        title_key = text_hash(title)
+        self.refresh()
+        with self.lock:
+            entry = self.entries.get(str(row))
+            if entry is None or entry['title_hash'] != title_key:
+                entry = self.entries.get(self.by_title.get(title_key, ''))
+        if entry and os.path.exists(entry['docx']):
+            return entry
+        return None
+
+    def resolve(self, row: int, title: str, content: str = None) -> Tuple[Optional[str], bool]:
+        """
+        업로드할 워드 문서 찾기
+
+        Returns:
+            (문서 경로 또는 None, 오래된 문서 여부 - 문서를 만든 뒤 본문이 바뀜)
+        """
+        entry = self.lookup(row, title)
+        if entry is None:
+            return None, False
+        stale = content is not None and entry.get('content_hash') != text_hash(content)
+        return entry['docx'], stale
+
+
+def get_manifest(output_dir: str) -> WordManifest:
+    """output_dir의 목록 (프로세스 안에서 하나만 유지)"""
+    key = os.path.abspath(output_dir)
+    with _manifests_lock:
+        if key not in _manifests:
+            _manifests[key] = WordManifest(key)
+        return _manifests[key]
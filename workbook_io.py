@@ -0,0 +1,68 @@
+"""
+계획 시트(blog*.xlsx) 읽기/쓰기
+
+읽기는 read_only 모드의 iter_rows(values_only=True)로 행 값만 흘려 읽어
+셀 객체를 만들지 않으므로 수만 행짜리 시트도 빠르게 열립니다.
+쓰기는 일반 모드로 연 통합 문서에서 결과 열의 셀만 바꾸므로 서식(글꼴, 열 너비, 틀 고정,
+조건부 서식, 데이터 유효성 검사)이 그대로 유지되며, 임시 파일에 저장한 뒤 원본과 교체합니다.
+"""
+
+import os
+import tempfile
+from typing import Dict, Iterator, List, Tuple
+from openpyxl import load_workbook
+from openpyxl.utils import column_index_from_string
+
+
+def iter_rows(path: str, columns: List[str], min_row: int = 2) -> Iterator[Tuple[int, Dict]]:
+    """
+    시트 행을 {열 이름: 값} 딕셔너리로 순회 (읽기 전용)
+
+    Args:
+        path: 엑셀 파일 경로
+        columns: A열부터 차례로 붙일 이름
+        min_row: 시작 행 (기본: 헤더 다음 행)
+
+    Yields:
+        (행 번호, 값 딕셔너리)
+    """
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        for row, values in enumerate(ws.iter_rows(min_row=min_row, max_col=len(columns), values_only=True),
+                                     start=min_row):
+            values = list(values) + [None] * (len(columns) - len(values))
+            yield row, dict(zip(columns, values))
+    finally:
+        wb.close()
+
+
+def write_columns(path: str, updates: Dict[int, Dict[str, object]]):
+    """
+    지정한 행/열 값만 바꿔 저장 (나머지 셀과 서식은 그대로)
+
+    Args:
+        path: 엑셀 파일 경로
+        updates: {행 번호: {열 문자('B'): 값}}
+    """
+    if not updates:
+        return
+
+    wb = load_workbook(path)
+    try:
+        ws = wb.active
+        for row, cells in updates.items():
+            for col, value in cells.items():
+                ws.cell(row=row, column=column_index_from_string(col), value=value)
+
+        # 저장 도중 실패해도 원본이 깨지지 않도록 임시 파일에 쓴 뒤 교체
+        fd, temp_path = tempfile.mkstemp(suffix=".xlsx", dir=os.path.dirname(os.path.abspath(path)))
+        os.close(fd)
+        try:
+            wb.save(temp_path)
+            os.replace(temp_path, path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    finally:
+        wb.close()